@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – benchmark suite (python -m benchmarks.run)"""
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – pipeline benchmarks on synthetic workforces
+
+Times every dashboard stage separately at several workforce sizes and writes
+the results as JSON so runs can be compared over time:
+
+    python -m benchmarks.run                                # 1k, 100k, 1m rows
+    python -m benchmarks.run --sizes 1k,100k,1m,10m --repeat 3
+    python -m benchmarks.run --compare benchmarks/results/<earlier>.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import numpy as np
+import pandas as pd
+import sklearn
+
+from staysmart.backends import BACKENDS, DEFAULT_BACKEND
+from staysmart.charts import chart_key, render_bar, render_pie
+from staysmart.impute import impute
+from staysmart.ingest import read_employees
+from staysmart.pipeline import MODEL_PARAMS, FittedPipeline, categorize, fit, label
+from staysmart.schema import FEATURES
+from staysmart.synth import write_synthetic_csv
+
+DEFAULT_SIZES = "1k,100k,1m"
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+STAGES = [
+    "csv_parse", "impute", "label", "fit", "predict_proba",
+    "categorize", "chart_render", "report_export",
+]
+
+
+def parse_size(text):
+    text = text.strip().lower()
+    scale = {"k": 1_000, "m": 1_000_000}.get(text[-1], 1)
+    return int(float(text.rstrip("km")) * scale)
+
+
+def render_charts(risk_category):
+    """The dashboard's two charts, drawn from category counts and rasterised uncached."""
+    key = chart_key(risk_category.value_counts().to_dict())
+    render_bar(key)
+    render_pie(key)
+
+
+def bench_size(n, workdir, repeat=1, seed=0, missing_rate=0.02, backend=DEFAULT_BACKEND):
+    path = os.path.join(workdir, f"employees_{n}.csv")
+    start = time.perf_counter()
+    write_synthetic_csv(path, n, seed=seed, missing_rate=missing_rate)
+    print(f"[{n:>10,} rows] generated in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+    timings = {}
+
+    def timed(stage, fn, setup=lambda: None):
+        # Best of ``repeat`` runs; setup (e.g. copying input that fn mutates) is not timed.
+        best, out = float("inf"), None
+        for _ in range(repeat):
+            arg = setup()
+            t = time.perf_counter()
+            out = fn(arg) if arg is not None else fn()
+            best = min(best, time.perf_counter() - t)
+        timings[stage] = best
+        print(f"[{n:>10,} rows] {stage:<14} {best:9.4f}s", file=sys.stderr)
+        return out
+
+    raw = timed("csv_parse", lambda: read_employees(path))
+    df = timed("impute", impute, setup=raw.copy)
+    y = timed("label", lambda: label(df))
+    X = df[FEATURES].to_numpy(dtype=np.float64)
+    scaler, model, _ = timed("fit", lambda: fit(X, y, MODEL_PARAMS, backend))
+    fitted = FittedPipeline.from_fit(scaler, model, backend=backend)
+    df["left"] = y
+    df["flight_risk"] = (timed("predict_proba", lambda: fitted.predict(X)) * 100).round(0)
+    df["risk_category"] = timed("categorize", lambda: categorize(df["flight_risk"]))
+    timed("chart_render", lambda: render_charts(df["risk_category"]))
+    timed("report_export", lambda: df.to_csv(os.path.join(workdir, "report.csv"), index=False))
+
+    os.remove(path)
+    return [
+        {"rows": n, "backend": backend, "stage": stage, "seconds": round(timings[stage], 6),
+         "rows_per_second": round(n / timings[stage]) if timings[stage] else None}
+        for stage in STAGES
+    ]
+
+
+def environment():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(__file__), check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "sklearn": sklearn.__version__,
+        "matplotlib": matplotlib.__version__,
+    }
+
+
+def compare(current, baseline, threshold):
+    """Print new/old time ratios per stage; returns the stages slower than ``threshold``."""
+    old = {(r["rows"], r.get("backend", DEFAULT_BACKEND), r["stage"]): r["seconds"] for r in baseline["results"]}
+    regressions = []
+    print(f"{'rows':>10}  {'stage':<14} {'old s':>9} {'new s':>9}  ratio")
+    for r in current["results"]:
+        before = old.get((r["rows"], r["backend"], r["stage"]))
+        if not before:
+            continue
+        ratio = r["seconds"] / before
+        flag = "  REGRESSION" if ratio > threshold else ""
+        print(f"{r['rows']:>10,}  {r['stage']:<14} {before:9.4f} {r['seconds']:9.4f}  {ratio:5.2f}{flag}")
+        if flag:
+            regressions.append(r)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"comma-separated row counts, k/m suffixes allowed (default: {DEFAULT_SIZES})")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per stage; the best is kept (default: 1)")
+    parser.add_argument("--missing-rate", type=float, default=0.02, help="fraction of feature cells left blank (default: 0.02)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--backend", choices=list(BACKENDS), default=DEFAULT_BACKEND, help=f"model backend to fit and score (default: {DEFAULT_BACKEND})")
+    parser.add_argument("--out", help="results file (default: benchmarks/results/bench-<timestamp>.json)")
+    parser.add_argument("--compare", help="earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio reported as a regression (default: 1.25)")
+    args = parser.parse_args(argv)
+
+    results = {"environment": environment(), "results": []}
+    with tempfile.TemporaryDirectory(prefix="staysmart-bench-") as workdir:
+        for size in args.sizes.split(","):
+            results["results"] += bench_size(parse_size(size), workdir, args.repeat, args.seed, args.missing_rate, args.backend)
+
+    out = args.out or os.path.join(RESULTS_DIR, f"bench-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"results written to {out}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare) as f:
+            return 1 if compare(results, json.load(f), args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – scoring, caching and data helpers behind the dashboard"""
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – versioned, memory-mapped model artifacts
+
+An artifact is a directory ``<models_dir>/<version>/`` holding:
+
+- ``meta.json``: format, version, schema fingerprint, training parameters
+- one ``.npy`` file per compiled-forest array (forest backend only), loaded with
+  ``mmap_mode="r"`` so every process scoring with the same version shares one
+  copy in the page cache
+- ``sklearn.joblib``: the fitted scaler and model, loaded only when needed
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import joblib
+import numpy as np
+
+from staysmart.forest import CompiledForest
+from staysmart.pipeline import FittedPipeline
+from staysmart.schema import REQUIRED_COLS
+
+ARTIFACT_FORMAT = 1
+SCHEMA_FINGERPRINT = hashlib.sha256(json.dumps(REQUIRED_COLS, sort_keys=True).encode()).hexdigest()[:16]
+
+_ARRAYS = ["mean", "scale", "feature", "threshold", "left", "right", "proba", "roots"]
+
+
+def save_artifact(fitted, models_dir, version=None):
+    """Write ``fitted`` as a new version under ``models_dir``; returns its path."""
+    version = version or time.strftime("%Y%m%d-%H%M%S")
+    path = os.path.join(models_dir, version)
+    if os.path.exists(path):
+        raise FileExistsError(f"model version {version!r} already exists in {models_dir}")
+
+    # Build in a scratch directory and rename, so readers never see half an artifact.
+    os.makedirs(models_dir, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=models_dir, prefix=f"{version}.tmp-")
+    try:
+        if fitted.forest is not None:
+            for name in _ARRAYS:
+                np.save(os.path.join(tmp, f"{name}.npy"), np.ascontiguousarray(getattr(fitted.forest, name)))
+        joblib.dump((fitted.scaler, fitted.model), os.path.join(tmp, "sklearn.joblib"))
+        meta = {
+            **{k: v for k, v in fitted.meta.items() if k != "path"},
+            "format": ARTIFACT_FORMAT,
+            "version": version,
+            "schema": SCHEMA_FINGERPRINT,
+            "features": list(REQUIRED_COLS),
+            "backend": fitted.backend,
+            "compiled": fitted.forest is not None,
+            "depth": None if fitted.forest is None else fitted.forest.depth,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        }
+        with open(os.path.join(tmp, "meta.json"), "w") as f:
+            json.dump(meta, f, indent=2)
+        os.rename(tmp, path)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return path
+
+
+def list_versions(models_dir):
+    """Saved versions under ``models_dir``, oldest first."""
+    if not os.path.isdir(models_dir):
+        return []
+    return sorted(
+        name for name in os.listdir(models_dir)
+        if ".tmp-" not in name and os.path.isfile(os.path.join(models_dir, name, "meta.json"))
+    )
+
+
+def resolve(path):
+    """An artifact directory, or the latest version inside a models directory."""
+    if os.path.isfile(os.path.join(path, "meta.json")):
+        return path
+    versions = list_versions(path)
+    if not versions:
+        raise FileNotFoundError(f"no saved model under {path}")
+    return os.path.join(path, versions[-1])
+
+
+def load_artifact(path, mmap=True):
+    """Load a saved pipeline without retraining.
+
+    The compiled forest (if any) is memory-mapped; the sklearn scaler and
+    model are loaded lazily the first time scoring needs them.
+    """
+    path = resolve(path)
+    with open(os.path.join(path, "meta.json")) as f:
+        meta = json.load(f)
+    if meta.get("format") != ARTIFACT_FORMAT:
+        raise ValueError(f"{path}: unsupported artifact format {meta.get('format')!r}")
+    if meta.get("schema") != SCHEMA_FINGERPRINT:
+        raise ValueError(f"{path}: model was trained on a different feature schema ({meta.get('features')})")
+
+    mode = "r" if mmap else None
+    forest = None
+    if meta.get("compiled", True):  # artifacts predating backends are all forests
+        arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mode) for name in _ARRAYS}
+        forest = CompiledForest(depth=meta["depth"], **arrays)
+
+    def load_sklearn():
+        return joblib.load(os.path.join(path, "sklearn.joblib"), mmap_mode=mode)
+
+    return FittedPipeline(forest, meta={**meta, "path": path}, loader=load_sklearn)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – per-employee key reasons
+
+One vectorised pass over the compiled forest's decision paths splits every
+employee's risk score into a baseline plus one contribution per feature
+(``CompiledForest.contributions``). The contributions are kept as a compact
+float32 matrix next to the scores; reason text is only formatted for the
+rows actually on screen.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from staysmart.diagnostics import stage
+from staysmart.schema import FEATURES
+
+TOP_REASONS = 2
+MIN_POINTS = 1.0  # contributions below this many risk points are not called a reason
+
+REASON_LABELS = {
+    "satisfaction_score": "Satisfaction",
+    "engagement_score": "Engagement",
+    "last_hike_months": "Time since last hike",
+    "overtime_hours": "Overtime",
+    "distance_from_home": "Commute distance",
+}
+
+
+@dataclass
+class Attributions:
+    """Baseline risk and per-feature risk points (rows × FEATURES), in percent."""
+    baseline: float
+    points: np.ndarray
+
+    @property
+    def nbytes(self):
+        return self.points.nbytes
+
+    def drivers(self):
+        """Index into FEATURES of each row's largest risk-raising feature, -1 if none."""
+        top = self.points.argmax(axis=1)
+        return np.where(self.points[np.arange(len(top)), top] >= MIN_POINTS, top, -1)
+
+    def driver_counts(self, rows=None):
+        """How many employees (optionally only ``rows``) have each feature as their top driver."""
+        drivers = self.drivers() if rows is None else self.drivers()[rows]
+        counts = np.bincount(drivers[drivers >= 0], minlength=len(FEATURES))
+        return pd.Series(counts, index=[REASON_LABELS[f] for f in FEATURES], dtype="int64")
+
+    def reasons(self, rows=None, k=TOP_REASONS):
+        """Readable top-``k`` reasons, e.g. ``"Overtime +18, Satisfaction +9"``, per row."""
+        points = self.points if rows is None else self.points[rows]
+        order = np.argsort(-points, axis=1)[:, :k]
+        labels = []
+        for row, cols in zip(points, order):
+            parts = [f"{REASON_LABELS[FEATURES[c]]} +{row[c]:.0f}" for c in cols if row[c] >= MIN_POINTS]
+            labels.append(", ".join(parts) or "No single driver")
+        return labels
+
+
+def attribute(fitted, df):
+    """Key-reason attributions for every row of an imputed, scored frame.
+
+    Returns None for models without a compiled forest (non-forest backends).
+    """
+    if fitted.forest is None:
+        return None
+    with stage("attribute", len(df)):
+        baseline, contrib = fitted.forest.contributions(df[FEATURES].to_numpy(dtype=np.float64))
+        return Attributions(baseline * 100, contrib * np.float32(100))
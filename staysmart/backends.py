@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – pluggable model backends with size-aware selection
+
+Each backend builds an sklearn classifier from the pipeline's parameters and
+carries per-row fit/predict cost estimates. Every real fit and bulk predict
+feeds its measured latency back into those estimates, so ``choose`` adapts
+to the machine it runs on: the forest is kept whenever it fits the latency
+budget, and larger uploads fall back to cheaper models.
+"""
+
+import os
+import threading
+from dataclasses import dataclass
+
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from threadpoolctl import threadpool_limits
+
+AUTO = "auto"
+DEFAULT_BACKEND = "forest"
+# Most to least preferred; the first whose estimate fits the budget wins.
+PREFERENCE = ["forest", "hist_gb", "logistic"]
+FIT_BUDGET_SECONDS = float(os.environ.get("STAYSMART_FIT_BUDGET_S", 10))
+# Cores a forest fit may use; -1 is all of them. Worker processes that fit
+# side by side (staysmart.batch) each take their share via limit_fit_jobs.
+FIT_JOBS = int(os.environ.get("STAYSMART_FIT_JOBS", -1))
+
+SMOOTHING = 0.3   # weight of the newest measurement in the running estimate
+MIN_ROWS = 50_000  # smaller calls are dominated by fixed overhead, not per-row cost
+
+BACKENDS = {}
+_lock = threading.Lock()
+
+
+@dataclass
+class Backend:
+    name: str
+    label: str
+    make: object
+    fit_seconds_per_row: float
+    predict_seconds_per_row: float
+    compiled: bool = False  # a RandomForest that staysmart.forest can flatten
+    fits: int = 0
+    predicts: int = 0
+
+    def estimate(self, rows):
+        """Expected seconds to fit on and then score ``rows`` rows."""
+        return rows * (self.fit_seconds_per_row + self.predict_seconds_per_row)
+
+
+def register(name, label, fit_seconds_per_row, predict_seconds_per_row, compiled=False):
+    """Register a ``make(params) -> estimator`` factory; the costs are single-core priors."""
+    def wrap(fn):
+        BACKENDS[name] = Backend(name, label, fn, fit_seconds_per_row, predict_seconds_per_row, compiled)
+        return fn
+    return wrap
+
+
+@register("forest", "Random forest", 4.5e-5, 3.3e-6, compiled=True)
+def _forest(params):
+    # Trees are fitted in parallel; the result is identical to a serial fit.
+    return RandomForestClassifier(**params, n_jobs=FIT_JOBS)
+
+
+@register("hist_gb", "Histogram gradient boosting", 7e-6, 5e-6)
+def _hist_gb(params):
+    return HistGradientBoostingClassifier(
+        max_iter=params.get("n_estimators", 100),
+        max_depth=params.get("max_depth"),
+        random_state=params.get("random_state"),
+        early_stopping=False,
+    )
+
+
+@register("logistic", "Logistic regression", 3e-6, 5e-8)
+def _logistic(params):
+    return LogisticRegression(max_iter=200)
+
+
+def limit_fit_jobs(jobs):
+    """Fit on at most ``jobs`` cores in this process, whichever backend."""
+    global FIT_JOBS
+    FIT_JOBS = max(1, jobs)
+    threadpool_limits(FIT_JOBS)  # OpenMP and BLAS pools, used by hist_gb and logistic
+
+
+def record(name, kind, rows, seconds):
+    """Fold a measured ``kind`` ("fit" or "predict") latency into ``name``'s estimate."""
+    backend = BACKENDS.get(name)
+    if backend is None or rows < MIN_ROWS:
+        return
+    attr = f"{kind}_seconds_per_row"
+    with _lock:
+        observed = seconds / rows
+        setattr(backend, attr, (1 - SMOOTHING) * getattr(backend, attr) + SMOOTHING * observed)
+        setattr(backend, f"{kind}s", getattr(backend, f"{kind}s") + 1)
+
+
+def choose(rows, budget=FIT_BUDGET_SECONDS):
+    """The most preferred backend expected to fit and score ``rows`` within ``budget`` seconds."""
+    for name in PREFERENCE:
+        if BACKENDS[name].estimate(rows) <= budget:
+            return name
+    return min(BACKENDS, key=lambda name: BACKENDS[name].estimate(rows))
+
+
+def resolve(backend, rows, budget=FIT_BUDGET_SECONDS):
+    """``backend`` itself, or the automatic choice for ``rows`` when it is ``AUTO``."""
+    if backend == AUTO:
+        return choose(rows, budget)
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown model backend {backend!r}; choose from {', '.join([AUTO, *BACKENDS])}")
+    return backend
+
+
+def latency_table():
+    """Current per-backend estimates, in microseconds per row."""
+    return [
+        {"backend": b.name, "fit_us_per_row": round(b.fit_seconds_per_row * 1e6, 2),
+         "predict_us_per_row": round(b.predict_seconds_per_row * 1e6, 3),
+         "fits_measured": b.fits, "predicts_measured": b.predicts}
+        for b in BACKENDS.values()
+    ]
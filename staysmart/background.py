@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – background scoring jobs shared by every dashboard session
+
+Training and scoring run on a small, process-wide worker pool instead of the
+session's script thread. Jobs are keyed like the result cache, so sessions
+uploading the same file share one job, and a job reports which pipeline
+stage it is in (and how many rows it has processed) while it runs, by acting
+as the worker thread's ``staysmart.diagnostics`` recorder.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager, nullcontext
+
+from staysmart.diagnostics import activate
+
+WORKERS = int(os.environ.get("STAYSMART_SCORING_WORKERS", 2))
+
+
+class Job:
+    """One background build: its future plus live progress for the dashboard."""
+
+    def __init__(self, key, recorder=None):
+        self.key = key
+        self.current = "queued"
+        self.rows = {}
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.future = None
+        self.recorder = recorder  # a StageRecorder, if diagnostics are on
+
+    @contextmanager
+    def stage(self, name, rows=None):
+        # Called through diagnostics.stage() in the worker thread.
+        outer, self.current = self.current, name
+        try:
+            with self.recorder.stage(name, rows) if self.recorder else nullcontext():
+                yield
+        finally:
+            if rows:
+                self.rows[name] = self.rows.get(name, 0) + rows
+            self.current = outer
+
+    @property
+    def done(self):
+        return self.future.done()
+
+    @property
+    def error(self):
+        return self.future.exception() if self.done else None
+
+    @property
+    def elapsed(self):
+        return (self.finished or time.time()) - (self.started or self.submitted)
+
+    def wait(self, timeout):
+        """Block up to ``timeout`` seconds; True when the job has finished."""
+        return bool(wait([self.future], timeout).done)
+
+    def result(self):
+        return self.future.result()
+
+
+class JobRunner:
+    """Bounded worker pool with at most one live job per key."""
+
+    def __init__(self, workers=WORKERS):
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="staysmart-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key, fn, recorder=None):
+        """The running job for ``key``, or a new one running ``fn()``."""
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None:
+                job = Job(key, recorder)
+                job.future = self._pool.submit(self._run, job, fn)
+                job.future.add_done_callback(lambda future: self._finished(key, future))
+                self._jobs[key] = job
+            return job
+
+    def get(self, key):
+        with self._lock:
+            return self._jobs.get(key)
+
+    def forget(self, key):
+        """Drop a failed job so the next request for ``key`` retries."""
+        with self._lock:
+            self._jobs.pop(key, None)
+
+    def __len__(self):
+        with self._lock:
+            return sum(not job.done for job in self._jobs.values())
+
+    def _run(self, job, fn):
+        job.started = time.time()
+        activate(job)
+        try:
+            return fn()
+        finally:
+            job.finished = time.time()
+            activate(None)
+
+    def _finished(self, key, future):
+        # Successful results live in the caller's cache; failures stay until
+        # a session has reported them and calls forget().
+        if future.exception() is None:
+            self.forget(key)
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – headless batch scoring
+
+Scores one or many employee files with the dashboard pipeline, one file per
+worker process, and writes a scored report per file plus a run summary:
+
+    python -m staysmart.batch data/*.csv --out reports/ --workers 8
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+
+import pandas as pd
+
+from staysmart.artifacts import load_artifact
+from staysmart.backends import AUTO, BACKENDS, limit_fit_jobs
+from staysmart.history import append_scored
+from staysmart.impute import DEFAULT_STRATEGY, IMPUTERS
+from staysmart.ingest import UPLOAD_TYPES
+from staysmart.pipeline import MODEL_PARAMS, run_pipeline, score_stream
+from staysmart.reports import write_report
+from staysmart.schema import RISK_LABELS
+
+
+def expand_inputs(paths):
+    """Files as given, plus every supported upload inside a given directory."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += sorted(
+                os.path.join(path, name) for name in os.listdir(path)
+                if name.rsplit(".", 1)[-1].lower() in UPLOAD_TYPES
+            )
+        else:
+            files.append(path)
+    return list(dict.fromkeys(files))
+
+
+def report_paths(files, out_dir):
+    """One report per input, named after it and unique within ``out_dir``."""
+    paths, seen = {}, set()
+    for path in files:
+        stem = os.path.basename(path).replace(".", "_")
+        name, n = f"{stem}_scored.csv", 1
+        while name in seen:
+            n += 1
+            name = f"{stem}_{n}_scored.csv"
+        seen.add(name)
+        paths[path] = os.path.join(out_dir, name)
+    return paths
+
+
+@lru_cache(maxsize=None)
+def _saved_model(path):
+    # Once per worker process; the forest arrays are shared through the page cache.
+    return load_artifact(path)
+
+
+def score_file(path, report_path, stream=False, model_path=None, imputer=DEFAULT_STRATEGY,
+               params=MODEL_PARAMS, backend=AUTO, history_dir=None):
+    """Score one file and write its report; returns the summary row.
+
+    With ``model_path`` the file is scored against that saved model instead of
+    training one (with ``backend``) on the file itself. With ``history_dir``
+    the scores are also appended to that history store for trend reporting,
+    as the series named after the file (so each month's file for a business
+    unit should keep the same name).
+    """
+    start = time.perf_counter()
+    fitted = _saved_model(model_path) if model_path else None
+
+    if stream:
+        scored = score_stream(path, report_path, params, fitted=fitted, imputer=imputer, backend=backend)
+    else:
+        scored = run_pipeline(path, params, name=path, fitted=fitted, imputer=imputer, backend=backend)
+        write_report(scored.df, report_path)
+    if history_dir:
+        append_scored(history_dir, scored, series=os.path.splitext(os.path.basename(path))[0])
+
+    summary = scored.summary
+    row = {
+        "file": path,
+        "report": report_path,
+        "model": scored.fitted.backend,
+        "employees": summary.rows,
+        "high_risk": summary.high_risk,
+        "avg_risk": round(summary.avg_risk, 2),
+    }
+    row.update({f"{label.lower()}_risk_count": summary.counts[label] for label in RISK_LABELS})
+    row["seconds"] = round(time.perf_counter() - start, 3)
+    return row
+
+
+def run(files, out_dir, workers=None, stream=False, model_path=None, imputer=DEFAULT_STRATEGY,
+        backend=AUTO, history_dir=None):
+    os.makedirs(out_dir, exist_ok=True)
+    reports = report_paths(files, out_dir)
+    rows, failures = [], []
+    # Workers fit side by side: split the cores between them rather than
+    # letting every worker's fit use all of them.
+    workers = min(workers or os.cpu_count(), len(files)) or 1
+    jobs = max(1, os.cpu_count() // workers)
+    with ProcessPoolExecutor(max_workers=workers, initializer=limit_fit_jobs, initargs=(jobs,)) as pool:
+        futures = {pool.submit(score_file, path, reports[path], stream, model_path, imputer, MODEL_PARAMS, backend, history_dir): path for path in files}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                row = future.result()
+            except Exception as exc:
+                failures.append({"file": path, "error": f"{type(exc).__name__}: {exc}"})
+                print(f"FAILED {path}: {exc}", file=sys.stderr)
+                continue
+            rows.append(row)
+            print(f"scored {path}: {row['employees']} employees, {row['high_risk']} high risk ({row['seconds']}s)")
+
+    rows.sort(key=lambda r: r["file"])
+    pd.DataFrame(rows).to_csv(os.path.join(out_dir, "summary.csv"), index=False)
+    with open(os.path.join(out_dir, "summary.json"), "w") as f:
+        json.dump({"files": rows, "failures": failures}, f, indent=2)
+    return rows, failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m staysmart.batch", description="Score employee files without the dashboard.")
+    parser.add_argument("inputs", nargs="+", help="employee files (CSV, Parquet, Feather) or directories of them")
+    parser.add_argument("-o", "--out", default="reports", help="directory for scored reports and summary (default: reports)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--stream", action="store_true", help="score each file in chunks with bounded memory")
+    parser.add_argument("--model", help="score against a saved model (artifact directory, or models directory for the latest version)")
+    parser.add_argument("--backend", choices=[AUTO, *BACKENDS], default=AUTO, help="model to train per file; auto picks by size (default: auto)")
+    parser.add_argument("--history", help="also append every file's scores to this history store (monthly Parquet, one series per file name) for trends")
+    parser.add_argument("--impute", choices=list(IMPUTERS), default=DEFAULT_STRATEGY, help=f"missing-data strategy (default: {DEFAULT_STRATEGY})")
+    args = parser.parse_args(argv)
+
+    files = expand_inputs(args.inputs)
+    if not files:
+        parser.error("no employee files found")
+    model_path = None
+    if args.model:
+        # Resolve "latest" once so every worker scores with the same version.
+        model_path = load_artifact(args.model).meta["path"]
+    _, failures = run(files, args.out, args.workers, args.stream, model_path, args.impute, args.backend, args.history)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – memory-bounded LRU shared by every dashboard session"""
+
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Least-recently-used cache bounded by the total size of its values.
+
+    ``sizeof`` measures a value once when it is inserted. The newest entry is
+    always kept, even if it alone exceeds the budget, so a large upload is
+    still served to the session that asked for it.
+
+    Entries belong to the ``owner`` (a session id) that last put or got them.
+    With ``session_bytes`` set, an owner holding more than that loses its own
+    least recently used entries first, so one session's large uploads never
+    push out everyone else's. With a ``spill`` store (``dump(key, value)``
+    returning whether it wrote the value, ``load(key)`` returning it or None,
+    ``clear()``), evicted values are written to disk instead of dropped and
+    ``get`` reloads them transparently.
+    """
+
+    def __init__(self, max_bytes, sizeof=lambda value: value.nbytes, session_bytes=None, spill=None):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.session_bytes = session_bytes
+        self.spill = spill
+        self._items = OrderedDict()  # key -> (value, size, owner)
+        self._bytes = 0
+        self._owned = {}
+        self._spilling = {}  # evicted, being written out; still served from memory
+        self._spilled = set()
+        self._lock = threading.Lock()
+        self._building = {}
+        self._loading = {}
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items or key in self._spilling or key in self._spilled
+
+    @property
+    def nbytes(self):
+        return self._bytes
+
+    @property
+    def spilled(self):
+        """Number of entries held on disk only."""
+        return len(self._spilled)
+
+    def owned(self, owner):
+        """Bytes in memory last used by ``owner``."""
+        return self._owned.get(owner, 0)
+
+    # Callers hold self._lock for the next three.
+    def _insert(self, key, value, size, owner):
+        if key in self._items:
+            _, old, held = self._items.pop(key)
+            self._release(held, old)
+        self._items[key] = (value, size, owner)
+        self._bytes += size
+        self._owned[owner] = self._owned.get(owner, 0) + size
+        return self._evict(owner)
+
+    def _release(self, owner, size):
+        self._bytes -= size
+        self._owned[owner] -= size
+        if not self._owned[owner]:
+            del self._owned[owner]
+
+    def _evict(self, owner):
+        victims = []
+
+        def pop(key):
+            value, size, held = self._items.pop(key)
+            self._release(held, size)
+            if self.spill is not None:
+                self._spilling[key] = value
+                victims.append((key, value))
+
+        if self.session_bytes is not None and owner is not None:
+            while self._owned.get(owner, 0) > self.session_bytes:
+                own = [k for k, (_, _, held) in self._items.items() if held == owner]
+                if len(own) <= 1:
+                    break
+                pop(own[0])
+        while self._bytes > self.max_bytes and len(self._items) > 1:
+            pop(next(iter(self._items)))
+        return victims
+
+    def _spill(self, victims):
+        # Outside the lock: writing a large dataset must not stall other sessions.
+        for key, value in victims:
+            try:
+                written = self.spill.dump(key, value)
+            except OSError:
+                written = False  # e.g. disk full: drop it, as without a spill store
+            with self._lock:
+                # Not if it was put back (or discarded) while being written.
+                if self._spilling.pop(key, None) is not None and written:
+                    self._spilled.add(key)
+
+    def get(self, key, default=None, owner=None):
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is not None:
+                value, size, held = entry
+                victims = self._insert(key, value, size, held if owner is None else owner)
+            else:
+                value = self._spilling.get(key)
+                spilled = key in self._spilled
+        if entry is not None:
+            self._spill(victims)
+            return value
+        if value is not None:
+            return self.put(key, value, owner)
+        if spilled:
+            value = self._reload(key, owner)
+        return default if value is None else value
+
+    def _reload(self, key, owner):
+        with self._lock:
+            loading = self._loading.setdefault(key, threading.Lock())
+        with loading:
+            entry = self._items.get(key)
+            if entry is not None:
+                value = entry[0]  # another session reloaded it meanwhile
+            else:
+                value = self.spill.load(key)
+                if value is None:
+                    with self._lock:
+                        self._spilled.discard(key)  # the spill store pruned it
+                else:
+                    self.put(key, value, owner)  # in memory again: no longer counted as spilled
+        with self._lock:
+            self._loading.pop(key, None)
+        return value
+
+    def put(self, key, value, owner=None):
+        size = self.sizeof(value)
+        with self._lock:
+            self._spilled.discard(key)
+            self._spilling.pop(key, None)  # back in memory; its pending write no longer counts
+            victims = self._insert(key, value, size, owner)
+        self._spill(victims)
+        return value
+
+    def get_or_create(self, key, factory, owner=None):
+        """Return the cached value, building it at most once per key.
+
+        Sessions that ask for a key while another session is still building it
+        wait for that build instead of starting their own.
+        """
+        value = self.get(key, owner=owner)
+        if value is not None:
+            return value
+        with self._lock:
+            building = self._building.setdefault(key, threading.Lock())
+        with building:
+            value = self.get(key, owner=owner)
+            if value is None:
+                value = self.put(key, factory(), owner)
+        with self._lock:
+            self._building.pop(key, None)
+        return value
+
+    def discard(self, key):
+        """Forget ``key``; a spilled copy stays on disk until the spill store prunes it."""
+        with self._lock:
+            entry = self._items.pop(key, None)
+            if entry is not None:
+                self._release(entry[2], entry[1])
+            self._spilling.pop(key, None)
+            self._spilled.discard(key)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+            self._owned.clear()
+            self._spilled.clear()
+        if self.spill is not None:
+            self.spill.clear()
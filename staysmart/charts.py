@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – risk charts drawn from category counts
+
+Charts only ever see the handful of numbers in ``RiskSummary.counts``, so a
+rendered chart can be cached on those numbers and shared by every rerun and
+session that lands on the same distribution. Figures are built with the
+object-oriented ``Figure`` API rather than ``pyplot``: nothing is registered
+with pyplot's global figure manager, so a figure is freed as soon as its PNG
+bytes are written instead of piling up across reruns.
+
+``bar_spec``/``pie_spec`` describe the same charts as Vega-Lite for
+``st.vega_lite_chart``, which the browser draws without any server-side
+rasterisation.
+"""
+
+import io
+from functools import lru_cache
+
+from matplotlib.figure import Figure
+
+from staysmart.schema import RISK_LABELS
+
+CHART_CACHE_SIZE = 64
+DPI = 100
+
+
+def chart_key(counts):
+    """Hashable, order-stable cache key for a {category: count} mapping."""
+    return tuple((label, int(counts.get(label, 0))) for label in RISK_LABELS)
+
+
+def render_bar(key):
+    fig = Figure(figsize=(8, 3), dpi=DPI)
+    ax = fig.subplots()
+    ax.bar([label for label, _ in key], [n for _, n in key])
+    ax.set_title("Risk Distribution")
+    ax.set_ylabel("Count")
+    ax.grid(axis="y", alpha=0.25)
+    ax.set_axisbelow(True)
+    return _png(fig)
+
+
+def render_pie(key):
+    # Largest share first, like the original pandas pie; empty slices are dropped.
+    slices = sorted(((n, label) for label, n in key if n), reverse=True)
+    fig = Figure(figsize=(6, 4), dpi=DPI)
+    ax = fig.subplots()
+    if slices:
+        ax.pie([n for n, _ in slices], labels=[label for _, label in slices], autopct="%1.1f%%")
+    ax.set_title("Risk Category Share")
+    return _png(fig)
+
+
+def _png(fig):
+    buf = io.BytesIO()
+    try:
+        fig.savefig(buf, format="png", bbox_inches="tight")
+    finally:
+        fig.clear()
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def _cached(kind, key):
+    return {"bar": render_bar, "pie": render_pie}[kind](key)
+
+
+def risk_chart_png(kind, counts):
+    """PNG bytes for the ``"bar"`` or ``"pie"`` chart of ``counts``, cached per distribution."""
+    return _cached(kind, chart_key(counts))
+
+
+def _values(counts):
+    return [{"category": label, "count": n} for label, n in chart_key(counts)]
+
+
+def bar_spec(counts):
+    return {
+        "data": {"values": _values(counts)},
+        "mark": "bar",
+        "title": "Risk Distribution",
+        "encoding": {
+            "x": {"field": "category", "type": "nominal", "sort": RISK_LABELS, "title": None},
+            "y": {"field": "count", "type": "quantitative", "title": "Count"},
+        },
+    }
+
+
+def pie_spec(counts):
+    return {
+        "data": {"values": _values(counts)},
+        "mark": {"type": "arc", "tooltip": True},
+        "title": "Risk Category Share",
+        "encoding": {
+            "theta": {"field": "count", "type": "quantitative", "stack": "normalize"},
+            "color": {"field": "category", "type": "nominal", "sort": RISK_LABELS},
+        },
+    }
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – incremental delta uploads keyed by employee id
+
+Every full upload with an employee id column leaves a snapshot on disk: the
+scored rows (Parquet) plus the model that scored them (a saved artifact). A
+later upload of only the new, changed or removed employees is merged into
+that snapshot by id, and only its rows are imputed and scored against the
+snapshot's model. The model is retrained on the merged workforce only when
+the change exceeds ``RETRAIN_FRACTION`` of it.
+
+Removed employees are rows with a truthy ``removed`` column (or one of its
+``staysmart.schema.DELTA_ALIASES``); their other columns are ignored.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from staysmart.artifacts import load_artifact, save_artifact
+from staysmart.backends import AUTO
+from staysmart.diagnostics import stage
+from staysmart.impute import DEFAULT_STRATEGY, impute
+from staysmart.ingest import read_employees
+from staysmart.pipeline import (MODEL_PARAMS, RiskSummary, ScoredDataset, compact, label, pipeline_key,
+                                score_frame, train)
+from staysmart.schema import DELTA_ALIASES, DIMENSIONS, ID_COL, REMOVED_COL
+
+RETRAIN_FRACTION = float(os.environ.get("STAYSMART_RETRAIN_FRACTION", 0.2))
+SNAPSHOT_KEEP = 3
+TRUTHY = ["1", "true", "yes", "y", "x"]
+
+
+# ================= SNAPSHOTS =================
+def save_snapshot(scored, snapshot_dir, keep=SNAPSHOT_KEEP):
+    """Write ``scored`` as the newest snapshot, keeping the ``keep`` most recent."""
+    if ID_COL not in scored.df.columns:
+        raise ValueError(f"snapshots need an {ID_COL!r} column to match delta uploads against")
+    name = f"{time.strftime('%Y%m%d-%H%M%S')}-{scored.key[:16]}"
+    path = os.path.join(snapshot_dir, name)
+    os.makedirs(snapshot_dir, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=snapshot_dir, prefix=f"{name}.tmp-")
+    try:
+        scored.df.to_parquet(os.path.join(tmp, "rows.parquet"), compression="zstd", index=False)
+        save_artifact(scored.fitted, tmp, "model")
+        with open(os.path.join(tmp, "snapshot.json"), "w") as f:
+            json.dump({"key": scored.key, "rows": len(scored.df)}, f)
+        os.rename(tmp, path)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    for old in list_snapshots(snapshot_dir)[:-keep]:
+        shutil.rmtree(os.path.join(snapshot_dir, old), ignore_errors=True)
+    return path
+
+
+def list_snapshots(snapshot_dir):
+    """Snapshot directories under ``snapshot_dir``, oldest first."""
+    if not os.path.isdir(snapshot_dir):
+        return []
+    return sorted(
+        name for name in os.listdir(snapshot_dir)
+        if ".tmp-" not in name and os.path.isfile(os.path.join(snapshot_dir, name, "snapshot.json"))
+    )
+
+
+def latest_snapshot(snapshot_dir):
+    """Path of the newest snapshot, or None."""
+    names = list_snapshots(snapshot_dir)
+    return os.path.join(snapshot_dir, names[-1]) if names else None
+
+
+def snapshot_key(path):
+    """Content key of the dataset a snapshot holds, without loading its rows."""
+    with open(os.path.join(path, "snapshot.json")) as f:
+        return json.load(f)["key"]
+
+
+def snapshot_rows(path):
+    """Employees in a snapshot, without loading its rows."""
+    with open(os.path.join(path, "snapshot.json")) as f:
+        return json.load(f)["rows"]
+
+
+def load_snapshot(path):
+    with stage("ingest"):
+        df = pd.read_parquet(os.path.join(path, "rows.parquet"))
+    return ScoredDataset(snapshot_key(path), df, load_artifact(os.path.join(path, "model")), RiskSummary().update(df))
+
+
+# ================= MERGE =================
+def _member(ids, value_set):
+    # Arrow-backed string Series.isin loops in Python; Arrow's is_in hashes in C++.
+    found = pc.is_in(pa.array(ids, type=pa.string()), value_set=pa.array(value_set, type=pa.string()))
+    return found.to_numpy(zero_copy_only=False)
+
+
+def removed_mask(delta):
+    """Rows flagged as departed; pops the ``removed`` column from ``delta``."""
+    if REMOVED_COL not in delta.columns:
+        return np.zeros(len(delta), dtype=bool)
+    flags = delta.pop(REMOVED_COL).str.strip().str.lower()
+    return flags.isin(TRUTHY).fillna(False).to_numpy(dtype=bool)
+
+
+def apply_delta(base, data, name=None, params=MODEL_PARAMS, key=None, imputer=DEFAULT_STRATEGY,
+                backend=AUTO, retrain_fraction=RETRAIN_FRACTION):
+    """Merge a delta upload into the scored dataset ``base`` by employee id.
+
+    Rows whose id is new are added, rows whose id exists replace it, and
+    rows flagged removed drop it. Only added and replaced rows are imputed
+    and scored, against ``base``'s model, unless the change touches more than
+    ``retrain_fraction`` of the workforce: then a model is trained (with
+    ``backend``) on the merged rows and every row is rescored. Returns a new
+    ScoredDataset whose ``changes`` describe the merge.
+    """
+    with stage("ingest"):
+        delta = read_employees(data, name, DELTA_ALIASES)
+    if ID_COL not in delta.columns or ID_COL not in base.df.columns:
+        raise ValueError(f"delta uploads need an {ID_COL!r} column, in this file and in the last full upload")
+
+    delta = delta[delta[ID_COL].notna()].drop_duplicates(ID_COL, keep="last").reset_index(drop=True)
+    removed = removed_mask(delta)
+    ids = base.df[ID_COL]
+    known = _member(delta[ID_COL], ids)
+    changes = {
+        "added": int(np.count_nonzero(~known & ~removed)),
+        "updated": int(np.count_nonzero(known & ~removed)),
+        "removed": int(np.count_nonzero(known & removed)),
+    }
+    touched = sum(changes.values())
+    changes["fraction"] = touched / len(base.df) if len(base.df) else 1.0
+    changes["retrained"] = changes["fraction"] > retrain_fraction
+
+    rows = delta[~removed].reset_index(drop=True)
+    with stage("impute", len(rows)):
+        impute(rows, imputer)
+    with stage("label", len(rows)):
+        rows['left'] = label(rows)
+
+    kept = base.df[~_member(ids, delta[ID_COL])]
+    if changes["retrained"]:
+        df = pd.concat([kept, rows], ignore_index=True)
+        fitted = train(df, params, df['left'], backend)
+        score_frame(df, fitted)
+    else:
+        fitted = base.fitted
+        df = pd.concat([kept, score_frame(rows, fitted)], ignore_index=True)
+    # Concatenating categoricals with different categories falls back to object.
+    for d in DIMENSIONS:
+        if d in df.columns:
+            df[d] = df[d].astype("category")
+    compact(df)
+
+    key = key or pipeline_key(data, {"base": base.key, "params": params})
+    summary = RiskSummary().update(df)
+    if changes["retrained"]:
+        fitted.remember_profile(summary, key)
+    return ScoredDataset(key, df, fitted, summary, changes)
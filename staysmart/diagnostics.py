@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – opt-in per-stage timing and memory instrumentation
+
+Pipeline code marks its stages with ``with stage("fit"): ...``. Nothing is
+measured unless a StageRecorder has been activated for the current thread, so
+the markers cost one context-variable lookup when diagnostics are off.
+"""
+
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger("staysmart.diagnostics")
+
+SAMPLE_SECONDS = 0.005
+
+_active = contextvars.ContextVar("staysmart_recorder", default=None)
+
+
+def _rss():
+    """Resident set size in bytes (high-water mark where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if os.uname().sysname == "Darwin" else peak * 1024
+    return 0
+
+
+class _Sampler:
+    """Background thread that samples RSS while any stage is open.
+
+    Sampling instead of tracemalloc keeps stage timings honest: tracing every
+    allocation slows pandas/sklearn code by an order of magnitude.
+    """
+
+    def __init__(self):
+        self.frames = set()
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def open(self, frame):
+        with self.lock:
+            self.frames.add(frame)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="staysmart-rss", daemon=True)
+                self.thread.start()
+
+    def close(self, frame):
+        frame.observe(_rss())
+        with self.lock:
+            self.frames.discard(frame)
+
+    def _run(self):
+        while True:
+            rss = _rss()
+            with self.lock:
+                if not self.frames:
+                    self.thread = None
+                    return
+                for frame in self.frames:
+                    frame.observe(rss)
+            time.sleep(SAMPLE_SECONDS)
+
+
+_sampler = _Sampler()
+
+
+class _Frame:
+    __slots__ = ("base", "peak")
+
+    def __init__(self):
+        self.base = self.peak = _rss()
+
+    def observe(self, rss):
+        if rss > self.peak:
+            self.peak = rss
+
+
+class StageRecorder:
+    """Wall time and peak memory growth per stage, aggregated by stage name.
+
+    Every finished stage is also logged as one JSON line on the
+    ``staysmart.diagnostics`` logger for aggregation across sessions. Memory
+    is the process RSS, so concurrent sessions show up in each other's peaks.
+    """
+
+    def __init__(self, **context):
+        self.context = context
+        self.stages = {}
+        if not logger.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+
+    @contextmanager
+    def stage(self, name, rows=None):
+        frame = _Frame()
+        _sampler.open(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            _sampler.close(frame)
+            self._record(name, seconds, frame.peak - frame.base, rows)
+
+    def _record(self, name, seconds, peak, rows):
+        entry = self.stages.setdefault(name, {"calls": 0, "seconds": 0.0, "peak_bytes": 0, "rows": 0})
+        entry["calls"] += 1
+        entry["seconds"] += seconds
+        entry["peak_bytes"] = max(entry["peak_bytes"], peak)
+        entry["rows"] += rows or 0
+        logger.info(json.dumps({
+            "event": "stage", **self.context, "stage": name,
+            "seconds": round(seconds, 6), "peak_mb": round(peak / 2**20, 3), "rows": rows,
+        }))
+
+    def table(self):
+        """One row per stage, in the order the stages first ran."""
+        return [
+            {"stage": name, "calls": e["calls"], "seconds": round(e["seconds"], 4),
+             "peak_mb": round(e["peak_bytes"] / 2**20, 2), "rows": e["rows"] or None}
+            for name, e in self.stages.items()
+        ]
+
+
+def activate(recorder):
+    """Make ``recorder`` (or None to switch off) receive this thread's stages."""
+    _active.set(recorder)
+
+
+def active():
+    return _active.get()
+
+
+@contextmanager
+def stage(name, rows=None):
+    recorder = _active.get()
+    if recorder is None:
+        yield
+        return
+    with recorder.stage(name, rows):
+        yield
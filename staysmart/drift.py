@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – distribution profiles and drift between uploads
+
+Every feature has a fixed valid range (``REQUIRED_COLS``) and the risk
+score runs 0–100, so a dataset's distribution is kept as one histogram per
+column with a bin per unit of the range: a few hundred counters in total,
+updated chunk by chunk alongside the other aggregates and mergeable across
+chunks. A model remembers the profile of the data it was trained on (in its
+``meta``, so saved artifacts keep it), and drift statistics (PSI and the
+Kolmogorov–Smirnov distance) are computed from the two histograms alone.
+"""
+
+import numpy as np
+import pandas as pd
+
+from staysmart.schema import REQUIRED_COLS
+
+RANGES = {**REQUIRED_COLS, "flight_risk": (0, 100)}
+PROFILE_COLUMNS = list(RANGES)
+
+PSI_WATCH = 0.1     # population stability index: below is stable
+PSI_RETRAIN = 0.25  # at or above: the population has shifted
+KS_RETRAIN = 0.15   # largest gap between the two cumulative distributions
+_EPS = 1e-4         # floor for empty bins, so PSI stays finite
+
+
+class Profile:
+    """Unit-width histograms of every feature and the flight-risk score."""
+
+    def __init__(self, counts=None):
+        self.counts = counts or {col: np.zeros(hi - lo + 1, dtype=np.int64) for col, (lo, hi) in RANGES.items()}
+
+    def update(self, df):
+        for col in PROFILE_COLUMNS:
+            if col not in df.columns:
+                continue
+            lo, hi = RANGES[col]
+            values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            values = values[~np.isnan(values)]
+            bins = np.clip(values - lo, 0, hi - lo).astype(np.intp)  # floor, as values - lo >= 0
+            self.counts[col] += np.bincount(bins, minlength=hi - lo + 1)
+        return self
+
+    @property
+    def nbytes(self):
+        return sum(c.nbytes for c in self.counts.values())
+
+    def quantile(self, col, q):
+        """Approximate ``q`` quantile of ``col`` (to the bin's lower edge)."""
+        counts = self.counts[col]
+        if not counts.sum():
+            return float("nan")
+        cdf = np.cumsum(counts) / counts.sum()
+        return float(RANGES[col][0] + np.searchsorted(cdf, q))
+
+    def to_dict(self):
+        # JSON-friendly, for FittedPipeline.meta and saved artifacts.
+        return {col: counts.tolist() for col, counts in self.counts.items()}
+
+    @classmethod
+    def from_dict(cls, data):
+        profile = cls()
+        for col, counts in data.items():
+            if col in profile.counts and len(counts) == len(profile.counts[col]):
+                profile.counts[col] = np.asarray(counts, dtype=np.int64)
+        return profile
+
+
+def psi(reference, current):
+    """Population stability index between two histograms over the same bins."""
+    p = np.maximum(reference / max(reference.sum(), 1), _EPS)
+    q = np.maximum(current / max(current.sum(), 1), _EPS)
+    return float(np.sum((q - p) * np.log(q / p)))
+
+
+def ks(reference, current):
+    """Kolmogorov–Smirnov distance, exact at the bin edges."""
+    if not reference.sum() or not current.sum():
+        return float("nan")
+    return float(np.max(np.abs(np.cumsum(reference) / reference.sum() - np.cumsum(current) / current.sum())))
+
+
+def drift_report(reference, current):
+    """Per column: training vs current median, PSI, KS and a status."""
+    rows = []
+    for col in PROFILE_COLUMNS:
+        ref, cur = reference.counts[col], current.counts[col]
+        if not ref.sum() or not cur.sum():
+            continue
+        score, distance = psi(ref, cur), ks(ref, cur)
+        status = "shifted" if score >= PSI_RETRAIN or distance >= KS_RETRAIN else "watch" if score >= PSI_WATCH else "stable"
+        rows.append({
+            "column": col,
+            "training_median": reference.quantile(col, 0.5),
+            "current_median": current.quantile(col, 0.5),
+            "psi": score,
+            "ks": distance,
+            "status": status,
+        })
+    return pd.DataFrame(rows, columns=["column", "training_median", "current_median", "psi", "ks", "status"])
+
+
+def needs_retraining(report):
+    """True when any feature, or the risk score itself, has shifted since training."""
+    return bool((report["status"] == "shifted").any())
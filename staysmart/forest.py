@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – flattened random forest for low-latency scoring"""
+
+import numpy as np
+
+# Rows per traversal block; bounds the (rows × trees) index matrix.
+BLOCK_ROWS = 16384
+
+
+class CompiledForest:
+    """A fitted StandardScaler + RandomForestClassifier as flat node arrays.
+
+    Every tree is laid out back to back in shared arrays. Leaves point to
+    themselves with an infinite threshold, so all rows walk the forest in a
+    fixed number of vectorised steps without per-call sklearn validation or
+    DataFrame construction.
+    """
+
+    def __init__(self, mean, scale, feature, threshold, left, right, proba, roots, depth):
+        self.mean = mean
+        self.scale = scale
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.proba = proba
+        self.roots = roots
+        self.depth = int(depth)
+
+    @classmethod
+    def from_sklearn(cls, scaler, model):
+        classes = list(model.classes_)
+        positive = classes.index(1) if 1 in classes else None
+
+        feature, threshold, left, right, proba, roots = [], [], [], [], [], []
+        offset, depth = 0, 0
+        for est in model.estimators_:
+            t = est.tree_
+            nodes = np.arange(t.node_count)
+            leaf = t.children_left == -1
+            feature.append(np.where(leaf, 0, t.feature))
+            threshold.append(np.where(leaf, np.inf, t.threshold))
+            left.append(np.where(leaf, nodes, t.children_left) + offset)
+            right.append(np.where(leaf, nodes, t.children_right) + offset)
+            value = t.value[:, 0, :]
+            if positive is None:
+                proba.append(np.zeros(t.node_count))
+            else:
+                proba.append(value[:, positive] / value.sum(axis=1))
+            roots.append(offset)
+            offset += t.node_count
+            depth = max(depth, t.max_depth)
+
+        return cls(
+            mean=np.asarray(scaler.mean_, dtype=np.float64),
+            scale=np.asarray(scaler.scale_, dtype=np.float64),
+            feature=np.concatenate(feature).astype(np.intp),
+            threshold=np.concatenate(threshold).astype(np.float64),
+            left=np.concatenate(left).astype(np.intp),
+            right=np.concatenate(right).astype(np.intp),
+            proba=np.concatenate(proba).astype(np.float64),
+            roots=np.asarray(roots, dtype=np.intp),
+            depth=depth,
+        )
+
+    @property
+    def nbytes(self):
+        return sum(a.nbytes for a in (
+            self.mean, self.scale, self.feature, self.threshold,
+            self.left, self.right, self.proba, self.roots,
+        ))
+
+    def _leaves(self, X):
+        # sklearn compares float32 features against float64 thresholds.
+        Xs = ((X - self.mean) / self.scale).astype(np.float32)
+        rows = np.arange(len(Xs))[:, None]
+        idx = np.broadcast_to(self.roots, (len(Xs), len(self.roots)))
+        for _ in range(self.depth):
+            go_left = Xs[rows, self.feature[idx]] <= self.threshold[idx]
+            idx = np.where(go_left, self.left[idx], self.right[idx])
+        return idx
+
+    def predict(self, X):
+        """Positive-class probability for raw (unscaled) feature rows."""
+        X = np.asarray(X, dtype=np.float64).reshape(-1, len(self.mean))
+        out = np.empty(len(X))
+        for start in range(0, len(X), BLOCK_ROWS):
+            block = X[start:start + BLOCK_ROWS]
+            out[start:start + len(block)] = self.proba[self._leaves(block)].mean(axis=1)
+        return out
+
+    def predict_one(self, values):
+        """Probability for a single employee given as a sequence of features."""
+        return float(self.predict(values)[0])
+
+    def contributions(self, X):
+        """Per-feature share of each row's probability, from its decision paths.
+
+        Every split a row passes through moves its estimate from the parent's
+        positive rate to the child's; that move is credited to the split
+        feature and averaged over trees. Returns ``(bias, contrib)`` where
+        ``bias + contrib.sum(axis=1)`` equals ``predict(X)``.
+        """
+        X = np.asarray(X, dtype=np.float64).reshape(-1, len(self.mean))
+        n_features = len(self.mean)
+        out = np.zeros((len(X), n_features), dtype=np.float32)
+        for start in range(0, len(X), BLOCK_ROWS):
+            block = X[start:start + BLOCK_ROWS]
+            Xs = ((block - self.mean) / self.scale).astype(np.float32)
+            rows = np.arange(len(Xs))[:, None]
+            cell = rows * n_features
+            idx = np.broadcast_to(self.roots, (len(Xs), len(self.roots)))
+            acc = np.zeros(len(Xs) * n_features)
+            for _ in range(self.depth):
+                feat = self.feature[idx]
+                child = np.where(Xs[rows, feat] <= self.threshold[idx], self.left[idx], self.right[idx])
+                # Leaves loop back to themselves, so finished paths add zero.
+                delta = self.proba[child] - self.proba[idx]
+                acc += np.bincount((cell + feat).ravel(), delta.ravel(), minlength=len(acc))
+                idx = child
+            out[start:start + len(block)] = acc.reshape(-1, n_features) / len(self.roots)
+        return float(self.proba[self.roots].mean()), out
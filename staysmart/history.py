@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – columnar history of scored runs for trend reporting
+
+Every scored run is appended as one Parquet file under a month and series
+partition:
+
+    <history_dir>/month=2026-10/series=<name>/<YYYYmmdd-HHMMSS>-<key>.parquet
+
+holding only what trend reporting needs (employee id, dimensions, flight
+risk and category). A series is one part of the workforce that is scored
+as a whole each month, e.g. one business unit's file; when a series has
+several runs in a month, its latest run stands for that month, and a
+month's workforce is all of its series together. Queries go through
+``pyarrow.dataset``: month filters prune whole partitions, dimension
+filters are pushed down to the Parquet row groups, only the requested
+columns are decoded, and aggregates are folded batch by batch, so years of
+history are never resident at once.
+"""
+
+import os
+import tempfile
+import time
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from staysmart.pipeline import StreamedDataset
+from staysmart.reports import EXPORT_CHUNK_ROWS
+from staysmart.schema import DIMENSIONS, ID_COL
+
+HISTORY_COLUMNS = [ID_COL] + DIMENSIONS + ["flight_risk", "risk_category"]
+DEFAULT_SERIES = "workforce"
+ROSE_BY = 10  # risk points a rise must reach to be listed
+ROSE_LIMIT = 100
+
+_SCHEMA = pa.schema(
+    [(ID_COL, pa.string())]
+    + [(d, pa.dictionary(pa.int32(), pa.string())) for d in DIMENSIONS]
+    + [("flight_risk", pa.uint8()), ("risk_category", pa.dictionary(pa.int8(), pa.string()))]
+)
+_PARTITIONS = ds.partitioning(pa.schema([("month", pa.string()), ("series", pa.string())]), flavor="hive")
+
+
+def _table(frame):
+    # Every run gets the same schema, whatever columns its upload had.
+    columns = {}
+    for field in _SCHEMA:
+        values = frame[field.name] if field.name in frame.columns else pd.Series(None, index=frame.index, dtype=object)
+        if pa.types.is_dictionary(field.type):
+            values = values.astype("string")
+        columns[field.name] = pa.array(values, from_pandas=True).cast(field.type)
+    return pa.Table.from_pydict(columns, schema=_SCHEMA)
+
+
+# ================= WRITE =================
+def append_run(history_dir, frames, key, month=None, series=DEFAULT_SERIES):
+    """Append a scored run (an iterable of scored frames) to ``series`` under its month.
+
+    ``month`` ("YYYY-MM") defaults to the current one. A run whose ``key`` is
+    already stored for that month and series is not written again. Returns
+    the file path.
+    """
+    month = month or time.strftime("%Y-%m")
+    part = os.path.join(history_dir, f"month={month}", f"series={quote(series, safe='')}")
+    os.makedirs(part, exist_ok=True)
+    existing = [name for name in os.listdir(part) if name.endswith(f"-{key[:16]}.parquet")]
+    if existing:
+        return os.path.join(part, existing[0])
+
+    path = os.path.join(part, f"{time.strftime('%Y%m%d-%H%M%S')}-{key[:16]}.parquet")
+    fd, tmp = tempfile.mkstemp(dir=part, suffix=".tmp")
+    os.close(fd)
+    try:
+        with pq.ParquetWriter(tmp, _SCHEMA, compression="zstd") as writer:
+            for frame in frames:
+                writer.write_table(_table(frame))
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return path
+
+
+def append_scored(history_dir, scored, month=None, series=DEFAULT_SERIES):
+    """Append a ScoredDataset, or a StreamedDataset read back from its report in chunks."""
+    if isinstance(scored, StreamedDataset):
+        frames = pd.read_csv(scored.report_path, chunksize=EXPORT_CHUNK_ROWS, usecols=lambda c: c in HISTORY_COLUMNS)
+    else:
+        frames = [scored.df]
+    return append_run(history_dir, frames, scored.key, month, series)
+
+
+# ================= READ =================
+def _latest(directory):
+    files = sorted(name for name in os.listdir(directory) if name.endswith(".parquet"))
+    return os.path.join(directory, files[-1]) if files else None
+
+
+def latest_runs(history_dir):
+    """Month → paths of its runs, the latest of each series; oldest month first."""
+    if not os.path.isdir(history_dir):
+        return {}
+    runs = {}
+    for part in sorted(os.listdir(history_dir)):
+        if not part.startswith("month="):
+            continue
+        month_dir = os.path.join(history_dir, part)
+        series = [os.path.join(month_dir, name) for name in sorted(os.listdir(month_dir)) if name.startswith("series=")]
+        paths = [path for path in map(_latest, series) if path is not None]
+        if paths:
+            runs[part[len("month="):]] = paths
+    return runs
+
+
+def months(history_dir):
+    return list(latest_runs(history_dir))
+
+
+def _dataset(history_dir, since=None, until=None):
+    runs = latest_runs(history_dir)
+    files = [path for month, paths in runs.items() for path in paths
+             if (since is None or month >= since) and (until is None or month <= until)]
+    if not files:
+        return None
+    schema = _SCHEMA.append(pa.field("month", pa.string())).append(pa.field("series", pa.string()))
+    return ds.dataset(files, schema=schema, format="parquet", partitioning=_PARTITIONS, partition_base_dir=os.fspath(history_dir))
+
+
+def _predicate(filters):
+    expr = None
+    for dim, chosen in (filters or {}).items():
+        if chosen:
+            term = ds.field(dim).isin(list(chosen))
+            expr = term if expr is None else expr & term
+    return expr
+
+
+def trend(history_dir, by=None, filters=None, since=None, until=None):
+    """Employees, high-risk count and average risk per month (and per ``by`` value).
+
+    ``filters`` maps dimensions to the values to keep; ``since``/``until``
+    bound the months ("YYYY-MM", inclusive).
+    """
+    keys = ["month"] + ([by] if by else [])
+    columns = keys + ["employees", "High", "avg_risk"]
+    dataset = _dataset(history_dir, since, until)
+    if dataset is None:
+        return pd.DataFrame(columns=columns)
+
+    parts = []
+    scanner = dataset.scanner(columns=keys + ["flight_risk", "risk_category"], filter=_predicate(filters))
+    for batch in scanner.to_batches():
+        if not batch.num_rows:
+            continue
+        frame = batch.to_pandas()
+        frame["High"] = (frame["risk_category"] == "High").astype(np.int64)
+        frame["risk_sum"] = frame["flight_risk"].astype(np.int64)
+        parts.append(frame.groupby(keys, observed=True, dropna=False).agg(
+            employees=("High", "size"), High=("High", "sum"), risk_sum=("risk_sum", "sum"),
+        ))
+    if not parts:
+        return pd.DataFrame(columns=columns)
+    totals = pd.concat(parts).groupby(level=keys, observed=True, dropna=False).sum()
+    totals["avg_risk"] = totals["risk_sum"] / totals["employees"]
+    return totals.reset_index()[columns].sort_values(keys, kind="stable").reset_index(drop=True)
+
+
+def _month_frame(history_dir, month, columns, filters=None):
+    paths = latest_runs(history_dir).get(month)
+    if paths is None:
+        return None
+    return ds.dataset(paths, schema=_SCHEMA, format="parquet").to_table(
+        columns=columns, filter=_predicate(filters)).to_pandas()
+
+
+def risk_rose(history_dir, month=None, by=ROSE_BY, filters=None, limit=ROSE_LIMIT):
+    """Employees whose risk rose by at least ``by`` points since the month before ``month``.
+
+    ``month`` defaults to the latest one; the comparison is against the
+    closest earlier month on record. Largest rises first.
+    """
+    stored = months(history_dir)
+    if month is None and stored:
+        month = stored[-1]
+    earlier = [m for m in stored if m < (month or "")]
+    if month not in stored or not earlier:
+        return pd.DataFrame(columns=[ID_COL, "previous_risk", "flight_risk", "rise"])
+
+    now = _month_frame(history_dir, month, HISTORY_COLUMNS, filters)
+    before = _month_frame(history_dir, earlier[-1], [ID_COL, "flight_risk"], filters)
+    # An employee who moved between series keeps one row per month.
+    now = now[now[ID_COL].notna()].drop_duplicates(ID_COL, keep="last")
+    before = before.drop_duplicates(ID_COL, keep="last")
+    merged = now.merge(before.rename(columns={"flight_risk": "previous_risk"}), on=ID_COL, how="inner")
+    merged["rise"] = merged["flight_risk"].astype(np.int16) - merged["previous_risk"].astype(np.int16)
+    rose = merged[merged["rise"] >= by]
+    rose = rose.sort_values(["rise", "flight_risk"], ascending=False, kind="stable").head(limit)
+    return rose[[ID_COL] + [d for d in DIMENSIONS if rose[d].notna().any()] + ["previous_risk", "flight_risk", "rise"]
+                ].reset_index(drop=True).assign(compared_with=earlier[-1])
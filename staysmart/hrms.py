@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – HRMS client for the scoring service, plus a stand-in HRMS
+
+``ScoringClient`` is what an HRMS integration uses to call
+``staysmart.server`` over HTTP or a Unix socket. Run as a module, this file
+plays an HRMS: many concurrent clients sending single-employee lookups and
+bulk syncs of synthetic employees, then it prints the service's stats:
+
+    python -m staysmart.hrms --url http://127.0.0.1:8765 --clients 32 --requests 200
+    python -m staysmart.hrms --socket /tmp/staysmart.sock --bulk-every 20 --bulk-size 500
+"""
+
+import argparse
+import http.client
+import json
+import socket
+import sys
+import threading
+import time
+
+import numpy as np
+
+from staysmart.synth import synthetic_employees
+
+
+class _UnixConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout=30):
+        super().__init__("localhost", timeout=timeout)
+        self._path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._path)
+
+
+class ScoringClient:
+    """One keep-alive connection to the scoring service; not thread-safe."""
+
+    def __init__(self, url=None, socket_path=None, timeout=30):
+        if socket_path:
+            self._conn = _UnixConnection(socket_path, timeout)
+        else:
+            host, _, port = (url or "http://127.0.0.1:8765").split("://", 1)[-1].rstrip("/").partition(":")
+            self._conn = http.client.HTTPConnection(host, int(port or 80), timeout=timeout)
+
+    def _call(self, method, path, body=None):
+        data = None if body is None else json.dumps(body).encode()
+        headers = {} if data is None else {"Content-Type": "application/json"}
+        self._conn.request(method, path, data, headers)
+        response = self._conn.getresponse()
+        result = json.loads(response.read())
+        if response.status != 200:
+            raise RuntimeError(f"scoring service returned {response.status}: {result.get('error')}")
+        return result
+
+    def score(self, employee):
+        """Flight risk for one employee record."""
+        return self._call("POST", "/score", employee)
+
+    def score_many(self, employees):
+        """Flight risk for a list of employee records, in order."""
+        return self._call("POST", "/score", {"employees": employees})["employees"]
+
+    def stats(self):
+        return self._call("GET", "/stats")
+
+    def health(self):
+        return self._call("GET", "/health")
+
+    def close(self):
+        self._conn.close()
+
+
+def _records(n, seed):
+    df = synthetic_employees(n, seed=seed)
+    df["Department"] = df["Department"].astype(str)
+    df["Location"] = df["Location"].astype(str)
+    return df.to_dict("records")
+
+
+def simulate(connect, clients=16, requests=100, bulk_every=0, bulk_size=500, seed=0):
+    """Drive the service from ``clients`` threads; returns client-side latencies in seconds.
+
+    Each thread sends ``requests`` single-employee calls, and a bulk call of
+    ``bulk_size`` employees after every ``bulk_every`` of them (0: never).
+    ``connect`` returns a fresh ScoringClient.
+    """
+    pool = _records(max(bulk_size, 1000), seed)
+    latencies = [[] for _ in range(clients)]
+    errors = []
+
+    def run(i):
+        client = connect()
+        rng = np.random.default_rng([seed, i])
+        try:
+            for n in range(requests):
+                start = time.perf_counter()
+                if bulk_every and n % bulk_every == bulk_every - 1:
+                    client.score_many(pool[:bulk_size])
+                else:
+                    client.score(pool[rng.integers(len(pool))])
+                latencies[i].append(time.perf_counter() - start)
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            client.close()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if errors:
+        raise errors[0]
+    return np.concatenate([np.array(l) for l in latencies])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m staysmart.hrms", description="Stand-in HRMS load against the scoring service.")
+    parser.add_argument("--url", default="http://127.0.0.1:8765", help="scoring service URL (default: %(default)s)")
+    parser.add_argument("--socket", help="scoring service Unix socket (instead of --url)")
+    parser.add_argument("-c", "--clients", type=int, default=16, help="concurrent clients (default: 16)")
+    parser.add_argument("-n", "--requests", type=int, default=100, help="requests per client (default: 100)")
+    parser.add_argument("--bulk-every", type=int, default=0, help="make every Nth request a bulk sync (default: never)")
+    parser.add_argument("--bulk-size", type=int, default=500, help="employees per bulk sync (default: 500)")
+    args = parser.parse_args(argv)
+
+    def connect():
+        return ScoringClient(args.url, args.socket)
+
+    start = time.perf_counter()
+    latencies = simulate(connect, args.clients, args.requests, args.bulk_every, args.bulk_size) * 1000
+    elapsed = time.perf_counter() - start
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+    print(f"{len(latencies):,} requests in {elapsed:.2f}s ({len(latencies) / elapsed:,.0f}/s); "
+          f"client latency p50 {p50:.2f} ms, p90 {p90:.2f} ms, p99 {p99:.2f} ms")
+    client = connect()
+    print(json.dumps(client.stats(), indent=2))
+    client.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – deterministic imputation of missing feature data
+
+Every strategy is a pure function of its input (random draws are seeded), so
+the same upload always imputes, labels and scores the same way and results
+can be cached by content hash.
+"""
+
+import numpy as np
+from sklearn.neighbors import KDTree
+
+from staysmart.schema import FEATURES, REQUIRED_COLS
+
+DEFAULT_STRATEGY = "random"
+SEED = 42
+KNN_NEIGHBOURS = 5
+DRAW_BLOCK = 4096  # rows per seeded stream of random draws
+
+IMPUTERS = {}
+
+
+def register(name):
+    def wrap(fn):
+        IMPUTERS[name] = fn
+        return fn
+    return wrap
+
+
+def _midpoint(col):
+    lo, hi = REQUIRED_COLS[col]
+    return (lo + hi) / 2
+
+
+def _draw(col, positions, seed):
+    """Seeded draws for the rows at ``positions`` (row numbers within the file).
+
+    Row ``r`` always gets draw ``r % DRAW_BLOCK`` of block ``r // DRAW_BLOCK``'s
+    stream, so a row imputes the same whether the file is scored whole or in
+    chunks. ``positions`` must be sorted.
+    """
+    lo, hi = REQUIRED_COLS[col]
+    positions = np.asarray(positions, dtype=np.int64)
+    values = np.empty(len(positions), dtype=np.float64)
+    blocks, starts = np.unique(positions // DRAW_BLOCK, return_index=True)
+    for block, start, stop in zip(blocks, starts, list(starts[1:]) + [len(positions)]):
+        stream = np.random.default_rng([seed, FEATURES.index(col), block]).normal(_midpoint(col), 2, DRAW_BLOCK)
+        values[start:stop] = stream[positions[start:stop] % DRAW_BLOCK]
+    return np.clip(values, lo, hi)
+
+
+# ================= STRATEGIES =================
+# Each fills the NaN cells of the feature columns of ``df`` in place.
+# Columns with no observed value at all are filled beforehand (see impute).
+
+@register("random")
+def _random(df, seed, offset):
+    for col in FEATURES:
+        missing = df[col].isna().to_numpy()
+        if missing.any():
+            values = df[col].to_numpy(dtype=np.float64, copy=True)
+            values[missing] = _draw(col, offset + np.flatnonzero(missing), seed)
+            df[col] = values.astype(df[col].dtype)
+
+
+@register("median")
+def _median(df, seed, offset):
+    for col in FEATURES:
+        df[col] = df[col].fillna(df[col].median())
+
+
+@register("department_median")
+def _department_median(df, seed, offset):
+    if "department" not in df.columns:
+        return _median(df, seed, offset)
+    groups = df.groupby("department", observed=True, dropna=False)
+    for col in FEATURES:
+        if df[col].isna().any():
+            df[col] = df[col].fillna(groups[col].transform("median")).fillna(df[col].median())
+
+
+@register("knn")
+def _knn(df, seed, offset, k=KNN_NEIGHBOURS):
+    """Mean of the ``k`` nearest complete rows, found with a KD-tree per missingness pattern."""
+    X = df[FEATURES].to_numpy(dtype=np.float64, copy=True)
+    nan = np.isnan(X)
+    incomplete = nan.any(axis=1)
+    if not incomplete.any():
+        return
+    donors = X[~incomplete]
+    if len(donors) == 0:
+        return _median(df, seed, offset)
+
+    # Distances on range-normalised features so every score weighs the same.
+    lo = np.array([REQUIRED_COLS[c][0] for c in FEATURES], dtype=np.float64)
+    span = np.array([REQUIRED_COLS[c][1] for c in FEATURES], dtype=np.float64) - lo
+    scaled = (X - lo) / span
+    k = min(k, len(donors))
+
+    patterns, inverse = np.unique(nan[incomplete], axis=0, return_inverse=True)
+    rows = np.flatnonzero(incomplete)
+    for i, pattern in enumerate(patterns):
+        target = rows[inverse.ravel() == i]
+        observed = ~pattern
+        if observed.any():
+            tree = KDTree(scaled[~incomplete][:, observed])
+            _, nearest = tree.query(scaled[target][:, observed], k=k)
+            X[np.ix_(target, pattern)] = donors[:, pattern][nearest].mean(axis=1)
+        else:
+            X[np.ix_(target, pattern)] = np.median(donors[:, pattern], axis=0)
+
+    for j, col in enumerate(FEATURES):
+        if nan[:, j].any():
+            df[col] = X[:, j].astype(df[col].dtype)
+
+
+# ================= ENTRY POINT =================
+def impute(df, strategy=DEFAULT_STRATEGY, seed=SEED, offset=0):
+    """Fill absent feature columns and missing cells of ``df`` in place.
+
+    ``offset`` is the position of ``df``'s first row within its file, so
+    random draws depend on each row's position in the file and not on how
+    the file was chunked.
+    """
+    fill = IMPUTERS[strategy]
+    for col in FEATURES:
+        if col not in df.columns:
+            df[col] = np.float32(np.nan)
+        if df[col].isna().all():
+            # Nothing observed to learn from: the range midpoint, or seeded
+            # noise around it for the random strategy.
+            if strategy == "random":
+                df[col] = _draw(col, offset + np.arange(len(df)), seed).astype(np.float32)
+            else:
+                df[col] = np.float32(_midpoint(col))
+    fill(df, seed, offset)
+    return df
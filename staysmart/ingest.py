@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – schema-aware ingestion of CSV, Parquet and Feather uploads"""
+
+import io
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.ipc
+import pyarrow.parquet as pq
+
+from staysmart.schema import COLUMN_ALIASES, DTYPES, FEATURES, normalize_column
+
+UPLOAD_TYPES = ["csv", "parquet", "feather"]
+
+# Streaming reads: rows per yielded chunk, bytes per CSV parse block.
+CHUNK_ROWS = 250_000
+CSV_BLOCK_BYTES = 32 * 2**20
+
+_EXTENSIONS = {
+    ".csv": "csv", ".txt": "csv",
+    ".parquet": "parquet", ".pq": "parquet",
+    ".feather": "feather", ".arrow": "feather", ".ipc": "feather",
+}
+_ARROW_TYPES = {"float32": pa.float32(), "string": pa.string(), "category": pa.string()}
+
+
+def _open(source):
+    """Sources are either uploaded bytes or a path on local disk."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    return source
+
+
+def _magic(source):
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source[:6])
+    with open(source, "rb") as f:
+        return f.read(6)
+
+
+def detect_format(name, source):
+    if name is None and isinstance(source, (str, os.PathLike)):
+        name = os.fspath(source)
+    fmt = _EXTENSIONS.get(os.path.splitext(name or "")[1].lower())
+    if fmt:
+        return fmt
+    magic = _magic(source)
+    if magic[:4] == b"PAR1":
+        return "parquet"
+    if magic == b"ARROW1":
+        return "feather"
+    return "csv"
+
+
+def read_header(source, fmt):
+    """Column names of the upload, without parsing any rows."""
+    if fmt == "parquet":
+        return pq.read_schema(_open(source)).names
+    if fmt == "feather":
+        return pyarrow.ipc.open_file(_open(source)).schema.names
+    return list(pd.read_csv(_open(source), nrows=0).columns)
+
+
+def select_columns(header, aliases=COLUMN_ALIASES):
+    """Map source column → normalised name for the columns the pipeline uses."""
+    normalized = {}
+    for name in header:
+        normalized.setdefault(normalize_column(name), name)
+
+    selected = {normalized[col]: col for col in FEATURES if col in normalized}
+    for target, names in aliases.items():
+        source = next((normalized[a] for a in names if a in normalized), None)
+        if source is not None and source not in selected:
+            selected[source] = target
+    return selected
+
+
+def count_rows(source, name=None):
+    """Number of rows in the upload, without parsing it.
+
+    Parquet and Feather report it from their metadata; CSV counts newlines
+    (a quoted field spanning lines counts twice, which is fine for sizing).
+    """
+    fmt = detect_format(name, source)
+    if fmt == "parquet":
+        return pq.ParquetFile(_open(source)).metadata.num_rows
+    if fmt == "feather":
+        raw = pa.py_buffer(source) if isinstance(source, (bytes, bytearray, memoryview)) else pa.memory_map(os.fspath(source))
+        reader = pyarrow.ipc.open_file(raw)
+        return sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = bytes(source) if isinstance(source, memoryview) else source
+        lines = data.count(b"\n") + (not data.endswith(b"\n"))
+    else:
+        lines, last = 0, b"\n"
+        with open(source, "rb") as f:
+            for block in iter(lambda: f.read(2**20), b""):
+                lines += block.count(b"\n")
+                last = block[-1:]
+        lines += last != b"\n"
+    return max(lines - 1, 0)  # the header
+
+
+def _plan(source, name, aliases=COLUMN_ALIASES):
+    fmt = detect_format(name, source)
+    header = read_header(source, fmt)
+    columns = select_columns(header, aliases)
+    # Nothing usable: still parse one column so the row count survives for imputation.
+    usecols = list(columns) or header[:1]
+    dtypes = {src: DTYPES[dst] for src, dst in columns.items()}
+    return fmt, columns, usecols, dtypes
+
+
+def _finish(df, columns, dtypes):
+    return df.astype(dtypes).rename(columns=columns)[list(columns.values())]
+
+
+def read_employees(source, name=None, aliases=COLUMN_ALIASES):
+    """Parse only the needed columns of an upload into compact dtypes.
+
+    ``source`` may also be a DataFrame already in memory (e.g. pulled from a
+    database), which is reduced and cast the same way. ``aliases`` maps each
+    optional column to the source names it is recognised by.
+    """
+    if isinstance(source, pd.DataFrame):
+        columns = select_columns(source.columns, aliases)
+        return _finish(source[list(columns)], columns, {src: DTYPES[dst] for src, dst in columns.items()})
+    fmt, columns, usecols, dtypes = _plan(source, name, aliases)
+
+    if fmt == "parquet":
+        df = pd.read_parquet(_open(source), columns=usecols)
+    elif fmt == "feather":
+        df = pd.read_feather(_open(source), columns=usecols)
+    else:
+        # The pyarrow engine parses on all cores.
+        df = pd.read_csv(_open(source), usecols=usecols, dtype=dtypes, engine="pyarrow")
+
+    return _finish(df, columns, dtypes)
+
+
+def iter_employees(source, name=None, chunk_rows=CHUNK_ROWS):
+    """Yield the upload as compact DataFrame chunks of at most ``chunk_rows`` rows.
+
+    Only one Arrow batch is resident at a time, so files larger than RAM can be
+    scored as long as ``source`` is a path rather than in-memory bytes.
+    """
+    fmt, columns, usecols, dtypes = _plan(source, name)
+
+    if fmt == "parquet":
+        batches = pq.ParquetFile(_open(source)).iter_batches(batch_size=chunk_rows, columns=usecols)
+    elif fmt == "feather":
+        raw = _open(source)
+        reader = pyarrow.ipc.open_file(raw if isinstance(raw, io.BytesIO) else pa.memory_map(os.fspath(raw)))
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+    else:
+        types = {src: _ARROW_TYPES[DTYPES.get(columns.get(src), "string")] for src in usecols}
+        batches = pacsv.open_csv(
+            _open(source),
+            read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_BYTES),
+            convert_options=pacsv.ConvertOptions(include_columns=usecols, column_types=types),
+        )
+
+    for batch in batches:
+        for start in range(0, batch.num_rows, chunk_rows):
+            yield _finish(batch.slice(start, chunk_rows).to_pandas(), columns, dtypes)
@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – ingest → impute → fit → score pipeline"""
+
+import hashlib
+import json
+import pickle
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+from staysmart.attributions import Attributions
+from staysmart.backends import AUTO, BACKENDS, DEFAULT_BACKEND, record, resolve
+from staysmart.diagnostics import stage
+from staysmart.drift import Profile
+from staysmart.forest import CompiledForest
+from staysmart.impute import DEFAULT_STRATEGY, impute
+from staysmart.ingest import CHUNK_ROWS, iter_employees, read_employees
+from staysmart.schema import FEATURES, RISK_BINS, RISK_LABELS
+from staysmart.segments import SegmentCube
+from staysmart.tables import merge_top
+
+MODEL_PARAMS = {"n_estimators": 100, "max_depth": 6, "random_state": 42}
+
+# Streaming mode fits on this many leading rows, then scores the rest chunk by chunk.
+TRAIN_ROWS = 500_000
+
+
+# ================= CACHE KEY =================
+def pipeline_key(source, params):
+    """Hash of the upload (bytes or path) plus every parameter that changes the result."""
+    h = hashlib.sha256()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        h.update(source)
+    else:
+        with open(source, "rb") as f:
+            for block in iter(lambda: f.read(2**20), b""):
+                h.update(block)
+    h.update(json.dumps(params, sort_keys=True).encode())
+    return h.hexdigest()
+
+
+# ================= STAGES =================
+def risk_score(df):
+    # Score in float64 so compact float32 inputs label exactly like before.
+    f = {col: df[col].astype("float64") for col in FEATURES}
+    return (
+        (10-f['satisfaction_score'])*0.3 +
+        (10-f['engagement_score'])*0.3 +
+        (f['last_hike_months']/36)*10*0.2 +
+        (f['overtime_hours']/80)*10*0.1 +
+        (f['distance_from_home']/40)*10*0.1
+    )
+
+
+def label(df):
+    return (risk_score(df) > 5.5).astype(np.uint8)
+
+
+def fit(X, y, params, backend=DEFAULT_BACKEND):
+    scaler = StandardScaler()
+    X_scaled = scaler.fit_transform(X)
+    model = BACKENDS[backend].make(params)
+    start = time.perf_counter()
+    model.fit(X_scaled, y)
+    record(backend, "fit", len(X), time.perf_counter() - start)
+    return scaler, model, X_scaled
+
+
+def positive_proba(model, X):
+    # A file where nobody crosses the label threshold trains a one-class model.
+    classes = list(model.classes_)
+    if 1 not in classes:
+        return np.zeros(len(X))
+    return model.predict_proba(X)[:, classes.index(1)]
+
+
+def categorize(flight_risk):
+    # include_lowest: a 0% score is Low, not uncategorised.
+    return pd.cut(flight_risk, RISK_BINS, labels=RISK_LABELS, include_lowest=True)
+
+
+def score_frame(df, fitted):
+    with stage("predict_proba", len(df)):
+        proba = fitted.predict(df[FEATURES].to_numpy(dtype=np.float64))
+    df['flight_risk'] = (proba*100).round(0).astype(np.uint8)
+    with stage("categorize", len(df)):
+        df['risk_category'] = categorize(df['flight_risk'])
+    return df
+
+
+def compact(df):
+    """Downcast bounded features in place: uint8 when whole numbers, else float32."""
+    for col in FEATURES:
+        values = df[col].to_numpy()
+        if len(values) and np.all(np.mod(values, 1) == 0) and values.min() >= 0 and values.max() <= 255:
+            df[col] = values.astype(np.uint8)
+        else:
+            df[col] = values.astype(np.float32)
+    return df
+
+
+# ================= AGGREGATES =================
+@dataclass
+class RiskSummary:
+    """Dashboard aggregates, accumulated one scored chunk at a time."""
+    rows: int = 0
+    risk_sum: float = 0.0
+    counts: dict = field(default_factory=lambda: dict.fromkeys(RISK_LABELS, 0))
+    feature_sums: dict = field(default_factory=lambda: dict.fromkeys(FEATURES, 0.0))
+    feature_counts: dict = field(default_factory=lambda: dict.fromkeys(FEATURES, 0))
+    top: pd.DataFrame = None
+    segments: SegmentCube = field(default_factory=SegmentCube)
+    profile: Profile = field(default_factory=Profile)
+
+    def update(self, df):
+        self.rows += len(df)
+        self.risk_sum += float(df['flight_risk'].sum())
+        for cat, n in df['risk_category'].value_counts().items():
+            self.counts[cat] += int(n)
+        for col in FEATURES:
+            values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            self.feature_sums[col] += float(np.nansum(values))
+            self.feature_counts[col] += int(np.count_nonzero(~np.isnan(values)))
+        self.top = merge_top(self.top, df)
+        self.segments.update(df)
+        self.profile.update(df)
+        return self
+
+    @property
+    def high_risk(self):
+        return self.counts["High"]
+
+    @property
+    def avg_risk(self):
+        return self.risk_sum / self.rows if self.rows else float("nan")
+
+    @property
+    def risk_counts(self):
+        return pd.Series(self.counts, dtype="int64")
+
+    def feature_mean(self, col):
+        n = self.feature_counts[col]
+        return self.feature_sums[col] / n if n else float("nan")
+
+
+# ================= FITTED MODEL =================
+class FittedPipeline:
+    """Fitted scaler + model, plus the compiled forest used for fast scoring.
+
+    ``forest`` is None for backends other than the random forest; those
+    score single rows through sklearn. Pipelines loaded from a saved artifact
+    carry the (memory-mapped) compiled forest; the sklearn objects are read
+    from disk on first use.
+    """
+
+    def __init__(self, forest, scaler=None, model=None, meta=None, loader=None):
+        self.forest = forest
+        self.meta = meta or {}
+        self._scaler = scaler
+        self._model = model
+        self._loader = loader
+
+    @classmethod
+    def from_fit(cls, scaler, model, **meta):
+        forest = CompiledForest.from_sklearn(scaler, model) if isinstance(model, RandomForestClassifier) else None
+        return cls(forest, scaler, model, meta)
+
+    @property
+    def backend(self):
+        return self.meta.get("backend", DEFAULT_BACKEND)
+
+    def _load(self):
+        if self._model is None:
+            self._scaler, self._model = self._loader()
+
+    @property
+    def scaler(self):
+        self._load()
+        return self._scaler
+
+    @property
+    def model(self):
+        self._load()
+        return self._model
+
+    def predict(self, X):
+        """Positive-class probability for many raw feature rows (sklearn's batch path)."""
+        if not len(X):
+            # sklearn rejects empty input; a delta may only remove employees.
+            return np.zeros(0)
+        start = time.perf_counter()
+        proba = positive_proba(self.model, self.scaler.transform(X))
+        record(self.backend, "predict", len(proba), time.perf_counter() - start)
+        return proba
+
+    def remember_profile(self, summary, key):
+        """Keep the distribution of the dataset this model was trained on, for drift checks."""
+        self.meta["profile"] = summary.profile.to_dict()
+        self.meta["trained_on"] = key
+
+    def predict_one(self, values):
+        """Probability for one employee, via the compiled forest when there is one."""
+        if self.forest is not None:
+            return self.forest.predict_one(values)
+        return float(self.predict(np.asarray(values, dtype=np.float64).reshape(1, -1))[0])
+
+    @property
+    def nbytes(self):
+        size = 0 if self.forest is None else self.forest.nbytes
+        if self._model is not None:
+            size += len(pickle.dumps((self._scaler, self._model), protocol=pickle.HIGHEST_PROTOCOL))
+        return size
+
+
+def train(df, params=MODEL_PARAMS, y=None, backend=AUTO):
+    """Fit a pipeline on an imputed frame; labels default to the risk formula.
+
+    ``backend`` is a name from ``staysmart.backends.BACKENDS`` or ``AUTO`` to
+    pick one for the frame's size within the latency budget.
+    """
+    if y is None:
+        with stage("label", len(df)):
+            y = label(df)
+    backend = resolve(backend, len(df))
+    if len(np.unique(y)) < 2:
+        # Only the forest can fit (and trivially predict) a single class.
+        backend = DEFAULT_BACKEND
+    with stage("fit", len(df)):
+        scaler, model, _ = fit(df[FEATURES].to_numpy(dtype=np.float64), y, params, backend)
+    return FittedPipeline.from_fit(scaler, model, params=params, backend=backend, trained_rows=len(df))
+
+
+# ================= RESULT =================
+@dataclass
+class ScoredDataset:
+    key: str
+    df: pd.DataFrame
+    fitted: FittedPipeline
+    summary: RiskSummary
+    changes: dict = None  # delta uploads: added/updated/removed counts and whether the model was retrained
+    attributions: Attributions = None  # premium key reasons, computed by the scoring job
+
+    @property
+    def nbytes(self):
+        """Approximate resident size, used to budget the shared cache."""
+        frame = int(self.df.memory_usage(index=True, deep=True).sum())
+        reasons = 0 if self.attributions is None else self.attributions.nbytes
+        return frame + self.fitted.nbytes + self.summary.segments.nbytes + reasons
+
+    def memory_usage(self):
+        """Bytes per scored column plus the fitted model, for the dashboard."""
+        usage = self.df.memory_usage(index=True, deep=True)
+        usage["model"] = self.fitted.nbytes
+        return usage
+
+
+@dataclass
+class StreamedDataset:
+    """Result of streaming mode: the scored rows live in ``report_path`` only."""
+    key: str
+    fitted: FittedPipeline
+    summary: RiskSummary
+    report_path: str
+
+    @property
+    def nbytes(self):
+        return self.fitted.nbytes + self.summary.segments.nbytes
+
+
+def run_pipeline(data, params=MODEL_PARAMS, key=None, name=None, fitted=None,
+                 imputer=DEFAULT_STRATEGY, backend=AUTO):
+    """Score an uploaded employee file end to end.
+
+    Passing ``fitted`` (e.g. a saved artifact) scores against that model
+    instead of training one on the upload with ``backend``.
+    """
+    with stage("ingest"):
+        df = read_employees(data, name)
+    with stage("impute", len(df)):
+        impute(df, imputer)
+    with stage("label", len(df)):
+        df['left'] = label(df)
+
+    trained = fitted is None
+    fitted = fitted or train(df, params, df['left'], backend)
+    compact(score_frame(df, fitted))
+
+    key = key or pipeline_key(data, params)
+    summary = RiskSummary().update(df)
+    if trained:
+        fitted.remember_profile(summary, key)
+    return ScoredDataset(key, df, fitted, summary)
+
+
+def _staged(chunks):
+    # Attribute the parsing done inside each next() to the ingest stage.
+    chunks = iter(chunks)
+    while True:
+        with stage("ingest"):
+            chunk = next(chunks, None)
+        if chunk is None:
+            return
+        yield chunk
+
+
+def score_stream(source, report_path, params=MODEL_PARAMS, key=None, name=None,
+                 train_rows=TRAIN_ROWS, chunk_rows=CHUNK_ROWS, fitted=None,
+                 imputer=DEFAULT_STRATEGY, backend=AUTO):
+    """Score a file of any size chunk by chunk, streaming the report to disk.
+
+    Unless ``fitted`` is given, the model is fitted on the first ``train_rows``
+    rows. Every chunk is then imputed, labelled, scored, folded into the
+    summary and appended to ``report_path``, so peak memory is the training
+    sample plus one chunk.
+    """
+    trained = fitted is None
+    if trained:
+        # Impute the sample chunk by chunk, exactly as those rows are scored below.
+        sample, n = [], 0
+        for chunk in _staged(iter_employees(source, name, chunk_rows)):
+            part = chunk.iloc[:train_rows - n].copy()
+            with stage("impute", len(part)):
+                impute(part, imputer, offset=n)
+            sample.append(part)
+            n += len(part)
+            if n >= train_rows:
+                break
+        sample = pd.concat(sample, ignore_index=True)
+        fitted = train(sample, params, backend=backend)
+        del sample
+
+    summary = RiskSummary()
+    offset = 0
+    with open(report_path, "w", newline="") as out:
+        for chunk in _staged(iter_employees(source, name, chunk_rows)):
+            with stage("impute", len(chunk)):
+                impute(chunk, imputer, offset=offset)
+            with stage("label", len(chunk)):
+                chunk['left'] = label(chunk)
+            compact(score_frame(chunk, fitted))
+            summary.update(chunk)
+            with stage("report_write", len(chunk)):
+                chunk.to_csv(out, header=(offset == 0), index=False)
+            offset += len(chunk)
+
+    key = key or pipeline_key(source, params)
+    if trained:
+        # Fitted on the leading rows; the whole file stands in for its training data.
+        fitted.remember_profile(summary, key)
+    return StreamedDataset(key, fitted, summary, report_path)
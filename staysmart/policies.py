@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – workforce-wide what-if policies
+
+A scenario is a list of changes such as "overtime_hours -20%" or "set
+last_hike_months to 0 where it is above 18". Every scenario is applied to the
+whole workforce's feature matrix, the baseline and all scenarios are stacked
+into one matrix and scored with a single ``predict`` call per block, and the
+results come back as one row per scenario. Rows a scenario leaves untouched
+are not rescored.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from staysmart.diagnostics import stage
+from staysmart.schema import FEATURES, REQUIRED_COLS, RISK_BINS
+
+BASELINE = "Current workforce"
+STACK_ROWS = 2_000_000  # rows per stacked predict call, across all scenarios
+
+ACTIONS = {
+    "change %": lambda values, amount: values * (1 + amount / 100),
+    "add": lambda values, amount: values + amount,
+    "set to": lambda values, amount: np.full_like(values, amount),
+}
+
+
+@dataclass(frozen=True)
+class Change:
+    """Apply ``action`` with ``amount`` to ``feature`` for employees above/below a threshold.
+
+    The condition is on ``where`` (defaulting to ``feature`` itself); results
+    are clipped to the feature's valid range.
+    """
+    feature: str
+    action: str
+    amount: float
+    where: str = None
+    above: float = None
+    below: float = None
+
+    def __post_init__(self):
+        if self.feature not in REQUIRED_COLS:
+            raise ValueError(f"unknown feature {self.feature!r}")
+        if self.action not in ACTIONS:
+            raise ValueError(f"unknown action {self.action!r}; choose from {', '.join(ACTIONS)}")
+        if self.where is not None and self.where not in REQUIRED_COLS:
+            raise ValueError(f"unknown condition feature {self.where!r}")
+
+    def apply(self, X):
+        """Apply in place to a (rows × FEATURES) matrix."""
+        col = FEATURES.index(self.feature)
+        cond = X[:, FEATURES.index(self.where or self.feature)]
+        mask = np.ones(len(X), dtype=bool)
+        if self.above is not None:
+            mask &= cond > self.above
+        if self.below is not None:
+            mask &= cond < self.below
+        lo, hi = REQUIRED_COLS[self.feature]
+        X[mask, col] = np.clip(ACTIONS[self.action](X[mask, col], self.amount), lo, hi)
+        return X
+
+
+DEFAULT_SCENARIOS = {
+    "Cut overtime by 20%": [Change("overtime_hours", "change %", -20)],
+    "Hike everyone waiting over 18 months": [Change("last_hike_months", "set to", 0, above=18)],
+    "Engagement +1 for the least engaged": [Change("engagement_score", "add", 1, below=5)],
+    "Cap overtime at 40 hours": [Change("overtime_hours", "set to", 40, above=40)],
+}
+
+
+def scenarios_from_table(table):
+    """Group editor rows (scenario, feature, action, amount, where, above, below) by scenario name."""
+    scenarios = {}
+    for row in table.to_dict("records"):
+        if not row.get("scenario") or not row.get("feature") or pd.isna(row.get("amount")):
+            continue
+        optional = {k: (None if pd.isna(row.get(k)) or row.get(k) == "" else row[k]) for k in ("where", "above", "below")}
+        scenarios.setdefault(row["scenario"], []).append(
+            Change(row["feature"], row["action"], float(row["amount"]), **optional)
+        )
+    return scenarios
+
+
+def scenarios_table(scenarios):
+    """Inverse of ``scenarios_from_table``, for seeding the editor."""
+    return pd.DataFrame([
+        {"scenario": name, "feature": c.feature, "action": c.action, "amount": c.amount,
+         "where": c.where, "above": c.above, "below": c.below}
+        for name, changes in scenarios.items() for c in changes
+    ])
+
+
+def simulate(fitted, X, scenarios, risk=None, stack_rows=STACK_ROWS):
+    """High-risk count and average risk for the baseline and every scenario.
+
+    ``X`` is the workforce's raw feature matrix and ``risk`` its existing
+    ``flight_risk`` scores, if already known (otherwise the baseline is scored
+    too). Rows are processed in blocks so that baseline + scenarios for one
+    block fit in ``stack_rows`` rows, and each block is scored with one
+    ``fitted.predict`` call.
+    """
+    names = [BASELINE] + list(scenarios)
+    X = np.asarray(X, dtype=np.float64)
+    known = None if risk is None else np.asarray(risk, dtype=np.float64)
+    block = max(1, stack_rows // len(names))
+    high = np.zeros(len(names), dtype=np.int64)
+    risk_sum = np.zeros(len(names))
+
+    with stage("policy_simulation", len(X) * len(names)):
+        for start in range(0, len(X), block):
+            base = X[start:start + block]
+            # Only rows a scenario actually changes are rescored; the rest
+            # keep their baseline score.
+            stacked, changed = [base if known is None else base[:0]], []
+            for changes in scenarios.values():
+                variant = base.copy()
+                for change in changes:
+                    change.apply(variant)
+                rows = np.flatnonzero((variant != base).any(axis=1))
+                stacked.append(variant[rows])
+                changed.append(rows)
+            # Same rounding and High cut-off as score_frame/categorize.
+            stacked = np.concatenate(stacked)
+            scores = np.round(fitted.predict(stacked) * 100) if len(stacked) else np.empty(0)
+            if known is None:
+                baseline, offset = scores[:len(base)], len(base)
+            else:
+                baseline, offset = known[start:start + len(base)], 0
+            block_risk = np.tile(baseline, (len(names), 1))
+            for i, rows in enumerate(changed, start=1):
+                block_risk[i, rows] = scores[offset:offset + len(rows)]
+                offset += len(rows)
+            high += (block_risk > RISK_BINS[-2]).sum(axis=1)
+            risk_sum += block_risk.sum(axis=1)
+
+    result = pd.DataFrame({"scenario": names, "high_risk": high,
+                           "avg_risk": risk_sum / len(X) if len(X) else np.nan})
+    result["high_risk_change"] = result["high_risk"] - high[0]
+    return result
+
+
+def with_costs(result, replacement_cost):
+    """Add the Attrition Cost Estimation total and its change for each scenario."""
+    cost = result["high_risk"] * replacement_cost
+    return result.assign(attrition_cost=cost, cost_change=cost - cost.iloc[0])
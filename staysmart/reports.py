@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – scored report export
+
+Reports are written to disk in row chunks, never as one in-memory string,
+and each file is named after the scored dataset's content key so it is built
+at most once and then served to every later download of the same data.
+"""
+
+import gzip
+import os
+import tempfile
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from staysmart.schema import DTYPES
+
+EXPORT_CHUNK_ROWS = 100_000
+REPORT_MAX_BYTES = int(os.environ.get("STAYSMART_REPORT_MB", 4096)) * 2**20
+
+# Columns of a scored report typed as in the scored DataFrame, so a report
+# read back chunk by chunk never infers a different type per chunk.
+REPORT_DTYPES = {**DTYPES, "left": "uint8", "flight_risk": "uint8", "risk_category": "category"}
+
+# format -> (file extension, MIME type)
+REPORT_FORMATS = {
+    "csv": (".csv", "text/csv"),
+    "csv.gz": (".csv.gz", "application/gzip"),
+    "parquet": (".parquet", "application/vnd.apache.parquet"),
+}
+
+
+def _chunks(source, chunk_rows):
+    """Row chunks of a DataFrame, or of a CSV report already on disk."""
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunk_rows):
+            yield source.iloc[start:start + chunk_rows]
+    else:
+        yield from pd.read_csv(source, chunksize=chunk_rows, dtype=REPORT_DTYPES)
+
+
+def _write_csv(chunks, f):
+    for i, chunk in enumerate(chunks):
+        chunk.to_csv(f, header=(i == 0), index=False)
+
+
+def _file_schema(schema):
+    # Category codes are int8 or int16 depending on each chunk's categories; use int32 for all.
+    return pa.schema(
+        [f.with_type(pa.dictionary(pa.int32(), f.type.value_type)) if pa.types.is_dictionary(f.type) else f
+         for f in schema],
+        metadata=schema.metadata,
+    )
+
+
+def _write_parquet(chunks, path):
+    writer = None
+    try:
+        for chunk in chunks:
+            if writer is None:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                table = table.cast(_file_schema(table.schema))
+                writer = pq.ParquetWriter(path, table.schema, compression="zstd")
+            else:
+                table = pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def write_report(source, path, fmt="csv", chunk_rows=EXPORT_CHUNK_ROWS):
+    """Write ``source`` (scored DataFrame or CSV report path) to ``path`` as ``fmt``.
+
+    The file appears under its final name only once complete, so a reader
+    never sees a partial report.
+    """
+    if fmt not in REPORT_FORMATS:
+        raise ValueError(f"unknown report format {fmt!r}; choose from {', '.join(REPORT_FORMATS)}")
+    # Sessions are threads of one process: every writer needs its own scratch file.
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=f"{os.path.basename(path)}.", suffix=".tmp")
+    os.close(fd)
+    chunks = _chunks(source, chunk_rows)
+    try:
+        if fmt == "parquet":
+            _write_parquet(chunks, tmp)
+        elif fmt == "csv.gz":
+            with gzip.open(tmp, "wt", compresslevel=6, newline="") as f:
+                _write_csv(chunks, f)
+        else:
+            with open(tmp, "w", newline="") as f:
+                _write_csv(chunks, f)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return path
+
+
+def report_file(source, report_dir, key, fmt="csv", max_bytes=REPORT_MAX_BYTES):
+    """Path of the ``fmt`` report for dataset ``key``, writing it on first request.
+
+    Writing a new report prunes ``report_dir`` to ``max_bytes``, least
+    recently requested reports first.
+    """
+    ext, _ = REPORT_FORMATS[fmt]
+    path = os.path.join(report_dir, f"{key[:16]}{ext}")
+    if isinstance(source, str) and os.path.abspath(source) == os.path.abspath(path):
+        os.utime(path)
+        return path
+    if os.path.exists(path):
+        os.utime(path)
+        return path
+    os.makedirs(report_dir, exist_ok=True)
+    write_report(source, path, fmt)
+    prune_reports(report_dir, max_bytes, keep=[path, source if isinstance(source, str) else None])
+    return path
+
+
+def prune_reports(report_dir, max_bytes=REPORT_MAX_BYTES, keep=()):
+    """Delete the least recently used reports until ``report_dir`` holds at most ``max_bytes``.
+
+    Paths in ``keep`` are never deleted. Scratch files still being written
+    are left alone.
+    """
+    keep = {os.path.abspath(p) for p in keep if p}
+    files = [
+        (entry.stat().st_mtime, entry.path, entry.stat().st_size)
+        for entry in os.scandir(report_dir)
+        if entry.is_file() and not entry.name.endswith(".tmp")
+    ]
+    total = sum(size for _, _, size in files)
+    for _, path, size in sorted(files):
+        if total <= max_bytes:
+            break
+        if os.path.abspath(path) in keep:
+            continue
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
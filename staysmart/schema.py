@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – employee data schema shared by ingestion and scoring"""
+
+# Model features and their valid ranges.
+REQUIRED_COLS = {
+    'satisfaction_score': (1,10),
+    'engagement_score': (1,10),
+    'last_hike_months': (0,36),
+    'overtime_hours': (0,80),
+    'distance_from_home': (1,40)
+}
+FEATURES = list(REQUIRED_COLS)
+
+# Identifier / grouping columns carried through to the report, first alias wins.
+ID_COL = "employee_id"
+DIMENSIONS = ["department", "location", "manager"]
+# Delta uploads flag departed employees in this column (yes/true/1).
+REMOVED_COL = "removed"
+COLUMN_ALIASES = {
+    "employee_id": ["employee_id", "emp_id", "employee_code", "employee_no", "id"],
+    "department": ["department", "dept", "department_name"],
+    "location": ["location", "work_location", "office", "site", "city"],
+    "manager": ["manager", "manager_name", "manager_id", "reports_to", "supervisor"],
+}
+# Only delta uploads and database pulls look for the removed flag, so an
+# attrition column such as "Exited" in a full upload is never taken for one.
+DELTA_ALIASES = {**COLUMN_ALIASES, REMOVED_COL: ["removed", "deleted", "exited", "terminated"]}
+
+# Compact parse types; features stay float so missing cells can be imputed.
+DTYPES = dict.fromkeys(FEATURES, "float32")
+DTYPES[ID_COL] = "string"
+DTYPES[REMOVED_COL] = "string"
+DTYPES.update(dict.fromkeys(DIMENSIONS, "category"))
+
+RISK_BINS = [0,49,69,100]
+RISK_LABELS = ["Low","Medium","High"]
+
+
+def normalize_column(name):
+    return str(name).lower().replace(" ", "_")
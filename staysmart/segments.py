@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – segment cube for drill-downs
+
+The scored rows are rolled up once into one cell per observed combination of
+the upload's dimension columns (department, location, manager), holding the
+employee count per risk category and the flight-risk sum. Any filter on those
+dimensions is answered by summing matching cells, so drill-downs touch a
+table the size of the org chart rather than the workforce.
+"""
+
+import numpy as np
+import pandas as pd
+
+from staysmart.schema import DIMENSIONS, RISK_LABELS
+
+UNSET = "(not set)"
+MEASURES = RISK_LABELS + ["risk_sum"]
+
+
+class SegmentCube:
+    """Risk counts and flight-risk sums per observed dimension combination.
+
+    Built with ``update`` one scored frame (or streamed chunk) at a time;
+    the dimensions are those present in the first frame.
+    """
+
+    def __init__(self):
+        self.dims = None
+        self.cells = None
+
+    def update(self, df):
+        if self.dims is None:
+            self.dims = [d for d in DIMENSIONS if d in df.columns]
+        m = pd.DataFrame({label: (df["risk_category"] == label).to_numpy(np.int64) for label in RISK_LABELS})
+        m["risk_sum"] = df["flight_risk"].to_numpy(np.int64)
+        for d in self.dims:
+            values = df[d].astype(object).to_numpy()
+            m[d] = np.where(pd.isna(values), UNSET, values)
+        cells = self._rollup(m)
+        self.cells = cells if self.cells is None else self._rollup(pd.concat([self.cells, cells], ignore_index=True))
+        return self
+
+    def _rollup(self, m):
+        if not self.dims:
+            return m[MEASURES].sum().to_frame().T
+        cells = m.groupby(self.dims, sort=True, observed=True)[MEASURES].sum().reset_index()
+        return cells.astype(dict.fromkeys(self.dims, "category"))
+
+    @property
+    def nbytes(self):
+        return 0 if self.cells is None else int(self.cells.memory_usage(deep=True).sum())
+
+    def values(self, dim):
+        """Distinct values of ``dim`` in the data, for filter widgets."""
+        return list(self.cells[dim].cat.categories) if self.cells is not None and dim in self.dims else []
+
+    def _select(self, filters):
+        cells = self.cells
+        for dim, chosen in (filters or {}).items():
+            if chosen and dim in self.dims:
+                cells = cells[cells[dim].isin(chosen)]
+        return cells
+
+    def totals(self, filters=None):
+        """Counts per risk category, employees and average risk for the filtered segment."""
+        sums = dict.fromkeys(MEASURES, 0)
+        if self.cells is not None:
+            sums.update({k: int(v) for k, v in self._select(filters)[MEASURES].sum().items()})
+        employees = sum(sums[label] for label in RISK_LABELS)
+        return sums | {"employees": employees, "avg_risk": sums["risk_sum"] / employees if employees else float("nan")}
+
+    def breakdown(self, dim, filters=None):
+        """One row per value of ``dim`` within the filtered segment, most high-risk first."""
+        columns = [dim, "employees"] + RISK_LABELS + ["avg_risk"]
+        if self.cells is None or dim not in self.dims:
+            return pd.DataFrame(columns=columns)
+        rolled = self._select(filters).groupby(dim, sort=False, observed=True)[MEASURES].sum()
+        employees = rolled[RISK_LABELS].sum(axis=1)
+        out = rolled.assign(employees=employees, avg_risk=rolled["risk_sum"] / employees.where(employees > 0))
+        return out.reset_index()[columns].sort_values(
+            ["High", "employees"], ascending=False, kind="stable"
+        ).reset_index(drop=True)
@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – local scoring service for HRMS integrations
+
+Loads a saved model once and scores employees sent as JSON over HTTP or a
+Unix socket:
+
+    python -m staysmart.server --model models/ --port 8765
+    python -m staysmart.server --model models/ --socket /tmp/staysmart.sock
+
+``POST /score`` takes one employee object, a list of them, or
+``{"employees": [...]}``, keyed by feature name (any spelling the upload
+parser accepts). Requests that arrive together are coalesced into one
+micro-batch and scored in a single call, so many small HRMS calls cost
+about as much as one bulk call. ``GET /stats`` reports throughput, latency
+percentiles and batch sizes; ``GET /health`` the model.
+"""
+
+import argparse
+import json
+import os
+import queue
+import socketserver
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from staysmart.artifacts import load_artifact
+from staysmart.pipeline import categorize
+from staysmart.schema import COLUMN_ALIASES, FEATURES, ID_COL, REQUIRED_COLS, normalize_column
+
+MAX_BATCH_ROWS = 4096
+MAX_WAIT_SECONDS = float(os.environ.get("STAYSMART_BATCH_WAIT_MS", 2)) / 1000
+LATENCY_WINDOW = 10_000  # most recent requests kept for percentiles
+MAX_BODY_BYTES = 64 * 2**20
+
+
+# ================= REQUESTS =================
+def parse_employees(payload):
+    """Employee ids (or None) and a float64 feature matrix from a request body."""
+    single = isinstance(payload, dict) and "employees" not in payload
+    records = [payload] if single else payload.get("employees") if isinstance(payload, dict) else payload
+    if not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+        raise ValueError("expected an employee object, a list of them, or {\"employees\": [...]}")
+
+    ids = []
+    X = np.empty((len(records), len(FEATURES)), dtype=np.float64)
+    for i, record in enumerate(records):
+        fields = {normalize_column(k): v for k, v in record.items()}
+        missing = [col for col in FEATURES if fields.get(col) is None]
+        if missing:
+            raise ValueError(f"employee {i}: missing {', '.join(missing)}")
+        try:
+            X[i] = [float(fields[col]) for col in FEATURES]
+        except (TypeError, ValueError):
+            raise ValueError(f"employee {i}: features must be numbers") from None
+        for col, value in zip(FEATURES, X[i]):
+            lo, hi = REQUIRED_COLS[col]
+            if not lo <= value <= hi:  # also rejects NaN and ±inf
+                raise ValueError(f"employee {i}: {col} must be between {lo} and {hi}, got {value}")
+        ids.append(next((fields[a] for a in COLUMN_ALIASES[ID_COL] if a in fields), None))
+    return ids, X, single
+
+
+# ================= STATS =================
+class ServiceStats:
+    """Request and batch counters plus a window of recent request latencies."""
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.started = time.time()
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self.batch_rows = 0
+        self.largest_batch = 0
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def request(self, rows, seconds):
+        with self._lock:
+            self.requests += 1
+            self.rows += rows
+            self._latencies.append(seconds)
+
+    def batch(self, rows):
+        with self._lock:
+            self.batches += 1
+            self.batch_rows += rows
+            self.largest_batch = max(self.largest_batch, rows)
+
+    def snapshot(self):
+        with self._lock:
+            uptime = time.time() - self.started
+            latencies = np.array(self._latencies) * 1000
+            p50, p90, p99 = np.percentile(latencies, [50, 90, 99]) if len(latencies) else (None,) * 3
+            return {
+                "uptime_s": round(uptime, 1),
+                "requests": self.requests,
+                "employees": self.rows,
+                "requests_per_s": round(self.requests / uptime, 1) if uptime else 0.0,
+                "employees_per_s": round(self.rows / uptime, 1) if uptime else 0.0,
+                "latency_ms": {
+                    "p50": p50 and round(p50, 2), "p90": p90 and round(p90, 2), "p99": p99 and round(p99, 2),
+                    "window": len(latencies),
+                },
+                "batches": self.batches,
+                "mean_batch_rows": round(self.batch_rows / self.batches, 1) if self.batches else 0.0,
+                "mean_requests_per_batch": round(self.requests / self.batches, 2) if self.batches else 0.0,
+                "largest_batch_rows": self.largest_batch,
+            }
+
+
+# ================= MICRO-BATCHING =================
+class MicroBatcher:
+    """Coalesces concurrent scoring calls into one prediction per batch.
+
+    A batch closes when it holds ``max_rows`` rows or ``max_wait`` seconds
+    after its first request arrived, whichever comes first; a single bulk
+    request larger than ``max_rows`` is scored on its own. Forests are scored
+    through the memory-mapped compiled forest, so server processes share one
+    copy of it in the page cache. If a batch fails, its requests are retried
+    one by one, so only the request at fault gets the error.
+    """
+
+    def __init__(self, fitted, max_rows=MAX_BATCH_ROWS, max_wait=MAX_WAIT_SECONDS, stats=None):
+        self.fitted = fitted
+        self.max_rows = max_rows
+        self.max_wait = max_wait
+        self.stats = stats or ServiceStats()
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, name="staysmart-batcher", daemon=True)
+        self._thread.start()
+
+    def score(self, X):
+        """Flight risk (0–100) and risk category for each row of ``X``; blocks until scored."""
+        future = Future()
+        self._queue.put((X, future))
+        return future.result()
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def _collect(self):
+        first = self._queue.get()
+        if first is None:
+            return None
+        batch, rows = [first], len(first[0])
+        deadline = time.perf_counter() + self.max_wait
+        while rows < self.max_rows:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.perf_counter()))
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)  # finish this batch, then stop
+                break
+            batch.append(item)
+            rows += len(item[0])
+        return batch
+
+    def _score(self, X):
+        forest = self.fitted.forest
+        proba = forest.predict(X) if forest is not None else self.fitted.predict(X)
+        risk = (proba * 100).round(0).astype(np.uint8)
+        return risk, np.asarray(categorize(risk).astype(object))
+
+    def _loop(self):
+        while (batch := self._collect()) is not None:
+            try:
+                X = np.concatenate([x for x, _ in batch]) if len(batch) > 1 else batch[0][0]
+                risk, categories = self._score(X)
+                self.stats.batch(len(X))
+            except Exception as exc:
+                if len(batch) == 1:
+                    batch[0][1].set_exception(exc)
+                    continue
+                for x, future in batch:
+                    try:
+                        future.set_result(self._score(x))
+                        self.stats.batch(len(x))
+                    except Exception as exc:
+                        future.set_exception(exc)
+                continue
+            start = 0
+            for x, future in batch:
+                future.set_result((risk[start:start + len(x)], categories[start:start + len(x)]))
+                start += len(x)
+
+
+# ================= HTTP =================
+class ScoringHandler(BaseHTTPRequestHandler):
+    server_version = "StaySmartScoring/1"
+    protocol_version = "HTTP/1.1"  # keep-alive, so HRMS clients can reuse connections
+
+    def address_string(self):
+        # Unix-socket peers have no host/port.
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _reply(self, status, body, close=False):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if close:
+            self.send_header("Connection", "close")  # also ends this handler's keep-alive loop
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/stats":
+            self._reply(200, self.server.batcher.stats.snapshot())
+        elif self.path == "/health":
+            fitted = self.server.batcher.fitted
+            self._reply(200, {"status": "ok", "model": fitted.meta.get("version"), "backend": fitted.backend})
+        else:
+            self._reply(404, {"error": f"no such endpoint {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/score":
+            self._reply(404, {"error": f"no such endpoint {self.path}"}, close=True)
+            return
+        start = time.perf_counter()
+        # Replies that leave the body unread close the connection: on keep-alive
+        # the leftover bytes would be parsed as the next request.
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length < 0:
+                raise ValueError
+        except ValueError:
+            self._reply(400, {"error": "Content-Length must be a non-negative integer"}, close=True)
+            return
+        if length > MAX_BODY_BYTES:
+            self._reply(413, {"error": f"request body over {MAX_BODY_BYTES // 2**20} MB; split it up"}, close=True)
+            return
+        try:
+            ids, X, single = parse_employees(json.loads(self.rfile.read(length) or b"null"))
+        except (ValueError, RecursionError) as exc:  # includes malformed or too deeply nested JSON
+            self._reply(400, {"error": str(exc) if isinstance(exc, ValueError) else "JSON nested too deeply"})
+            return
+        try:
+            risk, categories = self.server.batcher.score(X) if len(X) else ([], [])
+        except Exception as exc:
+            self._reply(500, {"error": f"scoring failed: {exc}"})
+            return
+        results = [
+            {ID_COL: emp_id, "flight_risk": int(r), "risk_category": c}
+            for emp_id, r, c in zip(ids, risk, categories)
+        ]
+        self._reply(200, results[0] if single else {"employees": results})
+        self.server.batcher.stats.request(len(X), time.perf_counter() - start)
+
+
+class ScoringServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # an HRMS may open many connections at once
+
+    def __init__(self, address, batcher, verbose=False):
+        self.batcher = batcher
+        self.verbose = verbose
+        super().__init__(address, ScoringHandler)
+
+
+class UnixScoringServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, path, batcher, verbose=False):
+        self.batcher = batcher
+        self.verbose = verbose
+        if os.path.exists(path):
+            os.remove(path)
+        super().__init__(path, ScoringHandler)
+
+
+def make_server(fitted, host="127.0.0.1", port=8765, socket_path=None, verbose=False, **batching):
+    """A scoring server for ``fitted``, on TCP ``host:port`` or the Unix socket ``socket_path``."""
+    if fitted.forest is None:
+        fitted.model  # load the sklearn scaler and model now, not on the first request
+    batcher = MicroBatcher(fitted, **batching)
+    if socket_path:
+        return UnixScoringServer(socket_path, batcher, verbose)
+    return ScoringServer((host, port), batcher, verbose)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m staysmart.server", description="Serve flight-risk scores to HRMS integrations.")
+    parser.add_argument("--model", required=True, help="saved model (artifact directory, or models directory for the latest version)")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port (default: 8765)")
+    parser.add_argument("--socket", help="listen on this Unix socket instead of TCP")
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH_ROWS, help=f"rows per micro-batch (default: {MAX_BATCH_ROWS})")
+    parser.add_argument("--max-wait-ms", type=float, default=MAX_WAIT_SECONDS * 1000, help="how long a batch waits for company (default: %(default)s)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+
+    fitted = load_artifact(args.model)
+    server = make_server(fitted, args.host, args.port, args.socket, args.verbose,
+                         max_rows=args.max_batch, max_wait=args.max_wait_ms / 1000)
+    where = args.socket or f"http://{args.host}:{server.server_address[1]}"
+    print(f"scoring with model {fitted.meta.get('version')} ({fitted.backend}) on {where}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.batcher.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
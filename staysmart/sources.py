@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – SQL data source with pooled connections and incremental pulls
+
+An alternative to re-exporting the employee table to CSV for every upload:
+``SQLSource`` selects only the feature, id and dimension columns the
+pipeline uses straight from a table, fetching in ``chunk_rows`` batches
+through connections borrowed from a small pool. With an ``updated_at``
+column and an employee id to merge by, it pulls only the rows changed since
+the previous pull, and a ``DatabaseFeed`` merges those into the scored
+workforce as a delta upload (``staysmart.delta``), so a refresh moves and
+rescores only changed rows.
+
+Any DB-API 2.0 driver works; SQLite is the built-in stand-in:
+
+    source = SQLSource(sqlite_pool("hr.db"), "employees")
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import NamedTuple
+
+import pandas as pd
+
+from staysmart.backends import AUTO, resolve
+from staysmart.delta import apply_delta, removed_mask
+from staysmart.diagnostics import stage
+from staysmart.impute import DEFAULT_STRATEGY
+from staysmart.ingest import CHUNK_ROWS, select_columns
+from staysmart.pipeline import MODEL_PARAMS, pipeline_key, run_pipeline
+from staysmart.schema import DELTA_ALIASES, DTYPES, ID_COL
+
+POOL_SIZE = int(os.environ.get("STAYSMART_DB_POOL", 4))
+UPDATED_COL = "updated_at"
+
+
+# ================= CONNECTIONS =================
+class ConnectionPool:
+    """Up to ``size`` DB-API connections from ``connect()``, opened on demand and reused."""
+
+    def __init__(self, connect, size=POOL_SIZE):
+        self._connect = connect
+        self._idle = queue.LifoQueue()
+        self._slots = threading.Semaphore(size)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection; waits while all ``size`` are in use."""
+        with self._slots:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+            try:
+                yield conn
+            except BaseException:
+                conn.close()  # it may be mid-transaction; don't hand it out again
+                raise
+            conn.rollback()  # end the read transaction so later pulls see new rows
+            self._idle.put(conn)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def sqlite_pool(path, size=POOL_SIZE):
+    """Read-only SQLite connections to ``path`` that may be used from any thread."""
+    uri = f"file:{os.path.abspath(path)}?mode=ro"
+    return ConnectionPool(lambda: sqlite3.connect(uri, uri=True, check_same_thread=False), size)
+
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+# ================= SOURCE =================
+class Watermark(NamedTuple):
+    """Where an incremental pull stopped: the newest ``updated_col`` value and the ids stamped with it.
+
+    The next pull starts at ``value`` inclusive, so rows committed later with
+    the same timestamp are not missed, and skips ``ids`` it has already seen.
+    """
+
+    value: object
+    ids: frozenset
+
+
+class SQLSource:
+    """Employee rows of one table, optionally pulled incrementally on ``updated_col``.
+
+    ``placeholder`` is the driver's parameter marker ("?" for SQLite, "%s"
+    for psycopg). Drivers whose default cursor buffers the whole result
+    (psycopg) take a ``cursor`` factory returning a server-side (named)
+    cursor instead.
+    """
+
+    def __init__(self, pool, table, updated_col=UPDATED_COL, chunk_rows=CHUNK_ROWS, placeholder="?", cursor=None):
+        self.pool = pool
+        self.table = table
+        self.updated_col = updated_col
+        self.chunk_rows = chunk_rows
+        self.placeholder = placeholder
+        self._cursor = cursor or (lambda conn: conn.cursor())
+
+    def header(self):
+        with self.pool.connection() as conn:
+            cur = conn.cursor()
+            cur.execute(f"SELECT * FROM {_quote(self.table)} WHERE 1 = 0")
+            names = [d[0] for d in cur.description]
+            cur.close()
+        return names
+
+    def _query(self, since):
+        header = self.header()
+        columns = select_columns(header, DELTA_ALIASES)
+        # Changed rows are merged by id; without one every pull reads the whole table.
+        incremental = self.updated_col in header and ID_COL in columns.values()
+        select = list(columns) + ([self.updated_col] if incremental and self.updated_col not in columns else [])
+        sql = f"SELECT {', '.join(map(_quote, select))} FROM {_quote(self.table)}"
+        params = ()
+        if incremental:
+            if since is not None:
+                sql += f" WHERE {_quote(self.updated_col)} >= {self.placeholder}"
+                params = (since.value,)
+            sql += f" ORDER BY {_quote(self.updated_col)}"
+        return sql, params, select, columns, incremental
+
+    def chunks(self, since=None):
+        """Yield ``(chunk, watermark)``: compact frames of rows changed since ``since``.
+
+        ``watermark`` is the Watermark reached so far, to pass as ``since``
+        next time; None when the table has no ``updated_col`` or no employee
+        id column (then every pull reads the whole table).
+        """
+        sql, params, select, columns, incremental = self._query(since)
+        dtypes = {src: DTYPES[dst] for src, dst in columns.items()}
+        id_src = next((src for src, dst in columns.items() if dst == ID_COL), None)
+        watermark = since if incremental else None
+        with self.pool.connection() as conn:
+            cur = self._cursor(conn)
+            try:
+                cur.execute(sql, params)
+                while rows := cur.fetchmany(self.chunk_rows):
+                    raw = pd.DataFrame.from_records(rows, columns=select)
+                    if incremental:
+                        stamps = raw[self.updated_col]
+                        if since is not None:
+                            fresh = ~((stamps == since.value) & raw[id_src].isin(since.ids))
+                            raw, stamps = raw[fresh], stamps[fresh]
+                        if raw.empty:
+                            continue
+                        # Rows arrive in updated_col order, so the newest stamp is the last one.
+                        latest = stamps.iloc[-1]
+                        ids = frozenset(raw[id_src][stamps == latest])
+                        if watermark is not None and latest == watermark.value:
+                            ids |= watermark.ids
+                        watermark = Watermark(latest, ids)
+                    yield raw[list(columns)].astype(dtypes).rename(columns=columns), watermark
+            finally:
+                cur.close()
+
+    def pull(self, since=None):
+        """Every row changed since ``since`` as one frame, one row per employee id, plus the new watermark."""
+        frames, watermark = [], since
+        with stage("db_pull"):
+            for chunk, watermark in self.chunks(since):
+                frames.append(chunk)
+        if not frames:
+            return None, watermark
+        df = pd.concat(frames, ignore_index=True)
+        if ID_COL in df.columns:
+            # An id updated twice keeps its latest row; rows without an id are left alone.
+            df = df[~(df[ID_COL].duplicated(keep="last") & df[ID_COL].notna())].reset_index(drop=True)
+        return df, watermark
+
+
+# ================= SCORED FEED =================
+class DatabaseFeed:
+    """Scored workforces kept in step with a SQLSource, one per set of options.
+
+    The first refresh for a set of model and imputation options scores the
+    whole table; later refreshes with the same options pull only rows
+    updated since that set's last pull and merge them in by employee id
+    (rows whose ``removed`` flag is set drop the employee). Each option set
+    keeps its own scored dataset and watermark, so sessions using different
+    options never rescore each other's results.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self._states = {}  # pipeline_key of the options -> (scored, watermark)
+        self._lock = threading.Lock()
+
+    def current(self, options):
+        scored, _ = self._states.get(pipeline_key(b"", options), (None, None))
+        return scored
+
+    def refresh(self, options, params=MODEL_PARAMS, imputer=DEFAULT_STRATEGY, backend=AUTO):
+        """Pull and score what changed; returns the (possibly unchanged) scored dataset."""
+        state = pipeline_key(b"", options)
+        with self._lock:
+            base, watermark = self._states.get(state, (None, None))
+            df, watermark = self.source.pull(watermark)
+            if watermark is None:
+                base = None  # no incremental pulls: every pull is the whole table
+            if df is None:
+                if base is None:
+                    raise ValueError(f"table {self.source.table!r} has no employees")
+                return base
+            # Key by the model that will actually be trained, not by "auto".
+            backend = resolve(backend, len(df) if base is None else len(base.df))
+            content = pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()
+            key = pipeline_key(content + (base.key.encode() if base else b""), {**options, "backend": backend})
+            if base is None:
+                df = df[~removed_mask(df)].reset_index(drop=True)
+                scored = run_pipeline(df, params, key, self.source.table, imputer=imputer, backend=backend)
+            else:
+                scored = apply_delta(base, df, self.source.table, params, key, imputer, backend)
+            self._states[state] = (scored, watermark)
+            return scored
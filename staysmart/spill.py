@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – on-disk spill store for scored datasets evicted from memory
+
+When the shared cache (``staysmart.cache``) is over a session's or the
+global memory budget, the least recently used scored datasets are written
+here instead of being dropped, one directory per dataset:
+
+- ``rows.arrow``: the scored rows as an uncompressed Arrow IPC file, memory-
+  mapped on reload so nothing is parsed or decompressed
+- ``model/``: the fitted pipeline as a saved artifact (``staysmart.artifacts``)
+- ``state.pkl``: the summary aggregates, delta changes and key reasons
+
+A later interaction with the dataset reloads it in well under the time it
+took to score. The store keeps at most ``max_bytes`` on disk, pruning the
+least recently used datasets; the cache treats a pruned dataset as a miss.
+"""
+
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+
+import pyarrow.feather as feather
+
+from staysmart.artifacts import load_artifact, save_artifact
+from staysmart.diagnostics import stage
+from staysmart.pipeline import ScoredDataset
+
+
+def _size(path):
+    return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file()) + sum(
+        _size(entry.path) for entry in os.scandir(path) if entry.is_dir()
+    )
+
+
+class DiskSpill:
+    """Scored datasets spilled under ``directory``, at most ``max_bytes`` of them."""
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.sha256(key.encode()).hexdigest()[:32])
+
+    def dump(self, key, value):
+        """Write ``value`` if it is a ScoredDataset; returns whether it is on disk."""
+        if not isinstance(value, ScoredDataset):
+            return False  # streamed datasets and attributions are small or cheap to rebuild
+        path = self._path(key)
+        if os.path.isdir(path):
+            os.utime(path)  # spilled before and reloaded; rows for a key never change
+            return True
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        tmp = tempfile.mkdtemp(dir=self.directory, prefix=f"{os.path.basename(path)}.tmp-")
+        try:
+            with stage("spill", len(value.df)):
+                feather.write_feather(value.df, os.path.join(tmp, "rows.arrow"), compression="uncompressed")
+                save_artifact(value.fitted, tmp, "model")
+                with open(os.path.join(tmp, "state.pkl"), "wb") as f:
+                    state = (value.key, value.summary, value.changes, value.attributions)
+                    pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.rename(tmp, path)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            if os.path.isdir(path):
+                return True  # another process spilled the same rows first
+            raise
+        self._prune()
+        return True
+
+    def load(self, key):
+        """The spilled dataset for ``key``, or None if it was never spilled or was pruned."""
+        path = self._path(key)
+        try:
+            with open(os.path.join(path, "state.pkl"), "rb") as f:
+                stored, summary, changes, attributions = pickle.load(f)
+            with stage("reload"):
+                df = feather.read_table(os.path.join(path, "rows.arrow"), memory_map=True).to_pandas()
+                fitted = load_artifact(os.path.join(path, "model"))
+                fitted.model  # read now: pruning may remove the directory while the dataset is in use
+        except FileNotFoundError:
+            return None
+        os.utime(path)
+        return ScoredDataset(stored, df, fitted, summary, changes, attributions)
+
+    def _prune(self):
+        entries = [
+            (entry.stat().st_mtime, entry.path, _size(entry.path))
+            for entry in os.scandir(self.directory)
+            if entry.is_dir() and ".tmp-" not in entry.name
+        ]
+        total = sum(size for _, _, size in entries)
+        for _, path, size in sorted(entries)[:-1]:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        # Empty it but keep the directory itself, which may have been created private.
+        if os.path.isdir(self.directory):
+            for entry in os.scandir(self.directory):
+                shutil.rmtree(entry.path, ignore_errors=True)
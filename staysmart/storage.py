@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – private on-disk directories and the workspaces they hold
+
+Spilled datasets, delta snapshots and saved models are read back with
+``pickle``/``joblib``, which run code from the file. Anyone who can write
+into such a directory can therefore run code in the app, so they live only
+in directories this user owns and nobody else can open, by default under
+``STAYSMART_DATA_DIR`` (``~/.staysmart``).
+
+Data kept between sessions (delta snapshots, risk history) belongs to a
+workspace. License keys are shared by every customer of a plan, so a
+workspace is identified by a random key issued the first time a company
+opens the dashboard, not by anything a user types in.
+"""
+
+import hashlib
+import os
+import secrets
+import stat
+
+DATA_DIR = os.environ.get("STAYSMART_DATA_DIR") or os.path.join(os.path.expanduser("~"), ".staysmart")
+ACCOUNTS_DIR = os.path.join(DATA_DIR, "accounts")
+
+
+def private_dir(path):
+    """``path`` as a directory only this user can use, created with mode 0700 if missing.
+
+    Raises PermissionError if it already exists as a symlink, belongs to
+    another user, or is open to group or others.
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode):
+        raise PermissionError(f"{path} is not a directory")
+    if hasattr(os, "getuid") and (info.st_uid != os.getuid() or info.st_mode & 0o077):
+        raise PermissionError(
+            f"{path} must belong to this user and be closed to everyone else (chmod 700); "
+            "files in it are loaded as code"
+        )
+    return path
+
+
+# ================= WORKSPACES =================
+def account_id(workspace_key):
+    """Directory-safe account id for a workspace key; the key itself is never stored."""
+    return hashlib.sha256(workspace_key.strip().encode()).hexdigest()[:32]
+
+
+def new_account(accounts_dir=ACCOUNTS_DIR):
+    """Issue a workspace: returns its key (for the user to keep) and account id."""
+    workspace_key = secrets.token_urlsafe(18)
+    account = account_id(workspace_key)
+    open(os.path.join(private_dir(accounts_dir), account), "x").close()
+    return workspace_key, account
+
+
+def find_account(workspace_key, accounts_dir=ACCOUNTS_DIR):
+    """The account id of an issued workspace key, or None."""
+    account = account_id(workspace_key)
+    return account if os.path.isfile(os.path.join(accounts_dir, account)) else None
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – synthetic workforce data for benchmarks and demos"""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+from staysmart.schema import REQUIRED_COLS
+
+DEPARTMENTS = ["Sales", "Engineering", "Operations", "Finance", "HR", "Support", "Marketing", "Legal"]
+LOCATIONS = ["Bengaluru", "Pune", "Hyderabad", "Chennai", "Delhi", "Mumbai"]
+
+
+def synthetic_employees(n, seed=0, missing_rate=0.0, offset=0):
+    """``n`` employees with every feature inside its ``REQUIRED_COLS`` range.
+
+    Scores are correlated the way real exports tend to be (low satisfaction
+    goes with low engagement and long waits for a hike). ``missing_rate`` blanks
+    that fraction of feature cells to exercise imputation; ``offset`` continues
+    employee ids when a large file is generated in pieces.
+    """
+    rng = np.random.default_rng([seed, offset])
+    mood = rng.normal(0, 1, n)
+
+    def bounded(col, centre, spread, noise):
+        lo, hi = REQUIRED_COLS[col]
+        return np.clip(np.rint(centre + spread * noise), lo, hi)
+
+    df = pd.DataFrame({
+        "Employee ID": np.char.add("E", np.arange(offset, offset + n).astype(str)),
+        "Department": pd.Categorical.from_codes(rng.integers(0, len(DEPARTMENTS), n), DEPARTMENTS),
+        "Location": pd.Categorical.from_codes(rng.integers(0, len(LOCATIONS), n), LOCATIONS),
+        "Satisfaction Score": bounded("satisfaction_score", 6.5, 2.0, mood),
+        "Engagement Score": bounded("engagement_score", 6.5, 1.6, 0.7 * mood + 0.7 * rng.normal(0, 1, n)),
+        "Last Hike Months": bounded("last_hike_months", 14, 8, -0.5 * mood + rng.normal(0, 1, n)),
+        "Overtime Hours": bounded("overtime_hours", 0, 1, rng.gamma(2.0, 9.0, n)),
+        "Distance From Home": bounded("distance_from_home", 0, 1, rng.gamma(2.5, 5.0, n)),
+    })
+
+    if missing_rate:
+        for col in df.columns[3:]:
+            df.loc[rng.random(n) < missing_rate, col] = np.nan
+    return df
+
+
+def write_synthetic_csv(path, n, seed=0, missing_rate=0.0, chunk_rows=1_000_000):
+    """Write ``n`` synthetic employees to CSV in bounded-memory pieces."""
+    writer = None
+    try:
+        for start in range(0, n, chunk_rows):
+            part = synthetic_employees(min(chunk_rows, n - start), seed, missing_rate, offset=start)
+            table = pa.Table.from_pandas(part, preserve_index=False)
+            if writer is None:
+                writer = pacsv.CSVWriter(path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    return path
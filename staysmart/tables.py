@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – ranked and paginated views of scored employees
+
+Nothing here sorts a whole frame to show a handful of rows: rankings use
+``np.partition`` to find the cut-off value in linear time and only order the
+rows that make it onto the list or page. Ties keep their original row order,
+so the same data always yields the same list.
+"""
+
+import numpy as np
+import pandas as pd
+
+from staysmart.schema import DIMENSIONS, FEATURES, ID_COL
+
+TOP_N = 25
+PAGE_SIZE = 50
+TOP_COLUMNS = [ID_COL] + DIMENSIONS + ["flight_risk", "risk_category"] + FEATURES
+
+
+def smallest(keys, k):
+    """Positions of the ``k`` smallest ``keys`` in ascending order, ties by position."""
+    keys = np.asarray(keys, dtype=np.float64)
+    k = min(k, len(keys))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(keys):
+        kth = np.partition(keys, k - 1)[k - 1]
+        below = np.flatnonzero(keys < kth)
+        ties = np.flatnonzero(keys == kth)[:k - len(below)]
+        idx = np.concatenate([below, ties])
+    else:
+        idx = np.arange(len(keys))
+    return idx[np.lexsort((idx, keys[idx]))]
+
+
+def _sort_keys(values, descending):
+    values = np.asarray(values, dtype=np.float64)
+    # NaN sorts last either way.
+    return np.where(np.isnan(values), np.inf, -values if descending else values)
+
+
+def top_risk(df, n=TOP_N):
+    """The ``n`` highest flight-risk rows of ``df``, highest first."""
+    rows = smallest(_sort_keys(df["flight_risk"].to_numpy(), True), n)
+    return df.iloc[rows][[c for c in TOP_COLUMNS if c in df.columns]].reset_index(drop=True)
+
+
+def merge_top(top, chunk, n=TOP_N):
+    """Fold a scored chunk into a running top-``n`` list (for chunked scoring)."""
+    chunk_top = top_risk(chunk, n)
+    return chunk_top if top is None else top_risk(pd.concat([top, chunk_top], ignore_index=True), n)
+
+
+def filter_rows(df, segments=None, categories=(), search=""):
+    """Positions of rows matching every given filter; empty filters match all.
+
+    ``segments`` maps dimension columns to the values to keep.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    for dim, chosen in (segments or {}).items():
+        if chosen and dim in df.columns:
+            mask &= df[dim].isin(chosen).to_numpy()
+    if categories:
+        mask &= df["risk_category"].isin(categories).to_numpy()
+    if search and ID_COL in df.columns:
+        mask &= df[ID_COL].str.contains(search, case=False, regex=False).fillna(False).to_numpy(dtype=bool)
+    return np.flatnonzero(mask)
+
+
+def page_rows(df, page=0, page_size=PAGE_SIZE, sort_by="flight_risk", descending=True, rows=None):
+    """Positions of one page of ``df`` (restricted to ``rows``) sorted by ``sort_by``.
+
+    Returns the positions and the number of matching rows. Only the rows up
+    to the end of the requested page are ordered.
+    """
+    rows = np.arange(len(df)) if rows is None else rows
+    values = df[sort_by]
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.cat.codes.where(values.notna())
+    keys = _sort_keys(values.to_numpy(dtype=np.float64, na_value=np.nan)[rows], descending)
+    order = smallest(keys, (page + 1) * page_size)[page * page_size:]
+    return rows[order], len(rows)
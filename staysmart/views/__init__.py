@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – page modules, imported only when their step is shown"""
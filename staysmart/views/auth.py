@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – step 2: subscription payment and license check"""
+
+import streamlit as st
+
+from staysmart.storage import find_account, new_account
+from staysmart.views.styles import LOGO
+
+# ================= LICENSE KEYS =================
+LICENSE_KEYS = {
+    "standard": ["SSAI-STD-1A2B-3C4D"],
+    "premium": ["SSAI-PRM-X8LQ-4R2Z-M9KP"]
+}
+
+
+def render():
+    tier = st.session_state.tier
+    price_per_employee = 100 if tier == "standard" else 150
+    price = f"₹{price_per_employee} / employee / month"
+
+    st.markdown(LOGO, unsafe_allow_html=True)
+
+    st.markdown(f"""
+    <div class="plan-card fade" style="max-width:620px;margin:auto;">
+        <span class="badge {'standard' if tier=='standard' else 'premium'}">
+            {tier.upper()} PLAN
+        </span>
+        <p style="margin-top:10px;font-weight:600;color:#cbd5f5">{price}</p>
+    """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="req-box">
+        <h4>📄 Employee Data Required</h4>
+        <ul>
+            <li>Satisfaction Score (1–10)</li>
+            <li>Engagement Score (1–10)</li>
+            <li>Months since last salary hike</li>
+            <li>Overtime hours per month</li>
+            <li>Distance from home (km)</li>
+        </ul>
+        <p style="font-size:14px;color:#94a3b8">
+        If some fields are missing, the system will estimate them.
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # ================= PAYMENT SIMULATION =================
+    st.markdown("""
+    <div class="payment-box fade">
+        <h3>🏢 Company Subscription Payment</h3>
+        <p style="color:#cbd5f5">
+        Enter company billing details to proceed. (Simulation only)
+        </p>
+    """, unsafe_allow_html=True)
+
+    employees = st.number_input("Number of Employees", min_value=1, value=10)
+    months = st.number_input("Subscription Duration (months)", min_value=1, value=3)
+
+    total_amount = employees * months * price_per_employee
+
+    st.markdown(f"""
+    <div style="margin-top:10px; color:#cbd5f5;">
+        <b>Payment Summary:</b><br>
+        Employees: {employees} <br>
+        Duration: {months} months <br>
+        <b>Total Amount:</b> ₹{total_amount}
+    </div>
+    """, unsafe_allow_html=True)
+
+    company_name = st.text_input("Company Name")
+    company_email = st.text_input("Company Email")
+    gstin = st.text_input("GSTIN (Optional)")
+
+    if st.button("Pay Now"):
+        st.session_state.paid = True
+        st.success("Payment Successful ✓")
+
+    # This ensures license key appears only after payment is done
+    if st.session_state.paid:
+        key = st.text_input(
+            "Enter License Key",
+            placeholder="SSAI-XXXX-XXXX-XXXX",
+            type="password"
+        )
+        workspace_key = st.text_input(
+            "Workspace Key",
+            type="password",
+            help="Issued the first time your company opens the dashboard; enter it to reach your delta "
+                 "snapshots and risk history again. Leave blank to start a new workspace."
+        )
+
+        if st.button("Verify & Open Dashboard"):
+            if key.strip().upper() in [k.upper() for k in LICENSE_KEYS[tier]]:
+                # Data kept between sessions (delta snapshots, risk history) is
+                # scoped to a workspace. License keys are shared by every customer
+                # of a plan, so the workspace is identified by a key we issue.
+                if workspace_key.strip():
+                    account = find_account(workspace_key)
+                    if account is None:
+                        st.error("❌ Unknown workspace key")
+                        st.stop()
+                else:
+                    st.session_state.new_workspace_key, account = new_account()
+                st.session_state.account = account
+                st.session_state.authenticated = True
+                st.session_state.step = "dashboard"
+                st.session_state.nav = "Dashboard"
+                st.rerun()
+            else:
+                st.error("❌ Invalid license key for selected plan")
+
+    st.markdown("</div>", unsafe_allow_html=True)
+    st.stop()
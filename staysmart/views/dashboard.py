@@ -0,0 +1,817 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – step 3: the scoring dashboard
+
+Imported only once a session is authenticated, so the landing and payment
+pages never load pandas, scikit-learn or matplotlib.
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+import uuid
+
+import numpy as np
+import streamlit as st
+
+from staysmart.artifacts import list_versions, load_artifact, save_artifact
+from staysmart.attributions import attribute
+from staysmart.background import JobRunner
+from staysmart.backends import AUTO, BACKENDS, FIT_BUDGET_SECONDS, latency_table, resolve
+from staysmart.cache import LRUCache
+from staysmart.charts import bar_spec, pie_spec, risk_chart_png
+from staysmart.delta import (RETRAIN_FRACTION, apply_delta, latest_snapshot, load_snapshot, save_snapshot, snapshot_key,
+                             snapshot_rows)
+from staysmart.diagnostics import StageRecorder, activate, stage
+from staysmart.drift import KS_RETRAIN, PSI_RETRAIN, PSI_WATCH, Profile, drift_report, needs_retraining
+from staysmart.history import ROSE_BY, append_scored, months, risk_rose, trend
+from staysmart.impute import DEFAULT_STRATEGY, IMPUTERS
+from staysmart.ingest import UPLOAD_TYPES, count_rows
+from staysmart.pipeline import MODEL_PARAMS, TRAIN_ROWS, StreamedDataset, pipeline_key, run_pipeline, score_stream
+from staysmart.policies import ACTIONS, DEFAULT_SCENARIOS, scenarios_from_table, scenarios_table, simulate, with_costs
+from staysmart.reports import REPORT_FORMATS, report_file
+from staysmart.schema import DIMENSIONS, FEATURES, ID_COL, REMOVED_COL, RISK_LABELS
+from staysmart.sources import DatabaseFeed, SQLSource, sqlite_pool
+from staysmart.spill import DiskSpill
+from staysmart.storage import DATA_DIR, private_dir
+from staysmart.tables import PAGE_SIZE, filter_rows, page_rows
+from staysmart.views.styles import LOGO
+
+# ================= SCORING (cached) =================
+SPILL_DIR = os.environ.get("STAYSMART_SPILL_DIR")
+
+@st.cache_resource
+def pipeline_cache():
+    # Shared by all sessions; bounded by STAYSMART_CACHE_MB of scored data, and
+    # by STAYSMART_SESSION_CACHE_MB per session. Datasets over either budget
+    # spill to disk and reload on the session's next run: to STAYSMART_SPILL_DIR
+    # (which must be private to this user), else to a fresh private temp
+    # directory removed at exit. Spilled files are unpickled, so never a
+    # predictable shared path.
+    if SPILL_DIR:
+        spill_dir = private_dir(SPILL_DIR)
+    else:
+        spill_dir = tempfile.mkdtemp(prefix="staysmart-spill-")
+        atexit.register(shutil.rmtree, spill_dir, True)
+    return LRUCache(
+        max_bytes=int(os.environ.get("STAYSMART_CACHE_MB", 1024)) * 2**20,
+        session_bytes=int(os.environ.get("STAYSMART_SESSION_CACHE_MB", 512)) * 2**20,
+        spill=DiskSpill(spill_dir, int(os.environ.get("STAYSMART_SPILL_MB", 10240)) * 2**20),
+    )
+
+@st.cache_resource
+def scoring_jobs():
+    # Shared worker pool, so sessions never fit models on their script threads.
+    return JobRunner()
+
+# Small uploads finish within this wait and render in the same run.
+SCORING_WAIT_SECONDS = float(os.environ.get("STAYSMART_SCORING_WAIT_S", 2))
+DIAGNOSTICS_JOBS = 5  # background jobs whose stages the diagnostics panel keeps
+
+def submit_job(key, fn, recorder):
+    # With diagnostics on, a job records into a recorder of its own, kept in
+    # session state: its stages outlive the run that submitted it and still
+    # reach the panel after the new results swap in. Only the recorder is kept,
+    # never the Job, whose future holds the finished dataset outside the cache.
+    job = scoring_jobs().submit(key, fn, recorder and StageRecorder(**recorder.context, job=key[:16]))
+    if recorder and job.recorder is not None:
+        jobs = st.session_state.setdefault("diagnostics_jobs", {})
+        jobs.pop(key, None)
+        jobs[key] = job.recorder
+        for old in list(jobs)[:-DIAGNOSTICS_JOBS]:
+            del jobs[old]
+    return job
+
+# Fragments take cache and job keys, never datasets: Streamlit keeps each
+# fragment's arguments for as long as the session is connected, which would
+# hold evicted or spilled datasets in memory outside the cache's budgets.
+def cached_dataset(key):
+    scored = pipeline_cache().get(key, owner=st.session_state.session_uid)
+    if scored is None:
+        st.rerun()  # pruned from the spill store: rescore it
+    return scored
+
+@st.fragment(run_every="1s")
+def scoring_progress(job_key, name):
+    job = scoring_jobs().get(job_key)
+    if job is None or job.done:
+        st.rerun()
+    done = ", ".join(f"{stage_name} {rows:,} rows" for stage_name, rows in job.rows.items())
+    st.info(f"⏳ Scoring {name} in the background: {job.current} ({job.elapsed:.0f}s)" + (f" · {done}" if done else ""))
+
+# Streaming mode keeps only aggregates in memory and writes scored rows to disk.
+REPORT_DIR = os.environ.get("STAYSMART_REPORT_DIR", os.path.join(tempfile.gettempdir(), "staysmart-reports"))
+STREAM_THRESHOLD_MB = int(os.environ.get("STAYSMART_STREAM_THRESHOLD_MB", 200))
+
+# Each full upload with employee IDs is kept here, one directory per workspace,
+# as the base for delta uploads. Snapshot models are loaded with joblib, so the
+# directory must be private to this user (see staysmart.storage).
+SNAPSHOT_DIR = os.environ.get("STAYSMART_SNAPSHOT_DIR", os.path.join(DATA_DIR, "snapshots"))
+
+# STAYSMART_DB_PATH points the dashboard at an HR database (SQLite) as an
+# alternative to uploads; refreshes pull only rows changed since the last one.
+DB_PATH = os.environ.get("STAYSMART_DB_PATH")
+DB_TABLE = os.environ.get("STAYSMART_DB_TABLE", "employees")
+
+@st.cache_resource
+def database_feed():
+    # Shared, so every session sees (and refreshes) the same scored workforce.
+    return DatabaseFeed(SQLSource(sqlite_pool(DB_PATH), DB_TABLE))
+
+# Scored runs are appended here for trend charts (Parquet, one directory per
+# workspace, partitioned by month and series): database pulls always, uploads
+# when the user records them as the full workforce. Private to this user, as
+# it holds employee ids.
+HISTORY_DIR = os.environ.get("STAYSMART_HISTORY_DIR", os.path.join(DATA_DIR, "history"))
+UPLOAD_SERIES = "uploads"
+
+# Saved model versions (see staysmart.artifacts); scoring against one skips training.
+MODEL_DIR = os.environ.get("STAYSMART_MODEL_DIR", "models")
+TRAIN_ON_UPLOAD = "Train on this upload"
+
+@st.cache_resource
+def saved_model(version):
+    # Memory-mapped, so every session and worker process shares one copy.
+    return load_artifact(os.path.join(MODEL_DIR, version))
+
+IMPUTER_LABELS = {
+    "random": "Seeded estimate around the typical range",
+    "median": "Column median",
+    "department_median": "Department median",
+    "knn": "Nearest similar employees",
+}
+
+# ================= CHARTS =================
+# Drawn from the category counts only; STAYSMART_NATIVE_CHARTS=1 makes
+# browser-drawn Vega-Lite charts the default instead of cached PNGs.
+NATIVE_CHARTS = os.environ.get("STAYSMART_NATIVE_CHARTS") == "1"
+CHART_SPECS = {"bar": bar_spec, "pie": pie_spec}
+
+def risk_chart(kind, counts, native):
+    if native:
+        st.vega_lite_chart(spec=CHART_SPECS[kind](counts), width="stretch")
+    else:
+        st.image(risk_chart_png(kind, counts), width="stretch")
+
+# ================= EXPORT =================
+EXPORT_LABELS = {"csv": "CSV", "csv.gz": "CSV (gzip)", "parquet": "Parquet"}
+
+def export_report(key, fmt, session):
+    # Runs only when the button is clicked; the file is written once per dataset and format.
+    # Streamlit serves downloads from memory, keeping one copy per distinct content. Holding
+    # that same bytes object in the shared cache (as a memoryview, which has nbytes) lets
+    # repeated clicks reuse it instead of reading the file again, within the session budget.
+    # Like fragments, the button's callback gets only the key, and finds the dataset on click.
+    cache = pipeline_cache()
+
+    def read():
+        scored = cache.get(key, owner=session)
+        if scored is None:
+            raise RuntimeError("the scored data is no longer cached; score the file again")
+        source = scored.report_path if isinstance(scored, StreamedDataset) else scored.df
+        with open(report_file(source, REPORT_DIR, key, fmt), "rb") as f:
+            return memoryview(f.read())
+    return cache.get_or_create(f"{key}:{fmt}", read, session).obj
+
+# ================= EMPLOYEE TABLE =================
+# A fragment, so paging and filtering rerun only this table; the browser is
+# sent one page of rows at a time however many employees were scored.
+SORT_COLUMNS = ["flight_risk"] + FEATURES
+
+@st.fragment
+def employee_table(key, reasons=False):
+    st.markdown("## 🗂️ Scored Employees")
+    scored = cached_dataset(key)
+    df = scored.df
+    attributions = scored.attributions if reasons else None
+
+    dims = [d for d in DIMENSIONS if d in df.columns]
+    filter_cols = st.columns(len(dims) + 2)
+    segments = {d: col.multiselect(d.title(), list(df[d].cat.categories)) for d, col in zip(dims, filter_cols)}
+    categories = filter_cols[-2].multiselect("Risk Category", RISK_LABELS)
+    search = filter_cols[-1].text_input("Employee ID contains") if ID_COL in df.columns else ""
+
+    s1, s2, s3 = st.columns(3)
+    sort_by = s1.selectbox("Sort by", SORT_COLUMNS, format_func=lambda col: col.replace("_", " ").title())
+    descending = s2.toggle("Highest first", value=True)
+    rows = filter_rows(df, segments, categories, search)
+    pages = max(1, -(-len(rows) // PAGE_SIZE))
+    page = s3.number_input(f"Page (of {pages:,})", min_value=1, max_value=pages, value=1) - 1
+
+    positions, total = page_rows(df, page, PAGE_SIZE, sort_by, descending, rows)
+    view = df.iloc[positions]
+    if attributions is not None:
+        view = view.assign(key_reasons=attributions.reasons(positions))
+    st.dataframe(view, width="stretch", hide_index=True)
+    if total:
+        first = page * PAGE_SIZE + 1
+        st.caption(f"Showing {first:,}–{first + len(view) - 1:,} of {total:,} matching employees")
+    else:
+        st.caption("No employees match these filters")
+# ================= SEGMENT DRILL-DOWN =================
+# Answered from the segment cube built alongside the scores, never by
+# rescanning rows, so any filter combination is instant.
+@st.fragment
+def segment_drilldown(key, replacement_cost=None):
+    cube = cached_dataset(key).summary.segments
+    if not cube.dims:
+        return
+    st.markdown("## 🧭 Segment Drill-down")
+
+    filter_cols = st.columns(len(cube.dims))
+    filters = {d: col.multiselect(d.title(), cube.values(d), key=f"segment_{d}") for d, col in zip(cube.dims, filter_cols)}
+
+    totals = cube.totals(filters)
+    m = st.columns(3 if replacement_cost is None else 4)
+    m[0].metric("Employees in segment", f"{totals['employees']:,}")
+    m[1].metric("High Risk in segment", f"{totals['High']:,}")
+    m[2].metric("Avg Risk in segment", f"{totals['avg_risk']:.1f}%")
+    if replacement_cost is not None:
+        m[3].metric("High-Risk Cost", f"₹{totals['High'] * replacement_cost:,.0f}")
+
+    by = st.selectbox("Break down by", cube.dims, format_func=str.title, key="segment_by")
+    table = cube.breakdown(by, filters)
+    if replacement_cost is not None:
+        table = table.assign(high_risk_cost=table["High"] * replacement_cost)
+    st.dataframe(
+        table,
+        width="stretch",
+        hide_index=True,
+        column_config={
+            "avg_risk": st.column_config.NumberColumn(format="%.1f%%"),
+            "high_risk_cost": st.column_config.NumberColumn(format="₹%d"),
+        }
+    )
+
+
+# ================= RISK TRENDS =================
+# Queried from the monthly history store with column and filter pushdown;
+# only the aggregates and the risers list are ever held in memory.
+TREND_METRICS = {"avg_risk": "Average risk (%)", "High": "High-risk employees"}
+
+@st.fragment
+def risk_trends(dims, history_dir):
+    stored = months(history_dir)
+    if not stored:
+        return
+    st.markdown("## 🗓️ Risk Trends")
+
+    c1, c2, c3 = st.columns(3)
+    by = c1.selectbox("Trend by", [None] + dims, format_func=lambda d: "Whole workforce" if d is None else d.title(),
+                      key="trend_by")
+    metric = c2.selectbox("Show", list(TREND_METRICS), format_func=TREND_METRICS.get, key="trend_metric")
+    since = c3.selectbox("Since", stored, key="trend_since")
+
+    table = trend(history_dir, by, since=since)
+    if by:
+        chart = table.pivot_table(index="month", columns=by, values=metric, observed=True)
+    else:
+        chart = table.set_index("month")[[metric]].rename(columns=TREND_METRICS)
+    st.line_chart(chart, y_label=TREND_METRICS[metric])
+
+    rose = risk_rose(history_dir)
+    if len(stored) > 1:
+        st.markdown(f"### ⬆️ Risk rose since {stored[-2]}")
+        if rose.empty:
+            st.caption(f"No employee's risk rose by {ROSE_BY} points or more.")
+        else:
+            st.dataframe(rose.drop(columns="compared_with"), width="stretch", hide_index=True)
+
+
+# ================= WHAT-IF POLICIES =================
+# Edits are collected in a form, so the workforce is rescored only when the
+# policies are submitted; changing the cost inputs just re-prices the result.
+@st.fragment
+def policy_simulator(key, replacement_cost):
+    st.markdown("## 🧪 What-if Policies")
+    st.caption("Rows with the same scenario name are applied together. Conditions test the "
+               "`where` feature (the changed feature if blank) before the change.")
+
+    with st.form("policies"):
+        table = st.data_editor(
+            scenarios_table(DEFAULT_SCENARIOS),
+            num_rows="dynamic",
+            hide_index=True,
+            width="stretch",
+            column_config={
+                "feature": st.column_config.SelectboxColumn(options=FEATURES, required=True),
+                "action": st.column_config.SelectboxColumn(options=list(ACTIONS), required=True),
+                "where": st.column_config.SelectboxColumn(options=FEATURES),
+            }
+        )
+        submitted = st.form_submit_button("Compare policies")
+
+    if submitted or st.session_state.get("policy_key") != key:
+        try:
+            scenarios = scenarios_from_table(table)
+        except ValueError as e:
+            st.error(f"Invalid policy: {e}")
+            return
+        scored = cached_dataset(key)
+        X = scored.df[FEATURES].to_numpy(dtype=np.float64)
+        with st.spinner("Rescoring the workforce..."):
+            st.session_state.policy_result = simulate(scored.fitted, X, scenarios, risk=scored.df["flight_risk"])
+        st.session_state.policy_key = key
+
+    st.dataframe(
+        with_costs(st.session_state.policy_result, replacement_cost),
+        width="stretch",
+        hide_index=True,
+        column_config={
+            "avg_risk": st.column_config.NumberColumn(format="%.1f%%"),
+            "attrition_cost": st.column_config.NumberColumn(format="₹%d"),
+            "cost_change": st.column_config.NumberColumn(format="₹%d"),
+        }
+    )
+
+
+# ================= FLIGHT RISK SIMULATION =================
+# Runs as a fragment: moving a slider reruns only this section, and scoring
+# goes through the compiled forest instead of DataFrame + predict_proba.
+@st.fragment
+def flight_risk_simulator(key):
+    st.markdown("## ✈️ Flight Risk Simulator (Try it)")
+    fitted = cached_dataset(key).fitted
+
+    colA, colB = st.columns(2)
+    with colA:
+        sat = st.slider("Satisfaction Score", 1, 10, 7)
+        eng = st.slider("Engagement Score", 1, 10, 6)
+        hike = st.slider("Months Since Last Hike", 0, 36, 10)
+
+    with colB:
+        ot = st.slider("Overtime Hours/Month", 0, 80, 12)
+        dist = st.slider("Distance from Home (km)", 1, 40, 12)
+
+    sim_prob = fitted.predict_one([sat, eng, hike, ot, dist]) * 100
+
+    st.markdown(f"""
+    <div class="compare fade">
+        <h3>Simulator Result</h3>
+        <p style="color:#cbd5f5; font-size:16px; line-height:1.7;">
+            Flight Risk Score: <b>{sim_prob:.1f}%</b>
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+def render():
+    # ================= DIAGNOSTICS (opt-in) =================
+    # STAYSMART_DIAGNOSTICS=1 or ?diagnostics=1 records wall time and peak memory
+    # per pipeline stage, shown at the bottom and logged as JSON lines.
+    if "session_uid" not in st.session_state:
+        st.session_state.session_uid = uuid.uuid4().hex[:12]
+    diagnostics_on = (
+        os.environ.get("STAYSMART_DIAGNOSTICS") == "1"
+        or st.query_params.get("diagnostics") == "1"
+    )
+    recorder = StageRecorder(session=st.session_state.session_uid, tier=st.session_state.tier) if diagnostics_on else None
+    activate(recorder)
+
+    st.markdown(LOGO, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="dashboard-header fade">
+    <h1>StaySmart AI Dashboard</h1>
+    <p style="font-size:18px">AI-powered employee attrition insights</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    if workspace_key := st.session_state.get("new_workspace_key"):
+        st.info(f"🔑 Your workspace key is `{workspace_key}`. Keep it: enter it with your license key next time "
+                "to reach this workspace's delta snapshots and risk history.")
+
+    # ================= FILE UPLOAD =================
+    database = DB_PATH is not None and st.radio(
+        "Data source", ["Upload a file", "HR database"], horizontal=True
+    ) == "HR database"
+    file = None
+    if not database:
+        file = st.file_uploader("📂 Upload Employee CSV", type=UPLOAD_TYPES, help="CSV, Parquet or Feather")
+        if not file:
+            st.info("Upload employee data to begin analysis")
+            st.stop()
+
+    # ================= OPTIONS =================
+    opt1, opt2, opt3 = st.columns(3)
+    delta_upload = stream_upload = False
+    record_history = database  # the HR table is the whole workforce
+    with opt3:
+        if database:
+            refresh = st.button("🔄 Pull changes from the database")
+        else:
+            delta_upload = st.toggle(
+                "Only changes since the last upload",
+                help=f"Upload just new, changed or removed employees (with a '{REMOVED_COL}' column set to yes), "
+                     "matched by employee ID. Only those rows are rescored; the model is retrained only if "
+                     f"more than {RETRAIN_FRACTION:.0%} of the workforce changed."
+            )
+            stream_upload = st.toggle(
+                "Streaming mode (bounded memory)",
+                value=file.size > STREAM_THRESHOLD_MB * 2**20,
+                disabled=delta_upload,
+                help="Score the file in chunks and write the report to disk instead of holding every row in memory."
+            ) and not delta_upload
+            record_history = st.toggle(
+                "Record in risk trends",
+                help="Turn on for the full workforce (or a delta merged into it), not for samples or test files. "
+                     "The latest recorded upload of each month stands for that month."
+            )
+    with opt1:
+        model_version = st.selectbox(
+            "Model", [TRAIN_ON_UPLOAD] + list_versions(MODEL_DIR)[::-1], disabled=delta_upload or database
+        )
+        if model_version == TRAIN_ON_UPLOAD or delta_upload or database:
+            model_version = None
+        backend = st.selectbox(
+            "Model type",
+            [AUTO] + list(BACKENDS),
+            format_func=lambda name: "Automatic (fits the latency budget)" if name == AUTO else BACKENDS[name].label,
+            disabled=model_version is not None,
+            help="Automatic keeps the random forest unless training it on this file would exceed "
+                 f"{FIT_BUDGET_SECONDS:.0f}s, then switches to a faster model."
+        )
+    with opt2:
+        imputer = st.selectbox(
+            "Fill missing data with",
+            list(IMPUTERS),
+            index=list(IMPUTERS).index(DEFAULT_STRATEGY),
+            format_func=lambda name: IMPUTER_LABELS.get(name, name)
+        )
+
+    cache = pipeline_cache()
+    session = st.session_state.session_uid
+    premium = st.session_state.tier == "premium"
+    # Snapshots and history belong to the workspace (or, without one, to this
+    # session), so a delta never merges into another company's upload.
+    account = st.session_state.get("account") or session
+    snapshot_dir = os.path.join(private_dir(SNAPSHOT_DIR), account)
+    history_dir = os.path.join(private_dir(HISTORY_DIR), account)
+    if database:
+        # One feed shared by every session: a session's first run and the
+        # refresh button pull only the rows changed since the last pull.
+        feed = database_feed()
+        options = {"model": MODEL_PARAMS, "backend": backend, "impute": imputer}
+        # One job per option set: sessions with other options get their own scores.
+        job_key, name = f"database:{DB_TABLE}:{pipeline_key(b'', options)[:16]}", DB_TABLE
+        scored = None if refresh or "db_synced" not in st.session_state else feed.current(options)
+
+        def work():
+            with stage("scoring"):
+                scored = feed.refresh(options, MODEL_PARAMS, imputer, backend)
+            if premium and scored.attributions is None:
+                scored.attributions = attribute(scored.fitted, scored.df)
+            with stage("history"):
+                append_scored(history_dir, scored, series=DB_TABLE)
+            return cache.put(scored.key, scored, session)
+    else:
+        # Hash each upload once; widget reruns reuse the digest instead of rehashing.
+        data = file.getvalue()
+        options = {"model": MODEL_PARAMS, "backend": backend, "impute": imputer, "stream": stream_upload,
+                   "artifact": model_version, "delta": delta_upload}
+        if st.session_state.get("upload_id") != (file.file_id, options):
+            st.session_state.upload_id = (file.file_id, options)
+            # A delta is pinned to the snapshot that was latest when it arrived,
+            # so the snapshot it produces is never mistaken for its own base.
+            base_path = latest_snapshot(snapshot_dir) if delta_upload else None
+            st.session_state.delta_base = base_path
+            keyed = dict(options)
+            if base_path:
+                keyed["base"] = snapshot_key(base_path)
+            if model_version is None:
+                # Key by the model that will actually be trained: the automatic
+                # choice depends on this process's latency estimates.
+                rows = snapshot_rows(base_path) if base_path else count_rows(data, file.name)
+                keyed["backend"] = resolve(backend, min(rows, TRAIN_ROWS) if stream_upload else rows)
+            st.session_state.upload_backend = keyed["backend"]
+            st.session_state.upload_key = pipeline_key(data, keyed)
+        upload_key = st.session_state.upload_key
+        backend = st.session_state.upload_backend
+        base_path = st.session_state.delta_base
+        if delta_upload and base_path is None:
+            st.warning("Delta uploads are merged into the last full upload with an employee ID column. "
+                       "Upload the full workforce file first.")
+            st.stop()
+
+        saved = saved_model(model_version) if model_version else None
+
+        def build():
+            # Runs on a background worker; diagnostics stages reach the job's recorder (see submit_job).
+            with stage("scoring"):
+                if delta_upload:
+                    base = cache.get_or_create(snapshot_key(base_path), lambda: load_snapshot(base_path), session)
+                    scored = apply_delta(base, data, file.name, MODEL_PARAMS, upload_key, imputer, backend)
+                elif not stream_upload:
+                    scored = run_pipeline(data, MODEL_PARAMS, upload_key, file.name, saved, imputer, backend)
+                else:
+                    os.makedirs(REPORT_DIR, exist_ok=True)
+                    report_path = os.path.join(REPORT_DIR, f"{upload_key[:16]}.csv")
+                    scored = score_stream(data, report_path, MODEL_PARAMS, upload_key, file.name, fitted=saved,
+                                          imputer=imputer, backend=backend)
+            if premium and not stream_upload:
+                scored.attributions = attribute(scored.fitted, scored.df)
+            if not stream_upload and ID_COL in scored.df.columns:
+                with stage("snapshot", len(scored.df)):
+                    save_snapshot(scored, snapshot_dir)
+            return scored
+
+        job_key, name = upload_key, file.name
+        scored = cache.get(upload_key, owner=session)
+        if isinstance(scored, StreamedDataset) and not os.path.exists(scored.report_path):
+            cache.discard(upload_key)  # its report was pruned from REPORT_DIR: score it again
+            scored = None
+
+        def work():
+            return cache.get_or_create(upload_key, build, session)
+
+    # Stale-while-revalidate: new data is scored in the background while
+    # the page keeps showing the last results this session saw, then swaps.
+    if scored is None:
+        job = submit_job(job_key, work, recorder)
+        if job.wait(SCORING_WAIT_SECONDS):
+            if job.error:
+                scoring_jobs().forget(job_key)
+                st.error(f"Scoring failed: {job.error}")
+                st.stop()
+            scored = job.result()
+            if database:
+                st.session_state.db_synced = True
+        else:
+            scoring_progress(job_key, name)
+            scored = cache.get(st.session_state.get("shown_key"), owner=session)
+            if scored is None:
+                st.stop()
+            st.info("Showing the previous results until the new scores are ready.")
+    st.session_state.shown_key = scored.key
+    streaming = isinstance(scored, StreamedDataset)
+    # Recorded here rather than by the scoring job, so turning the toggle on
+    # after scoring still records the upload; append_scored skips repeats.
+    if record_history and not database and scored.key == upload_key and st.session_state.get("recorded") != scored.key:
+        with stage("history"):
+            append_scored(history_dir, scored, series=UPLOAD_SERIES)
+        st.session_state.recorded = scored.key
+
+    summary = scored.summary
+    fitted = scored.fitted
+    st.caption(
+        f"Model: {BACKENDS[fitted.backend].label}"
+        + (f", trained on {fitted.meta['trained_rows']:,} rows" if "trained_rows" in fitted.meta else "")
+    )
+    if not streaming and scored.changes:
+        changes = scored.changes
+        st.caption(
+            f"Changes merged: {changes['added']:,} added, {changes['updated']:,} updated, "
+            f"{changes['removed']:,} removed ({changes['fraction']:.1%} of the workforce) · "
+            + ("model retrained on the merged workforce" if changes["retrained"] else "only changed rows rescored")
+        )
+
+    if model_version is None and st.button("💾 Save trained model"):
+        path = save_artifact(scored.fitted, MODEL_DIR)
+        st.success(f"Model saved as version {os.path.basename(path)}")
+
+    # ================= PLAN FEATURE LIMIT =================
+    if st.session_state.tier == "standard":
+        st.warning("You are using STANDARD plan. Upgrade to Premium for Attrition Cost & Retention Tips.")
+
+    # ================= METRICS =================
+    c1,c2,c3 = st.columns(3)
+    c1.metric("Employees", summary.rows)
+    c2.metric("High Risk", summary.high_risk)
+    c3.metric("Avg Risk", f"{summary.avg_risk:.1f}%")
+
+    # ================= DRIFT =================
+    # Compared from histograms kept with the summary and with the model, so
+    # this costs the same for five thousand rows as for five million.
+    if "profile" in fitted.meta and fitted.meta.get("trained_on") != scored.key:
+        report = drift_report(Profile.from_dict(fitted.meta["profile"]), summary.profile)
+        retrain = needs_retraining(report)
+        if retrain:
+            st.warning("⚠️ This data has drifted from what the model was trained on. Retraining is recommended.")
+        with st.expander("🩺 Drift vs. training data", expanded=retrain):
+            st.dataframe(
+                report,
+                width="stretch",
+                hide_index=True,
+                column_config={
+                    "psi": st.column_config.NumberColumn("PSI", format="%.3f"),
+                    "ks": st.column_config.NumberColumn("KS", format="%.3f"),
+                }
+            )
+            st.caption(f"PSI ≥ {PSI_WATCH} is worth watching; PSI ≥ {PSI_RETRAIN} or KS ≥ {KS_RETRAIN} means the "
+                       "distribution has shifted.")
+
+    # ================= TOP RISK EMPLOYEES =================
+    # Premium: per-employee key reasons, computed once per dataset in one
+    # vectorised pass over the forest by the scoring job and kept with the
+    # scores. A dataset first scored for a standard session gets them from a
+    # background job of its own.
+    attributions = scored.attributions if premium and not streaming else None
+    if premium and not streaming and attributions is None and scored.fitted.forest is not None:
+        def add_reasons(scored=scored):
+            scored.attributions = attribute(scored.fitted, scored.df)
+            return cache.put(scored.key, scored, session)  # re-measured with the reasons
+
+        job = submit_job(f"{scored.key}:reasons", add_reasons, recorder)
+        if job.wait(SCORING_WAIT_SECONDS) and job.error is None:
+            attributions = scored.attributions
+        elif job.error:
+            scoring_jobs().forget(job.key)
+            st.error(f"Key reasons failed: {job.error}")
+        else:
+            scoring_progress(job.key, "key reasons")
+
+    st.markdown("## 🚨 Top Risk Employees")
+    top = summary.top
+    top_reasons = attribute(scored.fitted, top) if premium else None
+    if top_reasons is not None:
+        top = top.assign(key_reasons=top_reasons.reasons())
+    st.dataframe(top, width="stretch", hide_index=True)
+
+    if streaming:
+        st.caption("Streaming mode keeps scored rows on disk; download the report below to browse every employee.")
+    else:
+        employee_table(scored.key, reasons=attributions is not None)
+
+    # ================= MEMORY =================
+    with st.expander("🧮 Memory usage"):
+        cache = pipeline_cache()
+        if streaming:
+            st.write(f"Scored rows are on disk; this session holds only the model ({scored.nbytes / 2**20:.2f} MB).")
+        else:
+            usage = scored.memory_usage()
+            st.dataframe(
+                (usage / 2**20).round(3).rename("MB").to_frame().assign(dtype=scored.df.dtypes.astype(str)),
+                width="stretch"
+            )
+        st.caption(
+            f"This session: {cache.owned(st.session_state.session_uid) / 2**20:.1f} of "
+            f"{cache.session_bytes / 2**20:.0f} MB · "
+            f"shared cache: {cache.nbytes / 2**20:.1f} of {cache.max_bytes / 2**20:.0f} MB "
+            f"in {len(cache)} cached item(s), {cache.spilled} spilled to disk"
+        )
+
+    # ================= CHART =================
+    st.markdown("## 📊 Risk Distribution")
+
+    native = st.toggle(
+        "Interactive charts",
+        value=NATIVE_CHARTS,
+        key="native_charts",
+        help="Draw charts in the browser instead of rendering images on the server."
+    )
+    with stage("charts"):
+        risk_chart("bar", summary.counts, native)
+
+    # ================= VISUAL INSIGHTS =================
+    st.markdown("## 🧠 Insights")
+
+    ins1, ins2, ins3 = st.columns(3)
+    with ins1:
+        st.markdown("""
+        <div class="insight-card fade">
+            <div class="insight-title">Satisfaction Impact</div>
+            <div class="insight-desc">Low satisfaction increases risk quickly.</div>
+            <div class="insight-value">{:.1f}%</div>
+        </div>
+        """.format((10-summary.feature_mean('satisfaction_score'))*10), unsafe_allow_html=True)
+
+    with ins2:
+        st.markdown("""
+        <div class="insight-card fade">
+            <div class="insight-title">Engagement Impact</div>
+            <div class="insight-desc">Low engagement is a strong attrition driver.</div>
+            <div class="insight-value">{:.1f}%</div>
+        </div>
+        """.format((10-summary.feature_mean('engagement_score'))*10), unsafe_allow_html=True)
+
+    with ins3:
+        st.markdown("""
+        <div class="insight-card fade">
+            <div class="insight-title">Overtime Pressure</div>
+            <div class="insight-desc">High overtime increases burnout risk.</div>
+            <div class="insight-value">{:.1f}%</div>
+        </div>
+        """.format(summary.feature_mean('overtime_hours')/80*100), unsafe_allow_html=True)
+
+    if st.session_state.tier != "premium":
+        segment_drilldown(scored.key)
+
+    # Premium-only charts & insights
+    if st.session_state.tier == "premium":
+        st.markdown("## 📈 Risk Breakdown")
+        with stage("charts"):
+            risk_chart("pie", summary.counts, native)
+
+        if attributions is not None:
+            st.markdown("## 🔑 Key Reason Analysis")
+            high = np.flatnonzero((scored.df["risk_category"] == "High").to_numpy())
+            st.caption(f"Biggest single driver of risk for each of the {len(high):,} high-risk employees")
+            st.bar_chart(attributions.driver_counts(high), horizontal=True, x_label="Employees")
+
+        st.markdown("## 💰 Attrition Cost Estimation")
+
+        # Estimate attrition cost (simple calculation)
+        avg_salary = st.number_input("Average Monthly Salary (₹)", min_value=10000, value=50000)
+        avg_months_to_replace = st.number_input("Avg Months to Replace Employee", min_value=1, value=2)
+        replacement_cost_percent = st.slider("Replacement Cost % of Salary", 10, 100, 30)
+
+        avg_replacement_cost = (avg_salary * avg_months_to_replace * replacement_cost_percent) / 100
+
+        high_risk_count = summary.high_risk
+        est_total_cost = high_risk_count * avg_replacement_cost
+
+        st.markdown(f"""
+        <div class="compare fade">
+            <h3>Estimated Attrition Cost</h3>
+            <p style="color:#cbd5f5; font-size:16px; line-height:1.7;">
+                High Risk Employees: <b>{high_risk_count}</b><br>
+                Estimated Cost per Replacement: <b>₹{avg_replacement_cost:,.0f}</b><br>
+                <b>Total Estimated Attrition Cost: ₹{est_total_cost:,.0f}</b>
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        segment_drilldown(scored.key, avg_replacement_cost)
+        risk_trends(summary.segments.dims, history_dir)
+
+        if streaming:
+            st.caption("What-if policies need the scored rows in memory; switch off streaming mode to compare them.")
+        else:
+            policy_simulator(scored.key, avg_replacement_cost)
+
+        st.markdown("## 🧩 Retention Recommendations")
+
+        st.write("### 🔥 Immediate Actions (Within 24-48 hours)")
+        st.write("- **High Risk:** Offer immediate retention bonus, urgent manager meeting, or role change")
+        st.write("- **Medium Risk:** Recognition call, team appreciation, small rewards")
+        st.write("- **Low Risk:** Maintain motivation with appreciation")
+
+        st.write("### ⏳ Short Term Actions (1-4 weeks)")
+        st.write("- **High Risk:** Performance feedback, career growth plan, mentor support")
+        st.write("- **Medium Risk:** Training sessions, upskilling, clear goals")
+        st.write("- **Low Risk:** Employee engagement programs")
+
+        st.write("### 📌 Long Term Actions (1-6 months)")
+        st.write("- **High Risk:** Salary hike, promotion roadmap, role redesign")
+        st.write("- **Medium Risk:** Leadership mentoring, role clarity")
+        st.write("- **Low Risk:** Retention through career pathing & growth")
+
+        st.write("### 🔍 Extra Retention Recommendations")
+        st.write("- Improve work-life balance & reduce overtime")
+        st.write("- Increase transparency & career path clarity")
+        st.write("- Offer flexible work options")
+        st.write("- Conduct stay interviews")
+        st.write("- Improve manager-employee relationship")
+
+    flight_risk_simulator(scored.key)
+
+    with stage("export"):
+        if streaming:
+            st.caption(f"Scored report written to `{scored.report_path}`")
+        export_format = st.selectbox(
+            "Report format",
+            list(REPORT_FORMATS),
+            format_func=lambda fmt: EXPORT_LABELS.get(fmt, fmt)
+        )
+        key = scored.key
+        st.download_button(
+            "⬇️ Download Full Report",
+            lambda: export_report(key, export_format, session),
+            "staysmart_ai_report" + REPORT_FORMATS[export_format][0],
+            mime=REPORT_FORMATS[export_format][1],
+            on_click="ignore"
+        )
+
+    if recorder:
+        with st.expander("🩺 Diagnostics"):
+            st.dataframe(recorder.table(), width="stretch")
+            st.caption(
+                f"Session {st.session_state.session_uid}. Stages nest (scoring includes the pipeline stages "
+                "it ran), and each is logged as a JSON line on the staysmart.diagnostics logger."
+            )
+            for job_key, job_recorder in reversed(st.session_state.get("diagnostics_jobs", {}).items()):
+                job = scoring_jobs().get(job_key)  # None once it finished
+                if job is None or job.done:
+                    status = "failed" if job is not None and job.error else "finished"
+                else:
+                    status = f"{job.current}, {job.elapsed:.1f}s"
+                st.markdown(f"**Background job {job_key[:16]}** ({status})")
+                st.dataframe(job_recorder.table(), width="stretch")
+            st.dataframe(latency_table(), width="stretch")
+            st.caption("Per-row latency estimates behind automatic model selection, refined by every fit and bulk prediction in this process.")
+
+    # ================= ABOUT US FOOTER =================
+    st.markdown("""
+    <div class="compare fade">
+        <h3>About Us</h3>
+        <p style="color:#cbd5f5; font-size:16px; line-height:1.7;">
+            StaySmart AI is a HR intelligence tool built for modern enterprises.
+            Our AI predicts attrition risk and helps HR teams retain top talent using data-driven insights.
+            © 2026 EXQ-16. All Rights Reserved.
+        </p>
+    </div>
+
+    <div class="footer">
+    StaySmart AI – Built for modern HR teams
+    </div>
+    """, unsafe_allow_html=True)
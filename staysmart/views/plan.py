@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""StaySmart AI – step 1: plan selection landing page"""
+
+import streamlit as st
+
+from staysmart.views.styles import LOGO
+
+# Static marketing HTML, built once per process.
+HERO = """
+<div class="hero fade">
+    <h1>StaySmart AI</h1>
+    <p>Predict Attrition • Reduce Risk • Retain Talent</p>
+</div>
+"""
+
+PROVIDES = """
+<div class="req-box fade" style="max-width:1000px;margin:auto;">
+    <h4>What StaySmart AI Provides</h4>
+    <p style="color:#cbd5f5; line-height:1.7;">
+        StaySmart AI helps HR teams predict which employees may leave, why they might leave, and what actions to take to retain them.
+        It uses employee data to calculate risk scores, provide insights, and recommend retention strategies that are actionable and measurable.
+    </p>
+    <div class="actions" style="margin-top:20px;">
+        <div class="action-box">
+            <h4>1) Data Ingestion</h4>
+            <p>Upload employee CSV or connect HRMS</p>
+        </div>
+        <div class="action-box">
+            <h4>2) AI Risk Scoring</h4>
+            <p>Real-time attrition risk prediction</p>
+        </div>
+        <div class="action-box">
+            <h4>3) Retention Actions</h4>
+            <p>Get practical steps to retain talent</p>
+        </div>
+    </div>
+</div>
+"""
+
+WHY = """
+<div class="compare fade" style="margin-top:30px;">
+    <h3>Why StaySmart AI?</h3>
+    <p style="color:#cbd5f5; font-size:16px; line-height:1.7;">
+        StaySmart AI is built for modern HR teams who want data-backed decisions instead of guesswork.
+        The system highlights high-risk employees, shows the key reasons behind attrition, and suggests retention actions that can be implemented immediately.
+    </p>
+    <div style="display:flex; gap:25px; justify-content:center; flex-wrap:wrap; margin-top:20px;">
+        <div style="background:rgba(255,255,255,0.08); padding:18px; border-radius:20px; border:1px solid rgba(255,255,255,0.12); width:240px;">
+            <h4 style="color:#fff; margin:0;">📌 Risk Prediction</h4>
+            <p style="color:#cbd5f5; margin:8px 0 0 0;">Predict flight risk with high accuracy.</p>
+        </div>
+        <div style="background:rgba(255,255,255,0.08); padding:18px; border-radius:20px; border:1px solid rgba(255,255,255,0.12); width:240px;">
+            <h4 style="color:#fff; margin:0;">🧠 Deep Insights</h4>
+            <p style="color:#cbd5f5; margin:8px 0 0 0;">Understand why employees leave.</p>
+        </div>
+        <div style="background:rgba(255,255,255,0.08); padding:18px; border-radius:20px; border:1px solid rgba(255,255,255,0.12); width:240px;">
+            <h4 style="color:#fff; margin:0;">🛡️ Retention Actions</h4>
+            <p style="color:#cbd5f5; margin:8px 0 0 0;">Get immediate steps to retain talent.</p>
+        </div>
+    </div>
+</div>
+"""
+
+TRUSTED = """
+<div class="compare fade">
+    <h3>Trusted By</h3>
+    <div style="display:flex; gap:35px; justify-content:center; flex-wrap:wrap; margin-top:15px;">
+        <div style="text-align:center; padding:15px;">
+            <img src="https://img.icons8.com/fluency/48/000000/briefcase.png" />
+            <p>Enterprise</p>
+        </div>
+        <div style="text-align:center; padding:15px;">
+            <img src="https://img.icons8.com/fluency/48/000000/company.png" />
+            <p>HR Teams</p>
+        </div>
+        <div style="text-align:center; padding:15px;">
+            <img src="https://img.icons8.com/fluency/48/000000/analytics.png" />
+            <p>Data Teams</p>
+        </div>
+    </div>
+</div>
+"""
+
+STANDARD_CARD = """
+<div class="plan-card fade">
+    <span class="badge standard">STANDARD</span>
+    <div class="plan-title">HR Risk Monitoring</div>
+    <div class="plan-desc">
+        Identify employees who may leave and monitor risk levels.
+    </div>
+    <div class="price">₹100 <span style="font-size:16px">/ employee / month</span></div>
+    <ul>
+        <li>Employee flight risk score</li>
+        <li>High / Medium / Low risk tags</li>
+        <li>Top risk employees list</li>
+        <li>Clear visual dashboards</li>
+    </ul>
+</div>
+"""
+
+PREMIUM_CARD = """
+<div class="plan-card fade">
+    <span class="badge premium">PREMIUM</span>
+    <div class="plan-title">Predictive HR Intelligence</div>
+    <div class="plan-desc">
+        Deep insights into why employees leave and what to do next.
+    </div>
+    <div class="price">₹150 <span style="font-size:16px">/ employee / month</span></div>
+    <ul>
+        <li>Everything in Standard</li>
+        <li>Attrition cost estimation</li>
+        <li>Key reason analysis</li>
+        <li>Retention recommendations</li>
+        <li>Leadership-ready insights</li>
+    </ul>
+</div>
+"""
+
+COMPARISON = """
+<div class="compare fade">
+    <h3>Plan Comparison</h3>
+    <table>
+        <tr>
+            <th>Feature</th>
+            <th>Standard</th>
+            <th>Premium</th>
+        </tr>
+        <tr>
+            <td>Flight Risk Score</td>
+            <td class="check">✔</td>
+            <td class="check">✔</td>
+        </tr>
+        <tr>
+            <td>Risk Categories</td>
+            <td class="check">✔</td>
+            <td class="check">✔</td>
+        </tr>
+        <tr>
+            <td>Retention Recommendations</td>
+            <td class="cross">✘</td>
+            <td class="check">✔</td>
+        </tr>
+        <tr>
+            <td>Attrition Cost Estimation</td>
+            <td class="cross">✘</td>
+            <td class="check">✔</td>
+        </tr>
+        <tr>
+            <td>Leadership Insights</td>
+            <td class="cross">✘</td>
+            <td class="check">✔</td>
+        </tr>
+    </table>
+</div>
+"""
+
+
+def render():
+    st.markdown(LOGO, unsafe_allow_html=True)
+
+    st.markdown(HERO, unsafe_allow_html=True)
+
+    st.markdown(PROVIDES, unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    st.markdown(WHY, unsafe_allow_html=True)
+
+    st.markdown("<br><br>", unsafe_allow_html=True)
+
+    st.markdown(TRUSTED, unsafe_allow_html=True)
+
+    st.markdown("<br><br>", unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown(STANDARD_CARD, unsafe_allow_html=True)
+
+        if st.button("Select Standard Plan"):
+            st.session_state.tier = "standard"
+            st.session_state.step = "auth"
+            st.rerun()
+
+    with col2:
+        st.markdown(PREMIUM_CARD, unsafe_allow_html=True)
+
+        if st.button("Select Premium Plan"):
+            st.session_state.tier = "premium"
+            st.session_state.step = "auth"
+            st.rerun()
+
+    st.markdown("<br><br>", unsafe_allow_html=True)
+
+    st.markdown(COMPARISON, unsafe_allow_html=True)
+
+    st.stop()
@@ -0,0 +1,15 @@
+import pytest
+
+from staysmart.ingest import read_employees
+from staysmart.pipeline import train
+from staysmart.synth import synthetic_employees
+
+
+@pytest.fixture(scope="session")
+def employees():
+    return read_employees(synthetic_employees(2000, seed=1))
+
+
+@pytest.fixture(scope="session")
+def fitted(employees):
+    return train(employees, params={"n_estimators": 20, "max_depth": 6, "random_state": 0}, backend="forest")
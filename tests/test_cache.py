@@ -0,0 +1,119 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from staysmart.cache import LRUCache
+from staysmart.pipeline import run_pipeline
+from staysmart.spill import DiskSpill
+from staysmart.synth import synthetic_employees
+
+
+class Blob:
+    def __init__(self, nbytes):
+        self.nbytes = nbytes
+
+
+class MemorySpill:
+    """Spill store kept in a dict; dumps of ``held`` keys wait until ``gate`` is set."""
+
+    def __init__(self, held=()):
+        self.stored = {}
+        self.held = set(held)
+        self.gate = threading.Event()
+
+    def dump(self, key, value):
+        if key in self.held:
+            self.gate.wait()
+        self.stored[key] = value
+        return True
+
+    def load(self, key):
+        return self.stored.get(key)
+
+    def clear(self):
+        self.stored.clear()
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(100)
+    cache.put("a", Blob(40))
+    cache.put("b", Blob(40))
+    cache.get("a")
+    cache.put("c", Blob(40))
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.nbytes == 80
+
+
+def test_newest_entry_is_kept_over_budget():
+    cache = LRUCache(100)
+    cache.put("a", Blob(10))
+    cache.put("big", Blob(500))
+    assert len(cache) == 1 and "big" in cache
+
+
+def test_session_budget_evicts_own_entries_first():
+    cache = LRUCache(1000, session_bytes=100)
+    cache.put("other", Blob(80), owner="s2")
+    cache.put("a", Blob(60), owner="s1")
+    cache.put("b", Blob(60), owner="s1")
+    assert "other" in cache and "a" not in cache and "b" in cache
+    assert cache.owned("s1") == 60 and cache.owned("s2") == 80
+
+
+def test_spill_and_reload():
+    spill = MemorySpill()
+    cache = LRUCache(100, spill=spill)
+    a = Blob(60)
+    cache.put("a", a)
+    cache.put("b", Blob(60))
+    assert cache.spilled == 1 and "a" in cache and len(cache) == 1
+    assert cache.get("a") is a
+    assert cache.spilled == 1  # "b" went out to make room; "a" is in memory again
+    assert "b" in spill.stored and len(cache) == 1
+
+
+def test_put_back_while_spilling_is_not_counted_as_spilled():
+    spill = MemorySpill(held={"a"})
+    cache = LRUCache(100, spill=spill)
+    cache.put("a", Blob(60))
+    writer = threading.Thread(target=cache.put, args=("b", Blob(60)))
+    writer.start()  # evicts "a" and blocks writing it out
+    while "a" not in cache._spilling:
+        pass
+    cache.put("a", Blob(60))  # back in memory before the write finished
+    spill.gate.set()
+    writer.join()
+    assert cache.spilled == 1  # "b", evicted by the second put of "a"
+    assert "a" in cache._items and "a" not in cache._spilled
+
+
+def test_pruned_spill_is_a_miss():
+    spill = MemorySpill()
+    cache = LRUCache(100, spill=spill)
+    cache.put("a", Blob(60))
+    cache.put("b", Blob(60))
+    spill.stored.clear()
+    assert cache.get("a", "missing") == "missing"
+    assert cache.spilled == 0 and "a" not in cache
+
+
+def test_disk_spill_round_trip(tmp_path):
+    data = synthetic_employees(300, seed=4).to_csv(index=False).encode()
+    scored = run_pipeline(data, {"n_estimators": 10, "max_depth": 4, "random_state": 0}, "k" * 32, "emp.csv",
+                          imputer="median", backend="forest")
+    spill = DiskSpill(str(tmp_path / "spill"), max_bytes=2**30)
+    cache = LRUCache(1, spill=spill, sizeof=lambda value: value.nbytes)
+    cache.put(scored.key, scored)
+    cache.put("other", Blob(1))
+    assert cache.spilled == 1
+    assert not [name for name in (tmp_path / "spill").iterdir() if ".tmp-" in name.name]
+
+    reloaded = cache.get(scored.key)
+    # In memory again; "other" went out to make room, and DiskSpill only keeps scored datasets.
+    assert reloaded is not scored and cache.spilled == 0 and scored.key in cache._items
+    pd.testing.assert_frame_equal(reloaded.df, scored.df)
+    X = scored.df[["satisfaction_score", "engagement_score", "last_hike_months", "overtime_hours",
+                   "distance_from_home"]].to_numpy(dtype=np.float64)
+    np.testing.assert_array_equal(reloaded.fitted.forest.predict(X), scored.fitted.forest.predict(X))
+    assert reloaded.summary.high_risk == scored.summary.high_risk
@@ -0,0 +1,90 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from staysmart.delta import apply_delta, latest_snapshot, load_snapshot, save_snapshot
+from staysmart.ingest import read_employees
+from staysmart.pipeline import run_pipeline
+from staysmart.schema import FEATURES, REMOVED_COL
+from staysmart.storage import find_account, new_account
+from staysmart.synth import synthetic_employees
+
+PARAMS = {"n_estimators": 10, "max_depth": 5, "random_state": 0}
+
+
+def _csv(df):
+    return df.to_csv(index=False).encode()
+
+
+@pytest.fixture(scope="module")
+def base():
+    return run_pipeline(_csv(synthetic_employees(1000, seed=3)), PARAMS, "b" * 32, "base.csv",
+                        imputer="median", backend="forest")
+
+
+def _risk(fitted, df):
+    return (fitted.forest.predict(df[FEATURES].to_numpy(dtype=np.float64)) * 100).round(0).astype(np.uint8)
+
+
+def _delta():
+    updated = synthetic_employees(10, seed=3, offset=990).assign(**{"Satisfaction Score": 1.0})
+    added = synthetic_employees(5, seed=9, offset=1000)
+    gone = synthetic_employees(4, seed=3).assign(Exited=["yes", "TRUE", " 1 ", "no"])
+    return pd.concat([updated, added, gone], ignore_index=True)
+
+
+def test_delta_adds_updates_and_removes_by_id(base):
+    merged = apply_delta(base, _csv(_delta()), "delta.csv", PARAMS, imputer="median", backend="forest",
+                         retrain_fraction=0.5)
+    # E3 carries a falsy flag, so it is an update, not a removal.
+    assert {k: merged.changes[k] for k in ("added", "updated", "removed")} == {"added": 5, "updated": 11, "removed": 3}
+    assert not merged.changes["retrained"] and merged.fitted is base.fitted
+    assert REMOVED_COL not in merged.df.columns
+
+    ids = set(merged.df["employee_id"])
+    assert len(merged.df) == merged.summary.rows == 1002
+    assert not ids & {"E0", "E1", "E2"} and {"E3", "E1000", "E1004"} <= ids
+
+    rows = merged.df.set_index("employee_id")
+    assert (rows.loc[[f"E{i}" for i in range(990, 1000)], "satisfaction_score"] == 1.0).all()
+    np.testing.assert_array_equal(rows["flight_risk"], _risk(base.fitted, rows))
+    untouched = base.df.set_index("employee_id").loc[[f"E{i}" for i in range(4, 990)], "flight_risk"]
+    pd.testing.assert_series_equal(rows.loc[untouched.index, "flight_risk"], untouched)
+
+
+def test_large_delta_retrains(base):
+    merged = apply_delta(base, _csv(_delta()), "delta.csv", PARAMS, imputer="median", backend="forest",
+                         retrain_fraction=0.01)
+    assert merged.changes["retrained"] and merged.fitted is not base.fitted
+    np.testing.assert_array_equal(merged.df["flight_risk"], _risk(merged.fitted, merged.df))
+
+
+def test_removed_flag_is_only_read_from_deltas():
+    full = synthetic_employees(20, seed=4).assign(Exited="yes", Deleted="1")
+    df = read_employees(_csv(full), "full.csv")
+    assert REMOVED_COL not in df.columns and len(df) == 20
+    scored = run_pipeline(_csv(full), PARAMS, "f" * 32, "full.csv", imputer="median", backend="forest")
+    assert scored.summary.rows == 20
+
+
+@pytest.mark.parametrize("alias", ["Removed", "deleted", "EXITED", "Terminated"])
+def test_every_removed_alias_marks_delta_rows(base, alias):
+    delta = synthetic_employees(2, seed=3).assign(**{alias: ["y", "x"]})
+    merged = apply_delta(base, _csv(delta), "delta.csv", PARAMS, imputer="median", backend="forest")
+    assert merged.changes["removed"] == 2 and len(merged.df) == 998
+
+
+def test_snapshots_are_scoped_to_a_workspace(tmp_path, base):
+    accounts, snapshots = str(tmp_path / "accounts"), tmp_path / "snapshots"
+    key, account = new_account(accounts)
+    _, other = new_account(accounts)
+
+    save_snapshot(base, str(snapshots / account))
+    assert latest_snapshot(str(snapshots / other)) is None
+
+    path = latest_snapshot(str(snapshots / find_account(key, accounts)))
+    reloaded = load_snapshot(path)
+    assert reloaded.key == base.key and os.path.dirname(path) == str(snapshots / account)
+    pd.testing.assert_frame_equal(reloaded.df, base.df, check_categorical=False)
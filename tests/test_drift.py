@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from staysmart.drift import KS_RETRAIN, PSI_RETRAIN, PSI_WATCH, PROFILE_COLUMNS, Profile, drift_report, needs_retraining
+from staysmart.ingest import read_employees
+from staysmart.schema import FEATURES
+from staysmart.synth import synthetic_employees
+
+
+def _profile(df):
+    return Profile().update(df)
+
+
+@pytest.fixture(scope="module")
+def workforce():
+    return read_employees(synthetic_employees(20000, seed=1))
+
+
+def _ks(a, b):
+    # Largest gap between the two empirical CDFs, straight from the samples.
+    a, b = np.sort(a), np.sort(b)
+    edges = np.union1d(a, b)
+    return np.max(np.abs(np.searchsorted(a, edges, "right") / len(a) - np.searchsorted(b, edges, "right") / len(b)))
+
+
+def test_identical_distributions_do_not_drift(workforce):
+    report = drift_report(_profile(workforce), _profile(workforce))
+    assert list(report["column"]) == FEATURES
+    assert (report["psi"] == 0).all() and (report["ks"] == 0).all()
+    assert (report["status"] == "stable").all() and not needs_retraining(report)
+
+
+def test_fresh_sample_of_the_same_population_is_stable(workforce):
+    other = read_employees(synthetic_employees(20000, seed=2))
+    report = drift_report(_profile(workforce), _profile(other))
+    assert (report["psi"] < PSI_WATCH).all() and (report["ks"] < KS_RETRAIN).all()
+    assert not needs_retraining(report)
+
+
+def test_shifted_feature_needs_retraining(workforce):
+    shifted = workforce.copy()
+    shifted["overtime_hours"] = np.clip(shifted["overtime_hours"].astype(np.float64) + 15, 0, 80)
+    report = drift_report(_profile(workforce), _profile(shifted)).set_index("column")
+
+    row = report.loc["overtime_hours"]
+    assert row["psi"] >= PSI_RETRAIN and row["ks"] >= KS_RETRAIN and row["status"] == "shifted"
+    assert row["current_median"] - row["training_median"] == 15
+    assert (report.drop(index="overtime_hours")["psi"] == 0).all()
+    assert needs_retraining(report.reset_index())
+    assert row["ks"] == pytest.approx(_ks(workforce["overtime_hours"], shifted["overtime_hours"]), abs=1e-12)
+
+
+def test_ks_matches_the_samples(workforce):
+    other = read_employees(synthetic_employees(5000, seed=3, missing_rate=0.1))
+    report = drift_report(_profile(workforce), _profile(other)).set_index("column")
+    for col in FEATURES:
+        current = other[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        assert report.loc[col, "ks"] == pytest.approx(_ks(workforce[col], current[~np.isnan(current)]), abs=1e-12)
+
+
+def test_profiles_merge_across_chunks_and_round_trip(workforce):
+    chunked = Profile()
+    for start in range(0, len(workforce), 3000):
+        chunked.update(workforce.iloc[start:start + 3000])
+    whole = _profile(workforce)
+    for col in PROFILE_COLUMNS:
+        np.testing.assert_array_equal(chunked.counts[col], whole.counts[col])
+        np.testing.assert_array_equal(Profile.from_dict(whole.to_dict()).counts[col], whole.counts[col])
@@ -0,0 +1,24 @@
+import numpy as np
+
+from staysmart.forest import BLOCK_ROWS
+from staysmart.ingest import read_employees
+from staysmart.schema import FEATURES
+from staysmart.synth import synthetic_employees
+
+
+def test_compiled_forest_matches_predict_proba(employees, fitted):
+    X = employees[FEATURES].to_numpy(dtype=np.float64)
+    expected = fitted.model.predict_proba(fitted.scaler.transform(X))[:, 1]
+    np.testing.assert_allclose(fitted.forest.predict(X), expected, rtol=0, atol=1e-9)
+
+
+def test_compiled_forest_spans_blocks(fitted):
+    X = read_employees(synthetic_employees(BLOCK_ROWS + 17, seed=2))[FEATURES].to_numpy(dtype=np.float64)
+    expected = fitted.model.predict_proba(fitted.scaler.transform(X))[:, 1]
+    np.testing.assert_allclose(fitted.forest.predict(X), expected, rtol=0, atol=1e-9)
+
+
+def test_predict_one_matches_batch(employees, fitted):
+    X = employees[FEATURES].to_numpy(dtype=np.float64)[:5]
+    batch = fitted.forest.predict(X)
+    assert [fitted.predict_one(row) for row in X] == list(batch)
@@ -0,0 +1,41 @@
+import pandas as pd
+
+from staysmart.history import append_run, latest_runs, risk_rose, trend
+from staysmart.schema import ID_COL
+
+
+def _run(ids, risk, department="Sales"):
+    return pd.DataFrame({
+        ID_COL: ids, "department": department, "flight_risk": risk,
+        "risk_category": ["High" if r >= 70 else "Low" for r in risk],
+    })
+
+
+def test_series_of_a_month_add_up(tmp_path):
+    append_run(tmp_path, [_run(["A1", "A2"], [80, 10])], "a" * 16, "2026-09", series="bu1")
+    append_run(tmp_path, [_run(["B1"], [90], "Ops")], "b" * 16, "2026-09", series="bu2")
+    table = trend(tmp_path)
+    assert table.to_dict("records") == [{"month": "2026-09", "employees": 3, "High": 2, "avg_risk": 60.0}]
+
+
+def test_latest_run_of_each_series_stands_for_the_month(tmp_path):
+    append_run(tmp_path, [_run(["A1", "A2"], [80, 10])], "a" * 16, "2026-09", series="bu1")
+    append_run(tmp_path, [_run(["B1"], [90])], "b" * 16, "2026-09", series="bu2")
+    later = append_run(tmp_path, [_run(["A1"], [20])], "c" * 16, "2026-09", series="bu1")
+    runs = latest_runs(tmp_path)["2026-09"]
+    assert len(runs) == 2 and later in runs
+    assert trend(tmp_path)["employees"].tolist() == [2]
+
+
+def test_same_run_is_written_once(tmp_path):
+    first = append_run(tmp_path, [_run(["A1"], [80])], "a" * 16, "2026-09")
+    assert append_run(tmp_path, [_run(["A1"], [80])], "a" * 16, "2026-09") == first
+
+
+def test_risk_rose_across_series(tmp_path):
+    append_run(tmp_path, [_run(["A1", "A2"], [10, 10])], "a" * 16, "2026-09", series="bu1")
+    append_run(tmp_path, [_run(["B1"], [10])], "b" * 16, "2026-09", series="bu2")
+    append_run(tmp_path, [_run(["A1", "A2"], [50, 12])], "c" * 16, "2026-10", series="bu1")
+    append_run(tmp_path, [_run(["B1"], [40])], "d" * 16, "2026-10", series="bu2")
+    rose = risk_rose(tmp_path)
+    assert rose[ID_COL].tolist() == ["A1", "B1"] and rose["compared_with"].unique().tolist() == ["2026-09"]
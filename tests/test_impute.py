@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from staysmart.impute import DRAW_BLOCK, IMPUTERS, impute
+from staysmart.ingest import read_employees
+from staysmart.schema import FEATURES, REQUIRED_COLS
+from staysmart.synth import synthetic_employees
+
+ROWS = 3 * DRAW_BLOCK + 123
+
+
+@pytest.fixture(scope="module")
+def gappy():
+    return read_employees(synthetic_employees(ROWS, seed=5, missing_rate=0.2))
+
+
+def _chunked(df, strategy, chunk_rows):
+    parts = []
+    for start in range(0, len(df), chunk_rows):
+        part = df.iloc[start:start + chunk_rows].copy()
+        parts.append(impute(part, strategy, offset=start))
+    return pd.concat(parts)
+
+
+@pytest.mark.parametrize("chunk_rows", [1000, DRAW_BLOCK, 5000])
+def test_random_imputes_the_same_whole_or_chunked(gappy, chunk_rows):
+    whole = impute(gappy.copy(), "random")
+    pd.testing.assert_frame_equal(_chunked(gappy, "random", chunk_rows), whole)
+
+
+def test_random_absent_column_imputes_the_same_whole_or_chunked(gappy):
+    df = gappy.drop(columns="overtime_hours")
+    whole = impute(df.copy(), "random")
+    pd.testing.assert_frame_equal(_chunked(df, "random", 1000), whole)
+
+
+@pytest.mark.parametrize("strategy", list(IMPUTERS))
+def test_every_strategy_is_stable_and_in_range(gappy, strategy):
+    first = impute(gappy.copy(), strategy)
+    pd.testing.assert_frame_equal(impute(gappy.copy(), strategy), first)
+    pd.testing.assert_frame_equal(_chunked(gappy, strategy, 1000), _chunked(gappy, strategy, 1000))
+    for col in FEATURES:
+        lo, hi = REQUIRED_COLS[col]
+        values = first[col].to_numpy()
+        assert not np.isnan(values).any() and values.min() >= lo and values.max() <= hi
+
+
+@pytest.mark.parametrize("strategy", list(IMPUTERS))
+def test_observed_cells_are_left_alone(gappy, strategy):
+    filled = impute(gappy.copy(), strategy)
+    observed = gappy[FEATURES].notna().to_numpy()
+    np.testing.assert_array_equal(filled[FEATURES].to_numpy()[observed], gappy[FEATURES].to_numpy()[observed])
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from staysmart.impute import IMPUTERS
+from staysmart.pipeline import run_pipeline, score_stream
+from staysmart.schema import FEATURES
+from staysmart.synth import synthetic_employees
+
+PARAMS = {"n_estimators": 10, "max_depth": 5, "random_state": 0}
+
+
+@pytest.mark.parametrize("imputer", list(IMPUTERS))
+def test_score_stream_matches_run_pipeline(tmp_path, imputer):
+    source = tmp_path / "employees.csv"
+    synthetic_employees(3000, seed=7, missing_rate=0.1).to_csv(source, index=False)
+    whole = run_pipeline(str(source), PARAMS, "k" * 32, source.name, imputer=imputer, backend="forest")
+    # Only random imputation is independent of chunking; the others fill from per-chunk statistics.
+    chunk_rows = 700 if imputer == "random" else 3000
+    streamed = score_stream(str(source), str(tmp_path / "report.csv"), PARAMS, "k" * 32, source.name,
+                            chunk_rows=chunk_rows, imputer=imputer, backend="forest")
+
+    report = pd.read_csv(streamed.report_path)
+    np.testing.assert_allclose(report["flight_risk"], whole.df["flight_risk"], rtol=0, atol=1e-6)
+    assert list(report["risk_category"]) == list(whole.df["risk_category"].astype(str))
+    for col in FEATURES:
+        np.testing.assert_allclose(report[col], whole.df[col], rtol=1e-6)  # compacted to float32
+
+    assert streamed.summary.rows == whole.summary.rows == 3000
+    assert streamed.summary.counts == whole.summary.counts
+    assert streamed.summary.high_risk == whole.summary.high_risk
+    assert streamed.summary.avg_risk == pytest.approx(whole.summary.avg_risk, abs=1e-9)
+    for col in FEATURES:
+        assert streamed.summary.feature_mean(col) == pytest.approx(whole.summary.feature_mean(col))
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from staysmart.pipeline import score_frame
+from staysmart.policies import (BASELINE, DEFAULT_SCENARIOS, Change, scenarios_from_table, scenarios_table,
+                                simulate, with_costs)
+from staysmart.schema import FEATURES, REQUIRED_COLS
+
+SCENARIOS = {
+    **DEFAULT_SCENARIOS,
+    "Hike the unhappy": [Change("last_hike_months", "set to", 0, where="satisfaction_score", below=4)],
+    "Everything at once": [Change("overtime_hours", "change %", -50, above=10),
+                           Change("satisfaction_score", "add", 3, below=6)],
+    "No-op": [Change("distance_from_home", "add", 0)],
+}
+
+
+def _brute_force(fitted, X, scenarios):
+    # Every row of every scenario rescored from scratch, then categorised like score_frame.
+    rows = []
+    for name, changes in {BASELINE: [], **scenarios}.items():
+        variant = X.copy()
+        for change in changes:
+            change.apply(variant)
+        scored = score_frame(pd.DataFrame(variant, columns=FEATURES), fitted)
+        rows.append({"scenario": name, "high_risk": int((scored["risk_category"] == "High").sum()),
+                     "avg_risk": scored["flight_risk"].astype(np.float64).mean()})
+    return pd.DataFrame(rows)
+
+
+@pytest.mark.parametrize("stack_rows", [10**7, 997])
+@pytest.mark.parametrize("known", [False, True])
+def test_simulate_matches_brute_force_rescore(employees, fitted, stack_rows, known):
+    X = employees[FEATURES].to_numpy(dtype=np.float64)
+    risk = score_frame(employees[FEATURES].copy(), fitted)["flight_risk"] if known else None
+    result = simulate(fitted, X, SCENARIOS, risk=risk, stack_rows=stack_rows)
+    expected = _brute_force(fitted, X, SCENARIOS)
+
+    assert list(result["scenario"]) == list(expected["scenario"])
+    np.testing.assert_array_equal(result["high_risk"], expected["high_risk"])
+    np.testing.assert_allclose(result["avg_risk"], expected["avg_risk"], rtol=1e-12)
+    np.testing.assert_array_equal(result["high_risk_change"], expected["high_risk"] - expected["high_risk"][0])
+    assert result.set_index("scenario").loc["No-op", "high_risk_change"] == 0
+
+
+def test_changes_are_conditional_and_clipped():
+    X = np.array([[5, 5, 30, 70, 10], [2, 5, 10, 20, 10]], dtype=np.float64)
+    Change("overtime_hours", "change %", 50, above=50).apply(X)
+    Change("last_hike_months", "set to", 0, where="satisfaction_score", below=3).apply(X)
+    assert X[:, FEATURES.index("overtime_hours")].tolist() == [REQUIRED_COLS["overtime_hours"][1], 20]
+    assert X[:, FEATURES.index("last_hike_months")].tolist() == [30, 0]
+    with pytest.raises(ValueError):
+        Change("salary", "add", 1)
+
+
+def test_scenarios_round_trip_through_the_editor_table():
+    assert scenarios_from_table(scenarios_table(SCENARIOS)) == SCENARIOS
+
+
+def test_with_costs(employees, fitted):
+    X = employees[FEATURES].to_numpy(dtype=np.float64)
+    result = with_costs(simulate(fitted, X, DEFAULT_SCENARIOS), 1000)
+    assert (result["attrition_cost"] == result["high_risk"] * 1000).all()
+    assert result["cost_change"].iloc[0] == 0
@@ -0,0 +1,164 @@
+import json
+import socket
+import threading
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pytest
+
+from staysmart.schema import FEATURES
+from staysmart.server import MicroBatcher, make_server, parse_employees
+
+EMPLOYEE = {
+    "Employee ID": "E1", "Satisfaction Score": 3, "Engagement Score": 4,
+    "Last Hike Months": 20, "Overtime Hours": 30, "Distance From Home": 12,
+}
+
+
+class CountingModel:
+    """Stands in for a fitted pipeline; records batch sizes and fails on negative rows."""
+
+    forest = None
+
+    def __init__(self):
+        self.batches = []
+
+    def predict(self, X):
+        self.batches.append(len(X))
+        if (X < 0).any():
+            raise ValueError("bad row")
+        return X[:, 0] / 10
+
+
+def test_parse_employees_single_and_list():
+    ids, X, single = parse_employees(EMPLOYEE)
+    assert single and ids == ["E1"] and X.shape == (1, len(FEATURES))
+    ids, X, single = parse_employees({"employees": [EMPLOYEE, EMPLOYEE]})
+    assert not single and len(ids) == 2
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf"), "1e400", 0, 11])
+def test_parse_employees_rejects_out_of_range(value):
+    with pytest.raises(ValueError, match="satisfaction_score"):
+        parse_employees({**EMPLOYEE, "Satisfaction Score": value})
+
+
+def test_concurrent_requests_share_a_batch():
+    model = CountingModel()
+    batcher = MicroBatcher(model, max_rows=100, max_wait=0.2)
+    results = [None] * 8
+
+    def call(i):
+        results[i] = batcher.score(np.full((1, len(FEATURES)), float(i)))
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    batcher.close()
+    assert sum(model.batches) == 8 and len(model.batches) < 8
+    assert [int(risk[0]) for risk, _ in results] == [i * 10 for i in range(8)]
+
+
+def test_bad_request_fails_alone():
+    model = CountingModel()
+    batcher = MicroBatcher(model, max_rows=100, max_wait=0.2)
+    outcomes = {}
+
+    def call(name, value):
+        try:
+            outcomes[name] = batcher.score(np.full((1, len(FEATURES)), value))[0][0]
+        except ValueError as exc:
+            outcomes[name] = exc
+
+    threads = [threading.Thread(target=call, args=(name, value)) for name, value in [("a", 1.0), ("bad", -1.0), ("b", 2.0)]]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    batcher.close()
+    assert outcomes["a"] == 10 and outcomes["b"] == 20
+    assert isinstance(outcomes["bad"], ValueError)
+
+
+def test_large_request_scored_on_its_own():
+    model = CountingModel()
+    batcher = MicroBatcher(model, max_rows=10, max_wait=0.05)
+    risk, _ = batcher.score(np.ones((25, len(FEATURES))))
+    batcher.close()
+    assert len(risk) == 25 and model.batches == [25]
+
+
+@pytest.fixture
+def server(fitted):
+    server = make_server(fitted, port=0, max_wait=0.001)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.batcher.close()
+    server.server_close()
+
+
+def _post(url, body):
+    request = urllib.request.Request(f"{url}/score", data=body.encode(), method="POST")
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.loads(exc.read())
+
+
+def test_http_scores_with_compiled_forest(server, fitted):
+    status, body = _post(server, json.dumps(EMPLOYEE))
+    assert status == 200 and body["employee_id"] == "E1"
+    _, X, _ = parse_employees(EMPLOYEE)
+    assert body["flight_risk"] == round(fitted.forest.predict(X)[0] * 100)
+
+
+def test_http_rejects_non_finite_values(server):
+    # Python's json module reads NaN and Infinity literals.
+    status, body = _post(server, json.dumps({**EMPLOYEE, "Overtime Hours": float("nan")}))
+    assert status == 400 and "overtime_hours" in body["error"]
+    status, _ = _post(server, json.dumps(EMPLOYEE))
+    assert status == 200
+
+
+def test_http_scoring_failure_is_a_500(server, fitted, monkeypatch):
+    def fail(X):
+        raise RuntimeError("model unavailable")
+
+    monkeypatch.setattr(fitted.forest, "predict", fail)
+    status, body = _post(server, json.dumps(EMPLOYEE))
+    assert status == 500 and "model unavailable" in body["error"]
+
+
+def _raw(url, request, timeout=5):
+    """Send raw bytes; returns everything the server sent before closing the connection."""
+    host, port = url.rsplit("/", 1)[-1].split(":")
+    with socket.create_connection((host, int(port)), timeout=timeout) as sock:
+        sock.sendall(request)
+        received = b""
+        while chunk := sock.recv(65536):
+            received += chunk
+    return received
+
+
+@pytest.mark.parametrize("length", [b"abc", b"-1"])
+def test_http_rejects_bad_content_length(server, length):
+    reply = _raw(server, b"POST /score HTTP/1.1\r\nHost: x\r\nContent-Length: " + length + b"\r\n\r\n{}")
+    assert reply.startswith(b"HTTP/1.1 400") and b"Content-Length must be" in reply
+
+
+def test_http_oversized_body_closes_connection(server):
+    body = json.dumps(EMPLOYEE).encode()
+    request = b"POST /score HTTP/1.1\r\nHost: x\r\nContent-Length: %d\r\n\r\n" % (2**40) + body
+    reply = _raw(server, request)
+    assert reply.startswith(b"HTTP/1.1 413") and reply.count(b"HTTP/1.1") == 1  # no reply to leftover bytes
+
+
+def test_http_rejects_deeply_nested_json(server):
+    status, body = _post(server, "[" * 100_000 + "]" * 100_000)
+    assert status == 400 and "nested" in body["error"]
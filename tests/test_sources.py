@@ -0,0 +1,169 @@
+import sqlite3
+import threading
+
+import pytest
+
+from staysmart.sources import ConnectionPool, DatabaseFeed, SQLSource, sqlite_pool
+from staysmart.synth import synthetic_employees
+
+OPTIONS = {"imputer": "median", "backend": "forest"}
+PARAMS = {"n_estimators": 10, "max_depth": 4, "random_state": 0}
+
+
+def _table(path, rows=300, updated=True, ids=True):
+    df = synthetic_employees(rows, seed=3)
+    if updated:
+        df["updated_at"] = "2026-01-01"
+    if not ids:
+        df = df.drop(columns="Employee ID")
+    with sqlite3.connect(path) as con:
+        df.astype({"Department": str, "Location": str}).to_sql("employees", con, index=False)
+    con.close()
+    return path
+
+
+def _execute(path, sql, *params):
+    con = sqlite3.connect(path)
+    con.execute(sql, params)
+    con.commit()
+    con.close()
+
+
+def test_pool_reuses_and_bounds_connections():
+    opened = []
+
+    class Conn:
+        def __init__(self):
+            opened.append(self)
+
+        def rollback(self):
+            pass
+
+        def close(self):
+            pass
+
+    pool = ConnectionPool(Conn, size=2)
+    with pool.connection() as a:
+        pass
+    with pool.connection() as b:
+        assert b is a
+    held = threading.Event()
+    release = threading.Event()
+
+    def borrow():
+        with pool.connection():
+            held.set()
+            release.wait()
+
+    threads = [threading.Thread(target=borrow) for _ in range(2)]
+    for t in threads:
+        t.start()
+    held.wait()
+    def wait():
+        with pool.connection():
+            pass
+
+    waiter = threading.Thread(target=wait)
+    waiter.start()
+    waiter.join(0.1)
+    assert waiter.is_alive()  # both slots are taken
+    release.set()
+    for t in threads:
+        t.join()
+    waiter.join(1)
+    assert not waiter.is_alive() and len(opened) == 2
+
+
+def test_pool_drops_connections_that_raised():
+    class Conn:
+        closed = False
+
+        def rollback(self):
+            pass
+
+        def close(self):
+            self.closed = True
+
+    pool = ConnectionPool(Conn, size=1)
+    with pytest.raises(RuntimeError):
+        with pool.connection() as broken:
+            raise RuntimeError
+    assert broken.closed
+    with pool.connection() as conn:
+        assert conn is not broken
+
+
+def test_incremental_pull_sees_same_timestamp_rows_once(tmp_path):
+    path = _table(tmp_path / "hr.db")
+    source = SQLSource(sqlite_pool(path), "employees", chunk_rows=64)
+    df, watermark = source.pull()
+    assert len(df) == 300 and watermark.value == "2026-01-01"
+
+    assert source.pull(watermark) == (None, watermark)
+
+    # Committed after the pull, but stamped with the watermark itself.
+    _execute(path, "UPDATE employees SET \"Satisfaction Score\" = 1 WHERE \"Employee ID\" = 'E5'")
+    _execute(path, "INSERT INTO employees SELECT * FROM employees WHERE \"Employee ID\" = 'E7'")
+    _execute(path, "UPDATE employees SET \"Employee ID\" = 'E9999' WHERE rowid = (SELECT MAX(rowid) FROM employees)")
+    df, watermark = source.pull(watermark)
+    assert sorted(df["employee_id"]) == ["E9999"]
+
+    _execute(path, "UPDATE employees SET \"Satisfaction Score\" = 1, updated_at = '2026-02-01' WHERE \"Employee ID\" IN ('E5', 'E6')")
+    df, watermark = source.pull(watermark)
+    assert sorted(df["employee_id"]) == ["E5", "E6"] and (df["satisfaction_score"] == 1).all()
+    assert watermark.value == "2026-02-01" and watermark.ids == {"E5", "E6"}
+
+
+def test_pull_keeps_one_row_per_id(tmp_path):
+    path = _table(tmp_path / "hr.db", rows=50)
+    _execute(path, "INSERT INTO employees SELECT * FROM employees WHERE \"Employee ID\" = 'E3'")
+    _execute(path, "UPDATE employees SET \"Satisfaction Score\" = 1, updated_at = '2026-03-01' WHERE rowid = (SELECT MAX(rowid) FROM employees)")
+    df, _ = SQLSource(sqlite_pool(path), "employees").pull()
+    assert len(df) == 50
+    assert df.loc[df["employee_id"] == "E3", "satisfaction_score"].item() == 1
+
+
+def test_table_without_updated_at_is_pulled_whole(tmp_path):
+    path = _table(tmp_path / "hr.db", updated=False)
+    source = SQLSource(sqlite_pool(path), "employees")
+    df, watermark = source.pull()
+    assert len(df) == 300 and watermark is None
+
+
+def test_feed_merges_changed_rows(tmp_path):
+    path = _table(tmp_path / "hr.db")
+    feed = DatabaseFeed(SQLSource(sqlite_pool(path), "employees"))
+    first = feed.refresh(OPTIONS, PARAMS, "median", "forest")
+    assert len(first.df) == 300 and first.changes is None
+    assert feed.refresh(OPTIONS, PARAMS, "median", "forest") is first
+
+    _execute(path, "UPDATE employees SET \"Satisfaction Score\" = 1, updated_at = '2026-02-01' WHERE \"Employee ID\" = 'E4'")
+    second = feed.refresh(OPTIONS, PARAMS, "median", "forest")
+    assert second.changes["updated"] == 1 and len(second.df) == 300
+    assert second.df.loc[second.df["employee_id"] == "E4", "satisfaction_score"].item() == 1
+
+
+def test_feed_without_ids_refreshes_with_full_pulls(tmp_path):
+    path = _table(tmp_path / "hr.db", ids=False)
+    feed = DatabaseFeed(SQLSource(sqlite_pool(path), "employees"))
+    feed.refresh(OPTIONS, PARAMS, "median", "forest")
+    _execute(path, "UPDATE employees SET \"Satisfaction Score\" = 1, updated_at = '2026-02-01' WHERE rowid <= 10")
+    scored = feed.refresh(OPTIONS, PARAMS, "median", "forest")
+    assert len(scored.df) == 300 and scored.changes is None
+    assert (scored.df["satisfaction_score"] == 1).sum() >= 10
+
+
+def test_feed_keeps_one_state_per_option_set(tmp_path):
+    path = _table(tmp_path / "hr.db")
+    feed = DatabaseFeed(SQLSource(sqlite_pool(path), "employees"))
+    other = {**OPTIONS, "imputer": "random"}
+    median = feed.refresh(OPTIONS, PARAMS, "median", "forest")
+    random = feed.refresh(other, PARAMS, "random", "forest")
+    assert median.key != random.key
+    assert feed.current(OPTIONS) is median and feed.current(other) is random
+
+    _execute(path, "UPDATE employees SET \"Satisfaction Score\" = 1, updated_at = '2026-02-01' WHERE \"Employee ID\" = 'E4'")
+    assert feed.refresh(OPTIONS, PARAMS, "median", "forest").changes["updated"] == 1
+    # The other option set pulls the same change from its own watermark.
+    assert feed.refresh(other, PARAMS, "random", "forest").changes["updated"] == 1
+    assert feed.refresh(OPTIONS, PARAMS, "median", "forest") is feed.current(OPTIONS)
@@ -0,0 +1,36 @@
+import os
+
+import pytest
+
+from staysmart.storage import find_account, new_account, private_dir
+
+
+def test_creates_private_directory(tmp_path):
+    path = private_dir(str(tmp_path / "a" / "spill"))
+    assert os.stat(path).st_mode & 0o777 == 0o700
+
+
+def test_rejects_directory_open_to_others(tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+    with pytest.raises(PermissionError):
+        private_dir(str(shared))
+
+
+def test_rejects_symlink(tmp_path):
+    target = tmp_path / "target"
+    target.mkdir(mode=0o700)
+    (tmp_path / "link").symlink_to(target)
+    with pytest.raises(PermissionError):
+        private_dir(str(tmp_path / "link"))
+
+
+def test_workspace_keys_identify_one_account(tmp_path):
+    accounts = str(tmp_path / "accounts")
+    key, account = new_account(accounts)
+    _, other = new_account(accounts)
+    assert account != other
+    assert find_account(key, accounts) == account and find_account(f" {key} ", accounts) == account
+    assert find_account("guessed", accounts) is None
+    assert key not in os.listdir(accounts)